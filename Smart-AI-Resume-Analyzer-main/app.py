@@ -1,38 +1,38 @@
 ﻿"""
 Smart Resume AI - Main Application
 """
-import time
-from PIL import Image
-from jobs.job_search import render_job_search
 from datetime import datetime
+import streamlit as st
 from ui_components import (
-    apply_modern_styles, hero_section, feature_card, about_section,
-    page_header, render_analytics_section, render_activity_section,
-    render_suggestions_section
+    apply_modern_styles, hero_section, page_header, inject_global_styles,
+    score_circle, suggestion_card
 )
-from feedback.feedback import FeedbackManager
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Inches, Pt
-from docx import Document
-import io
-import base64
-import plotly.graph_objects as go
-from streamlit_lottie import st_lottie
-import requests
-from dashboard.dashboard import DashboardManager
-from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
 from config.job_roles import JOB_ROLES
 from config.database import (
-    get_database_connection, save_resume_data, save_analysis_data,
+    get_database_connection, insert_resume_with_analysis,
     init_database, 
 )
-from utils.resume_analyzer import ResumeAnalyzer
-import traceback
-import plotly.express as px
-import pandas as pd
-import json
-import streamlit as st
-import datetime
+from config.write_behind import get_write_behind_writer
+from config.export import spooled_export
+from config.resources import get_resource
+from config.assets import get_assets
+from utils.analysis_cache import get_analysis_cache
+
+# Streamlit re-executes this script on every interaction. Subsystems that only
+# some pages render (the resume analyzer with numpy and the PDF/DOCX extractors,
+# the dashboard with pandas and plotly) are imported where they are first used
+# instead of here; startup_benchmark.py keeps it that way.
+
+def create_resume_analyzer():
+    from utils.resume_analyzer import ResumeAnalyzer
+    from utils.extraction_pool import get_extraction_pool
+    return ResumeAnalyzer(extraction_pool=get_extraction_pool())
+
+
+def create_dashboard_manager():
+    from dashboard.dashboard import DashboardManager
+    return DashboardManager()
+
 
 # Set page config at the very beginning
 st.set_page_config(
@@ -55,10 +55,9 @@ class ResumeApp:
             
         }
 
-        # Initialize dashboard manager
-        self.dashboard_manager = DashboardManager()
-
-        self.analyzer = ResumeAnalyzer()
+        self.analysis_cache = get_analysis_cache()
+        # Resume/analysis inserts are committed in the background, off the render path
+        self.db_writer = get_write_behind_writer()
         self.job_roles = JOB_ROLES
 
         # Initialize session state
@@ -67,381 +66,57 @@ class ResumeApp:
         if 'selected_role' not in st.session_state:
             st.session_state.selected_role = None
 
-        # Initialize database
+        # Initialize database (migrations run once per process)
         init_database()
 
-        # Load external CSS
-        with open('style/style.css') as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
-
-        # Load Google Fonts
-        st.markdown("""
-            <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700&family=Poppins:wght@400;500;600&display=swap" rel="stylesheet">
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
-        """, unsafe_allow_html=True)
+        # Stylesheets, animation and logo come from the local asset bundle, read once per process
+        self.assets = get_assets()
+        # One identical stylesheet block per rerun (fonts and icons included), cached by the browser
+        inject_global_styles()
 
         if 'resume_data' not in st.session_state:
             st.session_state.resume_data = []
 
-    def load_lottie_url(self, url: str):
-        """Load Lottie animation from URL"""
-        r = requests.get(url)
-        if r.status_code != 200:
-            return None
-        return r.json()
-
-    def apply_global_styles(self):
-        st.markdown("""
-        <style>
-        /* Custom Scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-
-        ::-webkit-scrollbar-track {
-            background: #1a1a1a;
-            border-radius: 4px;
-        }
-
-        ::-webkit-scrollbar-thumb {
-            background: #4CAF50;
-            border-radius: 4px;
-        }
-
-        ::-webkit-scrollbar-thumb:hover {
-            background: #45a049;
-        }
-
-        /* Global Styles */
-        .main-header {
-            background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-            padding: 2rem;
-            border-radius: 15px;
-            margin-bottom: 2rem;
-            box-shadow: 0 10px 20px rgba(0,0,0,0.2);
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .main-header::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(45deg, transparent 0%, rgba(255,255,255,0.1) 100%);
-            z-index: 1;
-        }
-
-        .main-header h1 {
-            color: white;
-            font-size: 2.5rem;
-            font-weight: 600;
-            margin: 0;
-            position: relative;
-            z-index: 2;
-        }
-
-        /* Template Card Styles */
-        .template-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
-            gap: 2rem;
-            padding: 1rem;
-        }
-
-        .template-card {
-            background: rgba(45, 45, 45, 0.9);
-            border-radius: 20px;
-            padding: 2rem;
-            position: relative;
-            overflow: hidden;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255,255,255,0.1);
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-
-        .template-card:hover {
-            transform: translateY(-10px);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-            border-color: #4CAF50;
-        }
-
-        .template-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(45deg, transparent 0%, rgba(76,175,80,0.1) 100%);
-            z-index: 1;
-        }
-
-        .template-icon {
-            font-size: 3rem;
-            color: #4CAF50;
-            margin-bottom: 1.5rem;
-            position: relative;
-            z-index: 2;
-        }
-
-        .template-title {
-            font-size: 1.8rem;
-            font-weight: 600;
-            color: white;
-            margin-bottom: 1rem;
-            position: relative;
-            z-index: 2;
-        }
-
-        .template-description {
-            color: #aaa;
-            margin-bottom: 1.5rem;
-            position: relative;
-            z-index: 2;
-            line-height: 1.6;
-        }
-
-        /* Feature List Styles */
-        .feature-list {
-            list-style: none;
-            padding: 0;
-            margin: 1.5rem 0;
-            position: relative;
-            z-index: 2;
-        }
-
-        .feature-item {
-            display: flex;
-            align-items: center;
-            margin-bottom: 1rem;
-            color: #ddd;
-            font-size: 0.95rem;
-        }
-
-        .feature-icon {
-            color: #4CAF50;
-            margin-right: 0.8rem;
-            font-size: 1.1rem;
-        }
-
-        /* Button Styles */
-        .action-button {
-            background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-            color: white;
-            padding: 1rem 2rem;
-            border-radius: 50px;
-            border: none;
-            font-weight: 500;
-            cursor: pointer;
-            width: 100%;
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-            z-index: 2;
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        }
-
-        .action-button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(76,175,80,0.3);
-        }
-
-        .action-button::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent 0%, rgba(255,255,255,0.2) 50%, transparent 100%);
-            transition: all 0.6s ease;
-        }
-
-        .action-button:hover::before {
-            left: 100%;
-        }
-
-        /* Form Section Styles */
-        .form-section {
-            background: rgba(45, 45, 45, 0.9);
-            border-radius: 20px;
-            padding: 2rem;
-            margin: 2rem 0;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255,255,255,0.1);
-        }
-
-        .form-section-title {
-            font-size: 1.8rem;
-            font-weight: 600;
-            color: white;
-            margin-bottom: 1.5rem;
-            padding-bottom: 0.8rem;
-            border-bottom: 2px solid #4CAF50;
-        }
-
-        .form-group {
-            margin-bottom: 1.5rem;
-        }
-
-        .form-label {
-            color: #ddd;
-            font-weight: 500;
-            margin-bottom: 0.8rem;
-            display: block;
-        }
-
-        .form-input {
-            width: 100%;
-            padding: 1rem;
-            border-radius: 10px;
-            border: 1px solid rgba(255,255,255,0.1);
-            background: rgba(30, 30, 30, 0.9);
-            color: white;
-            transition: all 0.3s ease;
-        }
-
-        .form-input:focus {
-            border-color: #4CAF50;
-            box-shadow: 0 0 0 2px rgba(76,175,80,0.2);
-            outline: none;
-        }
-
-        /* Skill Tags */
-        .skill-tag-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.8rem;
-            margin-top: 1rem;
-        }
-
-        .skill-tag {
-            background: rgba(76,175,80,0.1);
-            color: #4CAF50;
-            padding: 0.6rem 1.2rem;
-            border-radius: 50px;
-            border: 1px solid #4CAF50;
-            font-size: 0.9rem;
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }
-
-        .skill-tag:hover {
-            background: #4CAF50;
-            color: white;
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(76,175,80,0.2);
-        }
-
-        /* Progress Circle */
-        .progress-container {
-            position: relative;
-            width: 150px;
-            height: 150px;
-            margin: 2rem auto;
-        }
-
-        .progress-circle {
-            transform: rotate(-90deg);
-            width: 100%;
-            height: 100%;
-        }
-
-        .progress-circle circle {
-            fill: none;
-            stroke-width: 8;
-            stroke-linecap: round;
-            stroke: #4CAF50;
-            transform-origin: 50% 50%;
-            transition: all 0.3s ease;
-        }
-
-        .progress-text {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: white;
-        }
-        .main .block-container {
-            padding-top: 2rem;
-            padding-bottom: 2rem;
-        }
-        .feature-card {
-            background-color: #1e1e1e;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }
-        
-        /* Animations */
-        @keyframes slideIn {
-            from {
-                opacity: 0;
-                transform: translateY(30px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-
-        .animate-slide-in {
-            animation: slideIn 0.6s cubic-bezier(0.4, 0, 0.2, 1) forwards;
-        }
-
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .template-container {
-                grid-template-columns: 1fr;
-            }
-
-            .main-header {
-                padding: 1.5rem;
-            }
-
-            .main-header h1 {
-                font-size: 2rem;
-            }
-
-            .template-card {
-                padding: 1.5rem;
-            }
-
-            .action-button {
-                padding: 0.8rem 1.6rem;
-            }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
+    # Built on first use, once per process, and shared across reruns and sessions
+    @property
+    def analyzer(self):
+        return get_resource('resume_analyzer', create_resume_analyzer)
+
+    @property
+    def dashboard_manager(self):
+        return get_resource('dashboard_manager', create_dashboard_manager)
+
+    def report_save(self, future):
+        """Tell the user whether a queued save committed; one still pending is reported on a later run"""
+        if not future.done():
+            st.info("Resume data queued for saving.")
+            st.session_state.pending_resume_save = future
+        elif future.exception() is not None:
+            st.error(f"Error saving to database: {str(future.exception())}")
+        else:
+            st.success("Resume data saved successfully!")
 
+    def report_pending_save(self):
+        """Show the outcome of a save that was still queued when the last analysis finished"""
+        future = st.session_state.get('pending_resume_save')
+        if future is None or not future.done():
+            return
+        del st.session_state.pending_resume_save
+        if future.exception() is not None:
+            st.error(f"Your last analysis could not be saved: {str(future.exception())}")
 
     def load_image(self, image_name):
-        """Load image from static directory"""
-        try:
-            image_path = f"c:/Users/shree/Downloads/smart-resume-ai/{image_name}"
-            with open(image_path, "rb") as f:
-                image_bytes = f.read()
-            encoded = base64.b64encode(image_bytes).decode()
-            return f"data:image/png;base64,{encoded}"
-        except Exception as e:
-            print(f"Error loading image {image_name}: {e}")
-            return None
+        """Image from the asset bundle as a data URI, or None when it is missing"""
+        return self.assets.data_uri(image_name)
         
-    def is_probably_resume(self, text: str) -> bool:
+    def is_probably_resume(self, pages) -> bool:
         """
         Heuristic-based check to determine if the document is likely a resume.
+        Accepts the full text or an iterable of page texts, and stops reading
+        pages as soon as the document qualifies.
         """
-        text = text.lower()
+        if isinstance(pages, str):
+            pages = [pages]
 
         required_sections = [
             "education",
@@ -456,46 +131,44 @@ class ResumeApp:
             "objective"
      ]
 
-        found_sections = sum(1 for section in required_sections if section in text)
+        from utils.keyword_matcher import get_matcher
 
-    # Consider it a resume if it has at least 3 key sections and a minimum length
-        return found_sections >= 5 and len(text.split()) > 100
+        matcher = get_matcher(required_sections)
+        found_sections = set()
+        word_count = 0
+        for page in pages:
+            found_sections |= matcher.matches(page.lower())
+            word_count += len(page.split())
+            # Consider it a resume if it has at least 5 key sections and a minimum length
+            if len(found_sections) >= 5 and word_count > 100:
+                return True
+        return False
 
 
 
-    def export_to_excel(self):
-        """Export resume data to Excel"""
-        conn = get_database_connection()
+    def export_resume_file(self, fmt='xlsx', since=None, until=None, roles=None):
+        """Export resume data with analysis to Excel, CSV or Parquet
 
-        # Get resume data with analysis
-        query = """
-            SELECT
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+        Rows are streamed into a temporary file, so a large history does not have
+        to fit in memory. Returns the file, rewound for reading, or None on error.
         """
-
+        conn = get_database_connection()
         try:
-            # Read data into DataFrame
-            df = pd.read_sql_query(query, conn)
-
-            # Create Excel writer object
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Resume Data')
-
-            return output.getvalue()
+            return spooled_export(conn, fmt, since, until, roles)
         except Exception as e:
-            print(f"Error exporting to Excel: {str(e)}")
+            print(f"Error exporting to {fmt}: {str(e)}")
             return None
         finally:
             conn.close()
 
+    def export_to_excel(self, since=None, until=None, roles=None):
+        """Export resume data with analysis to Excel, as bytes"""
+        output = self.export_resume_file('xlsx', since, until, roles)
+        if output is None:
+            return None
+        with output:
+            return output.read()
+
 
     def render_empty_state(self, icon, message):
         """Render an empty state with icon and message"""
@@ -543,7 +216,11 @@ class ResumeApp:
 
     def render_analyzer(self):
         """Render the resume analyzer page"""
+        from utils.resume_analyzer import MAX_RESUME_PAGES
+        from utils.extractors import PageStream
+
         apply_modern_styles()
+        self.report_pending_save()
 
         # Page Header
         page_header(
@@ -590,32 +267,6 @@ class ResumeApp:
                     ),
                     unsafe_allow_html=True
                 )
-                # Add a prominent upload button
-                col1, col2, col3 = st.columns([1, 2, 1])
-                with col2:
-                    st.markdown("""
-                    <style>
-                    .upload-button {
-                        background: linear-gradient(90deg, #4b6cb7, #182848);
-                        color: white;
-                        border: none;
-                        border-radius: 10px;
-                        padding: 15px 25px;
-                        font-size: 18px;
-                        font-weight: bold;
-                        cursor: pointer;
-                        width: 100%;
-                        text-align: center;
-                        margin: 20px 0;
-                        box-shadow: 0 4px 10px rgba(0,0,0,0.2);
-                        transition: all 0.3s ease;
-                    }
-                    .upload-button:hover {
-                        transform: translateY(-3px);
-                        box-shadow: 0 6px 15px rgba(0,0,0,0.3);
-                    }
-
-                    """, unsafe_allow_html=True)
 
             if uploaded_file:
                 # Add a prominent analyze button
@@ -626,32 +277,50 @@ class ResumeApp:
 
                 if analyze_standard:
                     with st.spinner("Analyzing your document..."):
-                        # Get file content
-                        text = ""
+                        # Get file content, reusing text already extracted from the same bytes
+                        file_hash = self.analysis_cache.file_key(uploaded_file.getvalue())
+                        text = self.analysis_cache.get_text(file_hash) or ""
+                        pages = [text]
                         try:
-                            if uploaded_file.type == "application/pdf":
-                                try:
-                                    text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                                except Exception as pdf_error:
-                                    st.error(f"PDF extraction failed: {str(pdf_error)}")
-                                    st.info("Trying alternative PDF extraction method...")
-                                   
+                            if not text:
+                                if uploaded_file.type == "application/pdf":
+                                    # Pages are parsed as the checks below read them, and
+                                    # never more than one page past the cap
+                                    pages = PageStream(self.analyzer.iter_pdf_pages(
+                                        uploaded_file, max_pages=MAX_RESUME_PAGES + 1))
                                     
-                            elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                                try:
-                                    text = self.analyzer.extract_text_from_docx(uploaded_file)
-                                except Exception as docx_error:
-                                    st.error(f"DOCX extraction failed: {str(docx_error)}")
+                                elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+                                    try:
+                                        text = self.analyzer.extract_text_from_docx(uploaded_file)
+                                        pages = [text]
+                                    except Exception as docx_error:
+                                        st.error(f"DOCX extraction failed: {str(docx_error)}")
                                     
-                            else:
-                                text = uploaded_file.getvalue().decode()
+                                else:
+                                    text = uploaded_file.getvalue().decode()
+                                    pages = [text]
                                 
+                            # Strict check to reject seminar reports or non-resume documents;
+                            # it stops reading pages as soon as the document qualifies
+                            try:
+                                probably_resume = self.is_probably_resume(pages)
+                                if isinstance(pages, PageStream):
+                                    # The analysis needs the remaining pages up to the cap
+                                    text = pages.text()
+                                    if len(pages.read) > MAX_RESUME_PAGES:
+                                        st.error(f"❌ This document has more than {MAX_RESUME_PAGES} pages and doesn't appear to be a resume.")
+                                        st.warning("Please upload a resume rather than a report, thesis or book.")
+                                        return
+                            except Exception as pdf_error:
+                                st.error(f"PDF extraction failed: {str(pdf_error)}")
+                                return
+
                             if not text or text.strip() == "":
                                 st.error("Could not extract any text from the uploaded file.")
                                 return
+                            self.analysis_cache.set_text(file_hash, text)
 
-                            # Strict check to reject seminar reports or non-resume documents
-                            if not self.is_probably_resume(text):
+                            if not probably_resume:
                                 st.error("❌ This document doesn't appear to be a resume.")
                                 st.warning("Please upload a resume that contains standard sections like Education, Skills, Experience, or Projects.")
                                 return
@@ -661,8 +330,23 @@ class ResumeApp:
                             st.error(f"Error reading file: {str(e)}")
                             return
 
-                        # Analyze the document
-                        analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                        # Parse once per file; scoring against a role reuses the parsed resume
+                        parsed = self.analysis_cache.get_parsed(file_hash)
+                        if parsed is None:
+                            try:
+                                parsed = self.analyzer.parse_resume(text)
+                            except Exception as e:
+                                print(f"Error parsing resume: {str(e)}")
+                                st.error(f"Resume analysis failed: {str(e)}")
+                                return
+                            self.analysis_cache.set_parsed(file_hash, parsed)
+
+                        # Analyze the document unless this file/role pair was scored already
+                        analysis = self.analysis_cache.get_analysis(file_hash, role_info)
+                        if analysis is None:
+                            analysis = self.analyzer.analyze_resume({'raw_text': text, 'parsed': parsed}, role_info)
+                            if 'error' not in analysis:
+                                self.analysis_cache.set_analysis(file_hash, role_info, analysis)
 
                         # Check if analysis returned an error
                         if 'error' in analysis:
@@ -685,15 +369,29 @@ class ResumeApp:
                         st.snow()
 
                         # Save resume data to database
-                        resume_data = {}
+                        resume_data = {
+                            'personal_info': {
+                                'full_name': analysis.get('name', ''),
+                                'email': analysis.get('email', ''),
+                                'phone': analysis.get('phone', ''),
+                                'linkedin': analysis.get('linkedin', ''),
+                                'github': analysis.get('github', ''),
+                                'portfolio': analysis.get('portfolio', '')
+                            },
+                            'summary': analysis.get('summary', ''),
+                            'target_role': selected_role,
+                            'target_category': selected_category,
+                            'education': analysis.get('education', []),
+                            'experience': analysis.get('experience', []),
+                            'projects': analysis.get('projects', []),
+                            'skills': analysis.get('skills', []),
+                            'template': ''
+                        }
 
                         # Save to database
                         try:
-                            resume_id = save_resume_data(resume_data)
-
                             # Save analysis data
                             analysis_data = {
-                                'resume_id': resume_id,
                                 'ats_score': analysis['ats_score'],
                                 'keyword_match_score': analysis['keyword_match']['score'],
                                 'format_score': analysis['format_score'],
@@ -701,8 +399,8 @@ class ResumeApp:
                                 'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
                                 'recommendations': ','.join(analysis['suggestions'])
                             }
-                            save_analysis_data(resume_id, analysis_data)
-                            st.success("Resume data saved successfully!")
+                            future = self.db_writer.submit(insert_resume_with_analysis, resume_data, analysis_data)
+                            self.report_save(future)
                         except Exception as e:
                             st.error(f"Error saving to database: {str(e)}")
                             print(f"Database error: {e}")
@@ -715,62 +413,20 @@ class ResumeApp:
                             st.warning(
                                 "Please upload a proper resume for ATS analysis.")
                             return
+
+                        # Rank the same parsed resume against every role
+                        try:
+                            best_roles = self.analyzer.rank_roles(parsed, self.job_roles, top_k=5)
+                        except Exception as e:
+                            # The role ranking is extra; the analysis above still shows
+                            print(f"Error ranking roles: {str(e)}")
+                            best_roles = []
                         # Display results in a modern card layout
                     col1, col2 = st.columns(2)
 
                     with col1:
                         # ATS Score Card with circular progress
-                        st.markdown("""
-                        <div class="feature-card">
-                            <h2>ATS Score</h2>
-                            <div style="position: relative; width: 150px; height: 150px; margin: 0 auto;">
-                                <div style="
-                                    position: absolute;
-                                    width: 150px;
-                                    height: 150px;
-                                    border-radius: 50%;
-                                    background: conic-gradient(
-                                        #4CAF50 0% {score}%,
-                                        #2c2c2c {score}% 100%
-                                    );
-                                    display: flex;
-                                    align-items: center;
-                                    justify-content: center;
-                                ">
-                                    <div style="
-                                        width: 120px;
-                                        height: 120px;
-                                        background: #1a1a1a;
-                                        border-radius: 50%;
-                                        display: flex;
-                                        align-items: center;
-                                        justify-content: center;
-                                        font-size: 24px;
-                                        font-weight: bold;
-                                        color: {color};
-                                    ">
-                                        {score}
-                                    </div>
-                                </div>
-                            </div>
-                            <div style="text-align: center; margin-top: 10px;">
-                                <span style="
-                                    font-size: 1.2em;
-                                    color: {color};
-                                    font-weight: bold;
-                                ">
-                                    {status}
-                                </span>
-                            </div>
-                        """.format(
-                            score=analysis['ats_score'],
-                            color='#4CAF50' if analysis['ats_score'] >= 80 else '#FFA500' if analysis[
-                                'ats_score'] >= 60 else '#FF4444',
-                            status='Excellent' if analysis['ats_score'] >= 80 else 'Good' if analysis[
-                                'ats_score'] >= 60 else 'Needs Improvement'
-                        ), unsafe_allow_html=True)
-
-                        st.markdown("</div>", unsafe_allow_html=True)
+                        st.markdown(score_circle(analysis['ats_score']), unsafe_allow_html=True)
 
                         # self.display_analysis_results(analysis_results)
 
@@ -790,6 +446,18 @@ class ResumeApp:
 
                         st.markdown("</div>", unsafe_allow_html=True)
 
+                        # Best Matching Roles Card
+                        if best_roles:
+                            st.markdown("""
+                            <div class="feature-card">
+                                <h2>🏆 Best Matching Roles</h2>
+                            """, unsafe_allow_html=True)
+
+                            for entry in best_roles:
+                                st.markdown(f"- **{entry['role']}** ({entry['category']}): {int(entry['score'])}% match")
+
+                            st.markdown("</div>", unsafe_allow_html=True)
+
                     with col2:
                         # Format Score Card
                         st.markdown("""
@@ -810,90 +478,22 @@ class ResumeApp:
                             <h2>📋 Resume Improvement Suggestions</h2>
                         """, unsafe_allow_html=True)
 
-                            # Contact Section
-                        if analysis.get('contact_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>📞 Contact Information</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'contact_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # Summary Section
-                        if analysis.get('summary_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>📝 Professional Summary</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'summary_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # Skills Section
-                        if analysis.get(
-                            'skills_suggestions') or analysis['keyword_match']['missing_skills']:
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>🎯 Skills</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'skills_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                if analysis['keyword_match']['missing_skills']:
-                                    st.markdown(
-    "<li style='margin-bottom: 8px;'>✓ Consider adding these relevant skills:</li>",
-     unsafe_allow_html=True)
-                                    for skill in analysis['keyword_match']['missing_skills']:
-                                        st.markdown(
-    f"<li style='margin-left: 20px; margin-bottom: 4px;'>• {skill}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # Experience Section
-                        if analysis.get('experience_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>💼 Work Experience</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'experience_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-
-                            # General Formatting Suggestions
-                        if analysis.get('format_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>📄 Formatting</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'format_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
+                        # One element per section, filled from precompiled templates
+                        missing_skills = analysis['keyword_match']['missing_skills']
+                        sections = [
+                            ("📞 Contact Information", analysis.get('contact_suggestions'), []),
+                            ("📝 Professional Summary", analysis.get('summary_suggestions'), []),
+                            ("🎯 Skills", analysis.get('skills_suggestions'), missing_skills),
+                            ("💼 Work Experience", analysis.get('experience_suggestions'), []),
+                            ("📄 Formatting", analysis.get('format_suggestions'), []),
+                        ]
+                        for title, suggestions, details in sections:
+                            if not suggestions and not details:
+                                continue
+                            suggestions = list(suggestions or [])
+                            if details:
+                                suggestions.append("Consider adding these relevant skills:")
+                            st.markdown(suggestion_card(title, suggestions, details), unsafe_allow_html=True)
 
                         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -927,11 +527,17 @@ class ResumeApp:
 
     def main(self):
         """Main application entry point"""
-        self.apply_global_styles()
         
        
+        from streamlit_lottie import st_lottie
+
         with st.sidebar:
-            st_lottie(self.load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json"), height=200, key="sidebar_animation")
+            animation = self.assets.json('sidebar_animation')
+            if animation:
+                # Keyed by content, so the component only remounts when the animation changes
+                st_lottie(animation, height=200, key=f"sidebar_animation_{self.assets.etag('sidebar_animation')[:12]}")
+            elif self.assets.get('logo'):
+                st.image(self.assets.data('logo'), width=120)
             st.title("Resume Analyzer")
             st.markdown("---")
             
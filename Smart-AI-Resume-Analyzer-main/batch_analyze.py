@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Batch analysis for Smart AI Resume Analyzer
+Analyzes a folder or zip of PDF/DOCX resumes against one job role without the Streamlit UI
+"""
+
+import io
+import os
+import sys
+import csv
+import json
+import time
+import zipfile
+import hashlib
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from config.job_roles import JOB_ROLES
+from utils.extractors import join_pages
+from utils.extraction_pool import EXTRACTION_CPU_SECONDS, EXTRACTION_WALL_SECONDS, _init_worker as _init_limits, _run_limited
+from utils.resume_analyzer import ResumeAnalyzer
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+CSV_FIELDS = [
+    'source', 'name', 'email', 'phone', 'linkedin', 'github', 'document_type',
+    'ats_score', 'keyword_match_score', 'format_score', 'section_score',
+    'found_skills', 'missing_skills', 'error'
+]
+
+ERROR_FIELDS = ['source', 'error']
+
+WORKER_CRASH_ERROR = "The worker analyzing this file crashed; remove it from the checkpoint file to retry it"
+
+# One analyzer per worker process, created by the pool initializer
+_analyzer = None
+
+
+def _init_worker():
+    global _analyzer
+    # CPU and wall-clock limits for PDF parsing, as in the app's extraction pool
+    _init_limits(0)
+    _analyzer = ResumeAnalyzer()
+
+
+def find_role(role_name, category=None):
+    """Look up a role in JOB_ROLES, optionally restricted to one category"""
+    for role_category, roles in JOB_ROLES.items():
+        if category and role_category != category:
+            continue
+        if role_name in roles:
+            return role_category, roles[role_name]
+    return None, None
+
+
+def collect_tasks(input_path):
+    """List (source, path, zip member) for every supported file in a folder or zip"""
+    tasks = []
+    if zipfile.is_zipfile(input_path):
+        with zipfile.ZipFile(input_path) as archive:
+            for member in archive.namelist():
+                if member.lower().endswith(SUPPORTED_EXTENSIONS) and not member.endswith('/'):
+                    tasks.append((f"{os.path.basename(input_path)}:{member}", input_path, member))
+    else:
+        for root, _, files in os.walk(input_path):
+            for filename in sorted(files):
+                if filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                    path = os.path.join(root, filename)
+                    tasks.append((os.path.relpath(path, input_path), path, None))
+    return sorted(tasks)
+
+
+def analyze_file(task, role_info):
+    """Extract and analyze one resume inside a worker process"""
+    source, path, member = task
+    try:
+        if member is None:
+            with open(path, 'rb') as f:
+                file_bytes = f.read()
+        else:
+            with zipfile.ZipFile(path) as archive:
+                file_bytes = archive.read(member)
+
+        name = member or path
+        if name.lower().endswith('.pdf'):
+            text = join_pages(_run_limited(file_bytes, EXTRACTION_CPU_SECONDS, EXTRACTION_WALL_SECONDS))
+        else:
+            text = _analyzer.extract_text_from_docx(io.BytesIO(file_bytes))
+
+        if not text or not text.strip():
+            return source, {'error': "Could not extract any text from the file"}
+        return source, _analyzer.analyze_resume({'raw_text': text}, role_info)
+    except Exception as e:
+        return source, {'error': str(e)}
+
+
+def iter_results(tasks, role_info, workers):
+    """Analyze tasks in worker processes and yield (source, analysis) as they finish
+
+    A file that kills its worker does not abort the run: the files that were in
+    flight when the pool broke are rerun one at a time, and the one that breaks
+    its pool again is reported with WORKER_CRASH_ERROR.
+    """
+    pending = deque(tasks)
+    suspects = deque()
+    while pending or suspects:
+        if suspects:
+            task = suspects.popleft()
+            with ProcessPoolExecutor(max_workers=1, initializer=_init_worker) as executor:
+                try:
+                    result = executor.submit(analyze_file, task, role_info).result()
+                except BrokenProcessPool:
+                    result = task[0], {'error': WORKER_CRASH_ERROR, 'crashed': True}
+            yield result
+            continue
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            # A short window keeps the number of suspects small when a worker dies
+            in_flight = {}
+            while pending or in_flight:
+                while pending and len(in_flight) < workers * 2:
+                    task = pending.popleft()
+                    in_flight[executor.submit(analyze_file, task, role_info)] = task
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in finished:
+                    task = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        suspects.append(task)
+                        broken = True
+                        continue
+                    yield result
+                if broken:
+                    suspects.extend(in_flight.values())
+                    break
+
+
+def to_row(source, analysis):
+    """Flatten an analysis result into one output record"""
+    keyword_match = analysis.get('keyword_match', {})
+    return {
+        'source': source,
+        'name': analysis.get('name', ''),
+        'email': analysis.get('email', ''),
+        'phone': analysis.get('phone', ''),
+        'linkedin': analysis.get('linkedin', ''),
+        'github': analysis.get('github', ''),
+        'document_type': analysis.get('document_type', 'unknown'),
+        'ats_score': analysis.get('ats_score', 0),
+        'keyword_match_score': keyword_match.get('score', 0),
+        'format_score': analysis.get('format_score', 0),
+        'section_score': analysis.get('section_score', 0),
+        'found_skills': ','.join(keyword_match.get('found_skills', [])),
+        'missing_skills': ','.join(keyword_match.get('missing_skills', [])),
+        'error': analysis.get('error', '')
+    }
+
+
+class SkippedDocument(Exception):
+    """Raised by a sink for an analyzed file it does not store"""
+
+
+class CSVSink:
+    def __init__(self, path):
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'a', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=CSV_FIELDS)
+        if is_new:
+            self.writer.writeheader()
+
+    def write(self, source, analysis):
+        self.writer.writerow(to_row(source, analysis))
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class JSONLSink:
+    def __init__(self, path):
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def write(self, source, analysis):
+        self.file.write(json.dumps({'source': source, **analysis}) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class DatabaseSink:
+    """Store results in resume_data / resume_analysis like the analyzer page does"""
+
+    def __init__(self, role_name, category):
+        from config.database import init_database, insert_resume_with_analysis
+        from config.write_behind import get_write_behind_writer
+        init_database()
+        self.insert_resume_with_analysis = insert_resume_with_analysis
+        # Rows are committed in batches by the write-behind thread
+        self.writer = get_write_behind_writer()
+        self.role_name = role_name
+        self.category = category
+
+    def write(self, source, analysis):
+        """Queue the resume and return the write's Future"""
+        if analysis.get('document_type') != 'resume':
+            raise SkippedDocument(f"Not saved: detected as {analysis.get('document_type', 'unknown')}, not a resume")
+        return self.writer.submit(self.insert_resume_with_analysis, {
+            'personal_info': {
+                'full_name': analysis.get('name', ''),
+                'email': analysis.get('email', ''),
+                'phone': analysis.get('phone', ''),
+                'linkedin': analysis.get('linkedin', ''),
+                'github': analysis.get('github', ''),
+                'portfolio': analysis.get('portfolio', '')
+            },
+            'summary': analysis.get('summary', ''),
+            'target_role': self.role_name,
+            'target_category': self.category,
+            'education': analysis.get('education', []),
+            'experience': analysis.get('experience', []),
+            'projects': analysis.get('projects', []),
+            'skills': analysis.get('skills', []),
+            'template': 'batch'
+        }, {
+            'ats_score': analysis['ats_score'],
+            'keyword_match_score': analysis['keyword_match']['score'],
+            'format_score': analysis['format_score'],
+            'section_score': analysis['section_score'],
+            'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+            'recommendations': ','.join(analysis['suggestions'])
+        })
+
+    def close(self):
+        self.writer.flush()
+        stats = self.writer.stats()
+        if stats['failed']:
+            print(f"Error saving {stats['failed']} result(s) to the database: {stats['last_error']}")
+
+
+def run_key(input_path, role_name, category):
+    """Identifies a (input, role) run in the checkpoint, so other roles or folders start fresh"""
+    identity = '\0'.join([os.path.abspath(input_path), category or '', role_name])
+    return hashlib.sha1(identity.encode('utf-8')).hexdigest()[:16]
+
+
+def load_checkpoint(path, key):
+    """Sources finished by an earlier, possibly interrupted, run with the same key"""
+    if not os.path.exists(path):
+        return set()
+    done = set()
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line_key, _, source = line.rstrip('\n').partition('\t')
+            if line_key == key and source:
+                done.add(source)
+    return done
+
+
+def load_errors(path):
+    """Error report of an earlier run: source -> error"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, newline='', encoding='utf-8') as f:
+        return {row['source']: row['error'] for row in csv.DictReader(f)}
+
+
+class Progress:
+    """Checkpoint of finished files, plus an error report with one row per failing file
+
+    The error report is rewritten rather than appended to, so a file that fails
+    on every rerun keeps a single row, and a file that later succeeds drops out.
+    Database writes report here from the write-behind thread once they commit.
+    """
+
+    def __init__(self, checkpoint_path, errors_path, key):
+        self.key = key
+        self.errors_path = errors_path
+        self.errors = load_errors(errors_path)
+        self.failed_count = 0
+        self.lock = threading.Lock()
+        self.checkpoint = open(checkpoint_path, 'a', encoding='utf-8')
+
+    def done(self, source, error=None):
+        """Checkpoint a file; with an error it stays in the report but reruns skip it"""
+        with self.lock:
+            self.checkpoint.write(f"{self.key}\t{source}\n")
+            self.checkpoint.flush()
+            if error is not None:
+                self.errors[source] = error
+            elif self.errors.pop(source, None) is None:
+                return
+            self._save_errors()
+
+    def failed(self, source, error):
+        """Record a failure without checkpointing, so that a rerun retries the file"""
+        with self.lock:
+            self.failed_count += 1
+            self.errors[source] = error
+            self._save_errors()
+
+    def done_when_saved(self, source, future):
+        """Checkpoint a file only once its database write has committed"""
+        def finished(future):
+            error = future.exception()
+            if error is None:
+                self.done(source)
+            else:
+                self.failed(source, f"Error saving to the database: {error}")
+        future.add_done_callback(finished)
+
+    def _save_errors(self):
+        temp_path = f"{self.errors_path}.tmp"
+        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=ERROR_FIELDS)
+            writer.writeheader()
+            for source, error in sorted(self.errors.items()):
+                writer.writerow({'source': source, 'error': error})
+        os.replace(temp_path, self.errors_path)
+
+    def close(self):
+        self.checkpoint.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze a folder or zip of resumes against a job role")
+    parser.add_argument('input', help="Folder or .zip file containing PDF/DOCX resumes")
+    parser.add_argument('--role', required=True, help="Target role name from JOB_ROLES, e.g. 'Backend Developer'")
+    parser.add_argument('--category', help="Job category, only needed when a role name is ambiguous")
+    parser.add_argument('--format', choices=['csv', 'jsonl', 'db'], default='csv', help="Output format")
+    parser.add_argument('--output', help="Output file for csv/jsonl (default: batch_results.<format>)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument('--checkpoint', help="Progress file used to resume interrupted runs (default: <output>.progress)")
+    parser.add_argument('--errors', help="CSV report of files that failed (default: <output>.errors.csv)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the batch analysis and stream results to the selected sink"""
+    args = parse_args(argv)
+
+    category, role_info = find_role(args.role, args.category)
+    if role_info is None:
+        print(f"Unknown role: {args.role}")
+        sys.exit(1)
+    if not os.path.exists(args.input):
+        print(f"Input not found: {args.input}")
+        sys.exit(1)
+
+    output = args.output or f"batch_results.{args.format}"
+    checkpoint_path = args.checkpoint or f"{output}.progress"
+    key = run_key(args.input, args.role, category)
+    done = load_checkpoint(checkpoint_path, key)
+    tasks = [task for task in collect_tasks(args.input) if task[0] not in done]
+    print(f"{len(tasks)} file(s) to analyze for {args.role} ({len(done)} already done)")
+    if not tasks:
+        return
+
+    if args.format == 'csv':
+        sink = CSVSink(output)
+    elif args.format == 'jsonl':
+        sink = JSONLSink(output)
+    else:
+        sink = DatabaseSink(args.role, category)
+
+    progress = Progress(checkpoint_path, args.errors or f"{output}.errors.csv", key)
+    start = time.time()
+    processed = 0
+    try:
+        for source, analysis in iter_results(tasks, role_info, args.workers):
+            if analysis.get('crashed'):
+                # Reruns skip it, or every rerun would crash on the same file
+                progress.done(source, analysis['error'])
+            elif 'error' in analysis:
+                # Left out of the checkpoint so that a rerun retries it
+                progress.failed(source, analysis['error'])
+            else:
+                try:
+                    future = sink.write(source, analysis)
+                except SkippedDocument as e:
+                    progress.done(source, str(e))
+                except Exception as e:
+                    progress.failed(source, f"Error saving result: {str(e)}")
+                else:
+                    if future is None:
+                        progress.done(source)
+                    else:
+                        progress.done_when_saved(source, future)
+            processed += 1
+            if processed % 25 == 0 or processed == len(tasks):
+                elapsed = time.time() - start
+                print(f"{processed}/{len(tasks)} files ({processed / elapsed:.1f} files/sec)")
+    except (KeyboardInterrupt, BrokenProcessPool):
+        # Ctrl-C can reach the workers first, which surfaces as a broken pool
+        print(f"Interrupted after {processed} file(s); rerun the same command to resume")
+    finally:
+        # Flushes pending database writes, which checkpoints them
+        sink.close()
+        progress.close()
+
+    if progress.failed_count:
+        print(f"{progress.failed_count} file(s) failed, see {progress.errors_path}; a rerun retries them")
+    elapsed = time.time() - start
+    if processed:
+        print(f"Analyzed {processed} file(s) in {elapsed:.1f}s ({processed / elapsed:.1f} files/sec)")
+
+
+if __name__ == "__main__":
+    main()
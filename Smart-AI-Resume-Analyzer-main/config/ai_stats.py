@@ -0,0 +1,243 @@
+"""
+AI analyzer usage statistics computed in a single scan of ai_analysis
+
+One grouped query reads every row once and returns partial aggregates per
+(model, job role). The covering index idx_ai_analysis_stats is already in
+that order, so SQLite streams it without sorting. Totals, the average score,
+model usage, top roles and the score histogram are folded from those few
+partial rows in Python. The 7-day trend and the 5 most recent analyses are
+range reads on the created_at index rather than further scans. Results are
+cached for AI_STATS_CACHE_TTL seconds, and the cache is dropped whenever
+ai_analysis changes.
+
+    python -m config.ai_stats --rows 1000000   # benchmark on a synthetic table
+"""
+import os
+import time
+import threading
+from datetime import datetime, timedelta, timezone
+
+from config.resources import get_resource
+
+AI_STATS_CACHE_TTL = float(os.getenv("AI_STATS_CACHE_TTL", "30"))
+
+SCORE_RANGES = [
+    {"min": 0, "max": 20, "range": "0-20"},
+    {"min": 21, "max": 40, "range": "21-40"},
+    {"min": 41, "max": 60, "range": "41-60"},
+    {"min": 61, "max": 80, "range": "61-80"},
+    {"min": 81, "max": 100, "range": "81-100"}
+]
+
+AI_STATS_QUERY = """
+    SELECT
+        model_used,
+        job_role,
+        COUNT(*) as count,
+        SUM(resume_score) as score_sum,
+        COUNT(resume_score) as scored,
+        {histogram}
+    FROM ai_analysis
+    GROUP BY model_used, job_role
+""".format(histogram=',\n        '.join(
+    f"COUNT(CASE WHEN resume_score >= {r['min']} AND resume_score <= {r['max']} THEN 1 END)"
+    for r in SCORE_RANGES
+))
+
+# Covering index in GROUP BY order; created by migration 5
+AI_STATS_INDEX = (
+    'CREATE INDEX IF NOT EXISTS idx_ai_analysis_stats ON ai_analysis (model_used, job_role, resume_score)'
+)
+
+AI_DAILY_TREND_QUERY = """
+    SELECT DATE(created_at) as date, COUNT(*) as count
+    FROM ai_analysis
+    WHERE created_at >= ?
+    GROUP BY DATE(created_at)
+    ORDER BY date
+"""
+
+RECENT_AI_ANALYSES_QUERY = """
+    SELECT model_used, resume_score, job_role, created_at as date
+    FROM ai_analysis
+    ORDER BY created_at DESC
+    LIMIT 5
+"""
+
+
+def empty_ai_analysis_stats():
+    return {
+        "total_analyses": 0,
+        "model_usage": [],
+        "average_score": 0,
+        "top_job_roles": [],
+        "daily_trend": [],
+        "score_distribution": [],
+        "recent_analyses": []
+    }
+
+
+def _ranked(counts, key_name, limit=None):
+    ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [{key_name: key, "count": count} for key, count in ranked]
+
+
+def compute_ai_analysis_stats(conn):
+    """Every statistic shown on the admin page, from one index scan plus two index range reads"""
+    cursor = conn.cursor()
+    total = 0
+    score_sum = 0
+    scored = 0
+    model_counts = {}
+    role_counts = {}
+    histogram = [0] * len(SCORE_RANGES)
+
+    for model, role, count, group_sum, group_scored, *buckets in cursor.execute(AI_STATS_QUERY):
+        total += count
+        score_sum += group_sum or 0
+        scored += group_scored
+        model_counts[model] = model_counts.get(model, 0) + count
+        role_counts[role] = role_counts.get(role, 0) + count
+        for i, bucket_count in enumerate(buckets):
+            histogram[i] += bucket_count
+
+    # created_at is UTC; the cutoff is a parameter so the query runs unchanged on every backend
+    week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).strftime('%Y-%m-%d')
+    daily_trend = [
+        {"date": str(row[0]), "count": row[1]} for row in cursor.execute(AI_DAILY_TREND_QUERY, (week_ago,))
+    ]
+
+    recent_analyses = [
+        {
+            "model": row[0],
+            "score": row[1],
+            "job_role": row[2],
+            "date": str(row[3])[:19]
+        } for row in cursor.execute(RECENT_AI_ANALYSES_QUERY)
+    ]
+
+    return {
+        "total_analyses": total,
+        "model_usage": _ranked(model_counts, "model"),
+        "average_score": round(score_sum / scored, 1) if scored else 0,
+        "top_job_roles": _ranked(role_counts, "role", 5),
+        "daily_trend": daily_trend,
+        "score_distribution": [
+            {"range": r["range"], "count": count} for r, count in zip(SCORE_RANGES, histogram)
+        ],
+        "recent_analyses": recent_analyses
+    }
+
+
+class TTLCache:
+    """Keeps one computed value for a few seconds
+
+    invalidate() bumps a generation counter; a value computed across an
+    invalidation is returned to its caller but not stored, so stale stats are
+    never served for a full TTL.
+    """
+
+    def __init__(self, ttl=AI_STATS_CACHE_TTL):
+        self.ttl = ttl
+        self._value = None
+        self._expires = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, compute):
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expires:
+                return self._value
+            generation = self._generation
+        value = compute()
+        with self._lock:
+            if generation == self._generation:
+                self._value = value
+                self._expires = time.monotonic() + self.ttl
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._value = None
+
+
+def get_ai_stats_cache():
+    """Return the process-wide stats cache; invalidate_resource('ai_stats_cache') empties it"""
+    return get_resource('ai_stats_cache', TTLCache, TTLCache.invalidate)
+
+
+def _create_synthetic_table(conn, rows):
+    import random
+
+    models = ['Google Gemini', 'Anthropic Claude', 'OpenAI GPT', 'Local Model']
+    roles = [f"Role {i}" for i in range(40)]
+    conn.execute('DROP TABLE IF EXISTS ai_analysis')
+    conn.execute('''
+    CREATE TABLE ai_analysis (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        resume_id INTEGER,
+        model_used TEXT,
+        resume_score INTEGER,
+        job_role TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    conn.execute('CREATE INDEX idx_ai_analysis_created_at ON ai_analysis (created_at)')
+    conn.execute(AI_STATS_INDEX)
+    batch = 50000
+    for start in range(0, rows, batch):
+        conn.executemany(
+            "INSERT INTO ai_analysis (resume_id, model_used, resume_score, job_role, created_at) "
+            "VALUES (?, ?, ?, ?, datetime('now', ?))",
+            [
+                (i, random.choice(models), random.randint(0, 100), random.choice(roles),
+                 f"-{random.randint(0, 365 * 24 * 3600)} seconds")
+                for i in range(start, min(start + batch, rows))
+            ]
+        )
+    conn.commit()
+
+
+def benchmark(rows=1000000, repeat=3):
+    """Time the stats engine on a synthetic ai_analysis table in a temporary database"""
+    import sqlite3
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, 'ai_stats_benchmark.db'))
+        try:
+            start = time.perf_counter()
+            _create_synthetic_table(conn, rows)
+            print(f"Created {rows:,} synthetic rows in {time.perf_counter() - start:.1f}s")
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                stats = compute_ai_analysis_stats(conn)
+                timings.append(time.perf_counter() - start)
+            print(f"Single-scan stats: best {min(timings) * 1000:.0f} ms over {repeat} run(s)")
+
+            cache = TTLCache(ttl=60)
+            cache.get(lambda: compute_ai_analysis_stats(conn))
+            start = time.perf_counter()
+            cache.get(lambda: compute_ai_analysis_stats(conn))
+            print(f"Cached stats: {(time.perf_counter() - start) * 1e6:.0f} us")
+            print(f"Total {stats['total_analyses']:,}, average score {stats['average_score']}")
+            return min(timings)
+        finally:
+            conn.close()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the AI analysis statistics query")
+    parser.add_argument('--rows', type=int, default=1000000, help="Rows in the synthetic table")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs")
+    args = parser.parse_args(argv)
+    benchmark(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Local bundle of the app's static assets
+
+The sidebar animation, the stylesheet and the logo ship with the app.
+assets/manifest.json lists them with the SHA-256 digest of their content.
+The bundle reads every file once per process and keeps it in memory, so the
+render path never opens a file twice nor touches the network. A content
+digest doubles as the asset's ETag: it changes exactly when the content
+does, so derived forms (parsed JSON, data URIs) are cached against it. A
+missing asset is reported once and its callers fall back to rendering
+without it.
+
+    python -m config.assets --check
+    python -m config.assets --fetch sidebar_animation https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json
+"""
+import os
+import json
+import base64
+import hashlib
+import mimetypes
+
+from config.resources import get_resource
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSET_MANIFEST_PATH = os.getenv("ASSET_MANIFEST_PATH", os.path.join(APP_DIR, 'assets', 'manifest.json'))
+
+
+def content_etag(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(path=ASSET_MANIFEST_PATH):
+    """name -> {'path', 'sha256', ...}; paths are relative to the manifest's app directory"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading asset manifest {path}: {str(e)}")
+        return {}
+
+
+def save_manifest(manifest, path=ASSET_MANIFEST_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def _asset_path(entry, manifest_path):
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(manifest_path)))
+    return os.path.join(app_dir, entry['path'])
+
+
+class Asset:
+    """One asset's bytes, with its ETag and MIME type"""
+
+    def __init__(self, name, path, data):
+        self.name = name
+        self.path = path
+        self.data = data
+        self.etag = content_etag(data)
+        self.mime_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+class AssetBundle:
+    """The manifest's assets, read once; lookups of missing assets return the fallback"""
+
+    def __init__(self, manifest_path=ASSET_MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self._assets = {}
+        self._derived = {}  # (etag, form) -> parsed JSON or data URI
+        for name, entry in load_manifest(manifest_path).items():
+            path = _asset_path(entry, manifest_path)
+            try:
+                with open(path, 'rb') as f:
+                    asset = Asset(name, path, f.read())
+            except Exception as e:
+                print(f"Error loading asset {name}: {str(e)}")
+                continue
+            if entry.get('sha256') and entry['sha256'] != asset.etag:
+                print(f"Warning: asset {name} does not match its manifest digest; run python -m config.assets --update")
+            self._assets[name] = asset
+
+    def get(self, name):
+        return self._assets.get(name)
+
+    def etag(self, name):
+        asset = self._assets.get(name)
+        return asset.etag if asset else None
+
+    def data(self, name, default=None):
+        asset = self._assets.get(name)
+        return asset.data if asset else default
+
+    def text(self, name, default=''):
+        asset = self._assets.get(name)
+        return asset.data.decode('utf-8') if asset else default
+
+    def json(self, name, default=None):
+        """The asset parsed as JSON, parsed once per content version"""
+        asset = self._assets.get(name)
+        if asset is None:
+            return default
+        key = (asset.etag, 'json')
+        if key not in self._derived:
+            try:
+                self._derived[key] = json.loads(asset.data)
+            except ValueError as e:
+                print(f"Error parsing asset {name}: {str(e)}")
+                self._derived[key] = default
+        return self._derived[key]
+
+    def data_uri(self, name, default=None):
+        """The asset inlined as a base64 data: URI, for <img src> and CSS url()"""
+        asset = self._assets.get(name)
+        if asset is None:
+            return default
+        key = (asset.etag, 'data_uri')
+        if key not in self._derived:
+            encoded = base64.b64encode(asset.data).decode()
+            self._derived[key] = f"data:{asset.mime_type};base64,{encoded}"
+        return self._derived[key]
+
+    def names(self):
+        return list(self._assets)
+
+
+def get_assets():
+    """Process-wide asset bundle"""
+    return get_resource('asset_bundle', AssetBundle)
+
+
+def check_assets(manifest_path=ASSET_MANIFEST_PATH):
+    """Print each asset's state; True when all exist and match their digests"""
+    ok = True
+    for name, entry in sorted(load_manifest(manifest_path).items()):
+        path = _asset_path(entry, manifest_path)
+        if not os.path.exists(path):
+            print(f"MISSING  {name}: {entry['path']}")
+            ok = False
+            continue
+        with open(path, 'rb') as f:
+            etag = content_etag(f.read())
+        if etag != entry.get('sha256'):
+            print(f"CHANGED  {name}: {entry['path']} ({etag[:12]}, manifest has {str(entry.get('sha256'))[:12]})")
+            ok = False
+        else:
+            print(f"ok       {name}: {entry['path']} ({etag[:12]})")
+    return ok
+
+
+def update_digests(manifest_path=ASSET_MANIFEST_PATH):
+    """Record the current digest of every asset that exists"""
+    manifest = load_manifest(manifest_path)
+    for name, entry in manifest.items():
+        path = _asset_path(entry, manifest_path)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                entry['sha256'] = content_etag(f.read())
+    save_manifest(manifest, manifest_path)
+
+
+def fetch_asset(name, url, manifest_path=ASSET_MANIFEST_PATH, timeout=30):
+    """Download an asset into the bundle and record it; a maintenance step, never run by the app"""
+    from urllib.request import urlopen
+
+    manifest = load_manifest(manifest_path)
+    if name not in manifest:
+        raise ValueError(f"Unknown asset {name!r}; add it to {manifest_path} first")
+    with urlopen(url, timeout=timeout) as response:
+        data = response.read()
+    if manifest[name]['path'].endswith('.json'):
+        json.loads(data)  # Refuse to vendor an error page
+    path = _asset_path(manifest[name], manifest_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    manifest[name].update(sha256=content_etag(data), source=url)
+    save_manifest(manifest, manifest_path)
+    return manifest[name]['sha256']
+
+
+def main(argv=None):
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check and maintain the local asset bundle")
+    parser.add_argument('--check', action='store_true', help="Verify every asset exists and matches its digest")
+    parser.add_argument('--update', action='store_true', help="Record the current digests in the manifest")
+    parser.add_argument('--fetch', nargs=2, metavar=('NAME', 'URL'), help="Download an asset into the bundle")
+    parser.add_argument('--manifest', default=ASSET_MANIFEST_PATH, help="Manifest file")
+    args = parser.parse_args(argv)
+
+    if args.fetch:
+        name, url = args.fetch
+        etag = fetch_asset(name, url, args.manifest)
+        print(f"Vendored {name} from {url} ({etag[:12]})")
+    if args.update:
+        update_digests(args.manifest)
+        print(f"Updated digests in {args.manifest}")
+    if args.check or not (args.fetch or args.update):
+        if not check_assets(args.manifest):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,89 +1,108 @@
-import sqlite3
-from datetime import datetime
+from config.rollups import record_resume, record_analysis
+from config.ai_stats import get_ai_stats_cache, compute_ai_analysis_stats, empty_ai_analysis_stats
+from config.storage import get_storage, table_names
+
+# Set once init_database has brought the schema up to date in this process
+_schema_ready = False
+
 
 def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
-    return conn
+    """Return a pooled connection to the resume database; close() gives it back to the pool"""
+    return get_storage().connect()
 
 def init_database():
-    """Initialize database tables"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
-    # Create resume_data table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_data (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        email TEXT NOT NULL,
-        phone TEXT NOT NULL,
-        linkedin TEXT,
-        github TEXT,
-        portfolio TEXT,
-        summary TEXT,
-        target_role TEXT,
-        target_category TEXT,
-        education TEXT,
-        experience TEXT,
-        projects TEXT,
-        skills TEXT,
-        template TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
-    
-    # Create resume_skills table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_skills (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        resume_id INTEGER,
-        skill_name TEXT NOT NULL,
-        skill_category TEXT NOT NULL,
-        proficiency_score REAL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
-    )
-    ''')
-    
-    # Create resume_analysis table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS resume_analysis (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        resume_id INTEGER,
-        ats_score REAL,
-        keyword_match_score REAL,
-        format_score REAL,
-        section_score REAL,
-        missing_skills TEXT,
-        recommendations TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
-    )
-    ''')
+    """Bring the database schema up to date; migrations run once per process"""
+    global _schema_ready
+    if _schema_ready:
+        return
+    from config.migrations import run_migrations
+
+    storage = get_storage()
+    conn = storage.connect()
+    try:
+        storage.prepare(conn)
+        run_migrations(conn)
+        _schema_ready = True
+    finally:
+        conn.close()
+
+def insert_resume_data(cursor, data):
+    """Insert one resume_data row on an open cursor and return its id"""
+    personal_info = data.get('personal_info', {})
     
-    # Create admin_logs table
     cursor.execute('''
-    CREATE TABLE IF NOT EXISTS admin_logs (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        admin_email TEXT NOT NULL,
-        action TEXT NOT NULL,
-        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
-    
-    # Create admin table
+    INSERT INTO resume_data (
+        name, email, phone, linkedin, github, portfolio,
+        summary, target_role, target_category, education, 
+        experience, projects, skills, template
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        personal_info.get('full_name', ''),
+        personal_info.get('email', ''),
+        personal_info.get('phone', ''),
+        personal_info.get('linkedin', ''),
+        personal_info.get('github', ''),
+        personal_info.get('portfolio', ''),
+        data.get('summary', ''),
+        data.get('target_role', ''),
+        data.get('target_category', ''),
+        str(data.get('education', [])),
+        str(data.get('experience', [])),
+        str(data.get('projects', [])),
+        str(data.get('skills', [])),
+        data.get('template', '')
+    ))
+    resume_id = cursor.lastrowid
+    insert_resume_skills(cursor, resume_id, data.get('skills', []))
+    record_resume(cursor, resume_id)
+    return resume_id
+
+def insert_resume_skills(cursor, resume_id, skills):
+    """Store a resume's skills as canonical taxonomy entries in resume_skills"""
+    from utils.skill_taxonomy import get_skill_taxonomy
+
+    cursor.executemany('''
+    INSERT INTO resume_skills (resume_id, skill_id, skill_name, skill_category)
+    VALUES (?, ?, ?, ?)
+    ''', [
+        (resume_id, skill['id'], skill['name'], skill['category'])
+        for skill in get_skill_taxonomy().resolve_all(skills)
+    ])
+
+def _score(analysis, key):
+    """A score as a float; None stays NULL like the original inserts stored it"""
+    value = analysis.get(key, 0)
+    return float(value) if value is not None else None
+
+def insert_analysis_data(cursor, resume_id, analysis):
+    """Insert one resume_analysis row on an open cursor and return its id"""
+    ats_score = _score(analysis, 'ats_score')
+    keyword_match_score = _score(analysis, 'keyword_match_score')
     cursor.execute('''
-    CREATE TABLE IF NOT EXISTS admin (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        email TEXT NOT NULL UNIQUE,
-        password TEXT NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
-    
-    conn.commit()
-    conn.close()
+    INSERT INTO resume_analysis (
+        resume_id, ats_score, keyword_match_score,
+        format_score, section_score, missing_skills,
+        recommendations
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        resume_id,
+        ats_score,
+        keyword_match_score,
+        _score(analysis, 'format_score'),
+        _score(analysis, 'section_score'),
+        analysis.get('missing_skills', ''),
+        analysis.get('recommendations', '')
+    ))
+    analysis_id = cursor.lastrowid
+    # Keep the dashboard rollups in step with the raw tables
+    record_analysis(cursor, resume_id, ats_score, keyword_match_score)
+    return analysis_id
+
+def insert_resume_with_analysis(cursor, resume_data, analysis):
+    """Insert a resume and its analysis together so the analysis gets the new resume id"""
+    resume_id = insert_resume_data(cursor, resume_data)
+    insert_analysis_data(cursor, resume_id, analysis)
+    return resume_id
 
 def save_resume_data(data):
     """Save resume data to database"""
@@ -91,33 +110,9 @@ def save_resume_data(data):
     cursor = conn.cursor()
     
     try:
-        personal_info = data.get('personal_info', {})
-        
-        cursor.execute('''
-        INSERT INTO resume_data (
-            name, email, phone, linkedin, github, portfolio,
-            summary, target_role, target_category, education, 
-            experience, projects, skills, template
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            personal_info.get('full_name', ''),
-            personal_info.get('email', ''),
-            personal_info.get('phone', ''),
-            personal_info.get('linkedin', ''),
-            personal_info.get('github', ''),
-            personal_info.get('portfolio', ''),
-            data.get('summary', ''),
-            data.get('target_role', ''),
-            data.get('target_category', ''),
-            str(data.get('education', [])),
-            str(data.get('experience', [])),
-            str(data.get('projects', [])),
-            str(data.get('skills', [])),
-            data.get('template', '')
-        ))
-        
+        resume_id = insert_resume_data(cursor, data)
         conn.commit()
-        return cursor.lastrowid
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
@@ -126,31 +121,18 @@ def save_resume_data(data):
         conn.close()
 
 def save_analysis_data(resume_id, analysis):
-    """Save resume analysis data"""
+    """Save resume analysis data and return the new analysis id"""
     conn = get_database_connection()
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO resume_analysis (
-            resume_id, ats_score, keyword_match_score,
-            format_score, section_score, missing_skills,
-            recommendations
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_id,
-            float(analysis.get('ats_score', 0)),
-            float(analysis.get('keyword_match_score', 0)),
-            float(analysis.get('format_score', 0)),
-            float(analysis.get('section_score', 0)),
-            analysis.get('missing_skills', ''),
-            analysis.get('recommendations', '')
-        ))
-        
+        analysis_id = insert_analysis_data(cursor, resume_id, analysis)
         conn.commit()
+        return analysis_id
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
         conn.rollback()
+        return None
     finally:
         conn.close()
 
@@ -292,19 +274,6 @@ def save_ai_analysis_data(resume_id, analysis_data):
     cursor = conn.cursor()
     
     try:
-        # Check if the ai_analysis table exists
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS ai_analysis (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                resume_id INTEGER,
-                model_used TEXT,
-                resume_score INTEGER,
-                job_role TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (resume_id) REFERENCES resume_data (id)
-            )
-        """)
-        
         # Insert the analysis data
         cursor.execute("""
             INSERT INTO ai_analysis (
@@ -318,6 +287,7 @@ def save_ai_analysis_data(resume_id, analysis_data):
         ))
         
         conn.commit()
+        get_ai_stats_cache().invalidate()
         return cursor.lastrowid
     except Exception as e:
         print(f"Error saving AI analysis data: {e}")
@@ -328,182 +298,29 @@ def save_ai_analysis_data(resume_id, analysis_data):
 
 def get_ai_analysis_stats():
     """Get statistics about AI analyzer usage"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Check if the ai_analysis table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master WHERE type='table' AND name='ai_analysis'
-        """)
-        
-        if not cursor.fetchone():
-            return {
-                "total_analyses": 0,
-                "model_usage": [],
-                "average_score": 0,
-                "top_job_roles": []
-            }
-        
-        # Get total number of analyses
-        cursor.execute("SELECT COUNT(*) FROM ai_analysis")
-        total_analyses = cursor.fetchone()[0]
-        
-        # Get model usage statistics
-        cursor.execute("""
-            SELECT model_used, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY model_used
-            ORDER BY count DESC
-        """)
-        model_usage = [{"model": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get average resume score
-        cursor.execute("SELECT AVG(resume_score) FROM ai_analysis")
-        average_score = cursor.fetchone()[0] or 0
-        
-        # Get top job roles
-        cursor.execute("""
-            SELECT job_role, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY job_role
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        top_job_roles = [{"role": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        return {
-            "total_analyses": total_analyses,
-            "model_usage": model_usage,
-            "average_score": round(average_score, 1),
-            "top_job_roles": top_job_roles
-        }
-    except Exception as e:
-        print(f"Error getting AI analysis stats: {e}")
-        return {
-            "total_analyses": 0,
-            "model_usage": [],
-            "average_score": 0,
-            "top_job_roles": []
-        }
-    finally:
-        conn.close()
+    stats = get_detailed_ai_analysis_stats()
+    return {
+        "total_analyses": stats["total_analyses"],
+        "model_usage": stats["model_usage"],
+        "average_score": stats["average_score"],
+        "top_job_roles": stats["top_job_roles"]
+    }
 
 def get_detailed_ai_analysis_stats():
     """Get detailed statistics about AI analyzer usage including daily trends"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
+    def compute():
+        conn = get_database_connection()
+        try:
+            return compute_ai_analysis_stats(conn)
+        finally:
+            conn.close()
+
     try:
-        # Check if the ai_analysis table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master WHERE type='table' AND name='ai_analysis'
-        """)
-        
-        if not cursor.fetchone():
-            return {
-                "total_analyses": 0,
-                "model_usage": [],
-                "average_score": 0,
-                "top_job_roles": [],
-                "daily_trend": [],
-                "score_distribution": [],
-                "recent_analyses": []
-            }
-        
-        # Get total number of analyses
-        cursor.execute("SELECT COUNT(*) FROM ai_analysis")
-        total_analyses = cursor.fetchone()[0]
-        
-        # Get model usage statistics
-        cursor.execute("""
-            SELECT model_used, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY model_used
-            ORDER BY count DESC
-        """)
-        model_usage = [{"model": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get average resume score
-        cursor.execute("SELECT AVG(resume_score) FROM ai_analysis")
-        average_score = cursor.fetchone()[0] or 0
-        
-        # Get top job roles
-        cursor.execute("""
-            SELECT job_role, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY job_role
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        top_job_roles = [{"role": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get daily trend for the last 7 days
-        cursor.execute("""
-            SELECT DATE(created_at) as date, COUNT(*) as count
-            FROM ai_analysis
-            WHERE created_at >= date('now', '-7 days')
-            GROUP BY DATE(created_at)
-            ORDER BY date
-        """)
-        daily_trend = [{"date": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get score distribution
-        score_ranges = [
-            {"min": 0, "max": 20, "range": "0-20"},
-            {"min": 21, "max": 40, "range": "21-40"},
-            {"min": 41, "max": 60, "range": "41-60"},
-            {"min": 61, "max": 80, "range": "61-80"},
-            {"min": 81, "max": 100, "range": "81-100"}
-        ]
-        
-        score_distribution = []
-        for range_info in score_ranges:
-            cursor.execute("""
-                SELECT COUNT(*) FROM ai_analysis 
-                WHERE resume_score >= ? AND resume_score <= ?
-            """, (range_info["min"], range_info["max"]))
-            count = cursor.fetchone()[0]
-            score_distribution.append({"range": range_info["range"], "count": count})
-        
-        # Get recent analyses
-        cursor.execute("""
-            SELECT model_used, resume_score, job_role, datetime(created_at) as date
-            FROM ai_analysis
-            ORDER BY created_at DESC
-            LIMIT 5
-        """)
-        recent_analyses = [
-            {
-                "model": row[0],
-                "score": row[1],
-                "job_role": row[2],
-                "date": row[3]
-            } for row in cursor.fetchall()
-        ]
-        
-        return {
-            "total_analyses": total_analyses,
-            "model_usage": model_usage,
-            "average_score": round(average_score, 1),
-            "top_job_roles": top_job_roles,
-            "daily_trend": daily_trend,
-            "score_distribution": score_distribution,
-            "recent_analyses": recent_analyses
-        }
+        # Cached briefly, so admin page reruns do not rescan ai_analysis
+        return get_ai_stats_cache().get(compute)
     except Exception as e:
         print(f"Error getting detailed AI analysis stats: {e}")
-        return {
-            "total_analyses": 0,
-            "model_usage": [],
-            "average_score": 0,
-            "top_job_roles": [],
-            "daily_trend": [],
-            "score_distribution": [],
-            "recent_analyses": []
-        }
-    finally:
-        conn.close()
+        return empty_ai_analysis_stats()
 
 def reset_ai_analysis_stats():
     """Reset AI analysis statistics by truncating the ai_analysis table"""
@@ -512,16 +329,13 @@ def reset_ai_analysis_stats():
     
     try:
         # Check if the ai_analysis table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master WHERE type='table' AND name='ai_analysis'
-        """)
-        
-        if not cursor.fetchone():
+        if 'ai_analysis' not in table_names(cursor):
             return {"success": False, "message": "AI analysis table does not exist"}
         
         # Delete all records from the ai_analysis table
         cursor.execute("DELETE FROM ai_analysis")
         conn.commit()
+        get_ai_stats_cache().invalidate()
         
         return {"success": True, "message": "AI analysis statistics have been reset successfully"}
     except Exception as e:
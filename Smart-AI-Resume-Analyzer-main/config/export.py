@@ -0,0 +1,204 @@
+"""
+Streaming export of resumes and their analyses to Excel, CSV or Parquet
+
+Rows are paged out of the database and written as they arrive: openpyxl in
+write-only mode, the csv module, or one Parquet row group per page. So
+memory stays flat however long the history is. Exports can be limited to a
+date range and to some target roles.
+
+    python -m config.export --format csv --since 2024-01-01 --role "Data Scientist" -o resumes.csv
+"""
+import io
+import os
+import csv
+import tempfile
+from datetime import date, datetime, timedelta
+
+from config.storage import streaming_cursor
+
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# Spooled to disk past this size instead of being kept in the worker's memory
+EXPORT_SPOOL_MB = int(os.getenv("EXPORT_SPOOL_MB", "8"))
+
+# (SQL expression, header, is_score)
+EXPORT_COLUMNS = [
+    ('rd.name', 'name', False),
+    ('rd.email', 'email', False),
+    ('rd.phone', 'phone', False),
+    ('rd.linkedin', 'linkedin', False),
+    ('rd.github', 'github', False),
+    ('rd.portfolio', 'portfolio', False),
+    ('rd.summary', 'summary', False),
+    ('rd.target_role', 'target_role', False),
+    ('rd.target_category', 'target_category', False),
+    ('rd.education', 'education', False),
+    ('rd.experience', 'experience', False),
+    ('rd.projects', 'projects', False),
+    ('rd.skills', 'skills', False),
+    ('ra.ats_score', 'ats_score', True),
+    ('ra.keyword_match_score', 'keyword_match_score', True),
+    ('ra.format_score', 'format_score', True),
+    ('ra.section_score', 'section_score', True),
+    ('ra.missing_skills', 'missing_skills', False),
+    ('ra.recommendations', 'recommendations', False),
+    ('rd.created_at', 'created_at', False),
+]
+
+EXPORT_HEADERS = [header for _, header, _ in EXPORT_COLUMNS]
+
+
+def _day(value):
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+def build_export_query(since=None, until=None, roles=None):
+    """SELECT for the export and its parameters; since and until are inclusive days"""
+    conditions = []
+    params = []
+    if since:
+        conditions.append('rd.created_at >= ?')
+        params.append(_day(since).strftime('%Y-%m-%d'))
+    if until:
+        # created_at carries a time, so compare against the start of the next day
+        conditions.append('rd.created_at < ?')
+        params.append((_day(until) + timedelta(days=1)).strftime('%Y-%m-%d'))
+    if roles:
+        conditions.append(f"rd.target_role IN ({', '.join('?' for _ in roles)})")
+        params.extend(roles)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    query = f"""
+        SELECT {', '.join(expression for expression, _, _ in EXPORT_COLUMNS)}
+        FROM resume_data rd
+        LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+        {where}
+        ORDER BY rd.id, ra.id
+    """
+    return query, params
+
+
+def iter_export_chunks(conn, since=None, until=None, roles=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the export rows a page of chunk_size at a time"""
+    query, params = build_export_query(since, until, roles)
+    cursor = streaming_cursor(conn, 'resume_export')
+    try:
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    finally:
+        cursor.close()
+
+
+def write_xlsx(chunks, output):
+    from openpyxl import Workbook
+
+    # Write-only sheets stream rows to disk instead of building a cell tree
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Resume Data')
+    sheet.append(EXPORT_HEADERS)
+    count = 0
+    for rows in chunks:
+        for row in rows:
+            sheet.append(row)
+        count += len(rows)
+    workbook.save(output)
+    return count
+
+
+def write_csv(chunks, output):
+    text = io.TextIOWrapper(output, encoding='utf-8', newline='')
+    writer = csv.writer(text)
+    writer.writerow(EXPORT_HEADERS)
+    count = 0
+    for rows in chunks:
+        writer.writerows(rows)
+        count += len(rows)
+    text.flush()
+    text.detach()  # Leave the caller's file open
+    return count
+
+
+def write_parquet(chunks, output):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (header, pa.float64() if is_score else pa.string()) for _, header, is_score in EXPORT_COLUMNS
+    ])
+    count = 0
+    with pq.ParquetWriter(output, schema) as writer:
+        for rows in chunks:
+            columns = list(zip(*rows))
+            arrays = [
+                pa.array(
+                    [None if value is None else float(value) if is_score else str(value) for value in values],
+                    type=field.type
+                )
+                for values, field, (_, _, is_score) in zip(columns, schema, EXPORT_COLUMNS)
+            ]
+            # One row group per page
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            count += len(rows)
+    return count
+
+
+# format -> (writer, file extension, MIME type)
+EXPORT_FORMATS = {
+    'xlsx': (write_xlsx, 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': (write_csv, 'csv', 'text/csv'),
+    'parquet': (write_parquet, 'parquet', 'application/vnd.apache.parquet'),
+}
+
+
+def export_resume_data(conn, output, fmt='xlsx', since=None, until=None, roles=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Write the filtered export to a binary file object and return the number of rows"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    writer = EXPORT_FORMATS[fmt][0]
+    return writer(iter_export_chunks(conn, since, until, roles, chunk_size), output)
+
+
+def spooled_export(conn, fmt='xlsx', since=None, until=None, roles=None):
+    """Export into a temporary file that spills to disk past EXPORT_SPOOL_MB, rewound for reading"""
+    output = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MB * 1024 * 1024)
+    try:
+        export_resume_data(conn, output, fmt, since, until, roles)
+    except Exception:
+        output.close()
+        raise
+    output.seek(0)
+    return output
+
+
+def main(argv=None):
+    import argparse
+    from config.database import get_database_connection, init_database
+
+    parser = argparse.ArgumentParser(description="Export resumes and their analyses")
+    parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='xlsx', help="Output format")
+    parser.add_argument('--since', help="First day to include (YYYY-MM-DD)")
+    parser.add_argument('--until', help="Last day to include (YYYY-MM-DD)")
+    parser.add_argument('--role', action='append', dest='roles', help="Target role to include; repeatable")
+    parser.add_argument('-o', '--output', help="Output file (default: resume_export.<format>)")
+    args = parser.parse_args(argv)
+
+    output = args.output or f"resume_export.{EXPORT_FORMATS[args.format][1]}"
+    init_database()
+    conn = get_database_connection()
+    try:
+        with open(output, 'wb') as f:
+            count = export_resume_data(conn, f, args.format, args.since, args.until, args.roles)
+        print(f"Exported {count} row(s) to {output}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+"""
+Versioned schema migrations for the resume database
+
+Each migration is applied once, in order, inside its own transaction, and
+recorded in the schema_version table. A step is either an SQL statement or a
+function taking the cursor, for data backfills. Add new steps to the end of
+MIGRATIONS; never edit a step that has already shipped.
+
+    python -m config.migrations                # apply pending migrations
+    python -m config.migrations --check-plans  # fail if a dashboard query scans a whole table
+"""
+import re
+import sys
+import ast
+import json
+
+from config.rollups import ROLLUP_TABLES, rebuild_rollups
+from config.ai_stats import AI_STATS_INDEX
+
+
+def _insert_skill_rows(cursor, resume_id, skills):
+    """resume_skills rows as of migration 3; migrations keep their own SQL so later schema changes cannot break them"""
+    from utils.skill_taxonomy import get_skill_taxonomy
+
+    cursor.executemany('''
+    INSERT INTO resume_skills (resume_id, skill_id, skill_name, skill_category)
+    VALUES (?, ?, ?, ?)
+    ''', [
+        (resume_id, skill['id'], skill['name'], skill['category'])
+        for skill in get_skill_taxonomy().resolve_all(skills)
+    ])
+
+
+def backfill_resume_skills(cursor):
+    """Normalize the skills of resumes saved before resume_skills was populated"""
+    rows = cursor.execute('''
+    SELECT id, skills FROM resume_data
+    WHERE skills IS NOT NULL AND skills NOT IN ('', '[]')
+    AND id NOT IN (SELECT resume_id FROM resume_skills WHERE resume_id IS NOT NULL)
+    ''').fetchall()
+    for resume_id, skills in rows:
+        try:
+            # Older rows store str(list)
+            skills = ast.literal_eval(skills)
+        except (ValueError, SyntaxError):
+            skills = skills.split(',')
+        if isinstance(skills, str):
+            skills = [skills]
+        _insert_skill_rows(cursor, resume_id, skills)
+
+
+def _load_blob(value):
+    """Parse a JSON or repr() blob written by the old SQLAlchemy layer"""
+    if not value:
+        return {}
+    try:
+        return json.loads(value)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return {}
+
+
+def _float_or_none(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def move_legacy_orm_rows(cursor):
+    """Move rows from the old SQLAlchemy tables (resumes, analyses, ai_analyses) into the canonical ones
+
+    The INSERTs are fixed to the schema of migration 6 instead of going through
+    config.database, whose insert paths follow the latest schema. The rollups
+    are rebuilt once at the end.
+    """
+    from config.storage import table_names
+
+    existing = table_names(cursor)
+    resume_ids = {}
+
+    if 'resumes' in existing:
+        rows = cursor.execute('SELECT id, job_role, content, created_at FROM resumes ORDER BY id').fetchall()
+        for old_id, job_role, content, created_at in rows:
+            data = _load_blob(content)
+            if not isinstance(data, dict):
+                data = {'summary': str(data)}
+            if job_role and not data.get('target_role'):
+                data['target_role'] = job_role
+            personal_info = data.get('personal_info') or {}
+            cursor.execute('''
+            INSERT INTO resume_data (
+                name, email, phone, linkedin, github, portfolio,
+                summary, target_role, target_category, education,
+                experience, projects, skills, template, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+            ''', (
+                personal_info.get('full_name', ''),
+                personal_info.get('email', ''),
+                personal_info.get('phone', ''),
+                personal_info.get('linkedin', ''),
+                personal_info.get('github', ''),
+                personal_info.get('portfolio', ''),
+                data.get('summary', ''),
+                data.get('target_role', ''),
+                data.get('target_category', ''),
+                str(data.get('education', [])),
+                str(data.get('experience', [])),
+                str(data.get('projects', [])),
+                str(data.get('skills', [])),
+                data.get('template', ''),
+                str(created_at)[:19] if created_at else None
+            ))
+            resume_ids[old_id] = cursor.lastrowid
+            skills = data.get('skills') or []
+            _insert_skill_rows(cursor, resume_ids[old_id], [skills] if isinstance(skills, str) else skills)
+        cursor.execute('DROP TABLE resumes')
+
+    if 'analyses' in existing:
+        rows = cursor.execute('SELECT resume_id, analysis_data, created_at FROM analyses ORDER BY id').fetchall()
+        for old_resume_id, analysis_data, created_at in rows:
+            data = _load_blob(analysis_data)
+            if not isinstance(data, dict):
+                data = {}
+            keyword_match = data.get('keyword_match') or {}
+            missing_skills = data.get('missing_skills', keyword_match.get('missing_skills', []))
+            recommendations = data.get('recommendations', data.get('suggestions', []))
+            cursor.execute('''
+            INSERT INTO resume_analysis (
+                resume_id, ats_score, keyword_match_score, format_score, section_score,
+                missing_skills, recommendations, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+            ''', (
+                resume_ids.get(old_resume_id),
+                _float_or_none(data.get('ats_score', 0)),
+                _float_or_none(data.get('keyword_match_score', keyword_match.get('score', 0))),
+                _float_or_none(data.get('format_score', 0)),
+                _float_or_none(data.get('section_score', 0)),
+                missing_skills if isinstance(missing_skills, str) else ','.join(missing_skills),
+                recommendations if isinstance(recommendations, str) else ','.join(recommendations),
+                str(created_at)[:19] if created_at else None
+            ))
+        cursor.execute('DROP TABLE analyses')
+
+    if 'ai_analyses' in existing:
+        rows = cursor.execute(
+            'SELECT resume_id, model_used, resume_score, job_role, created_at FROM ai_analyses ORDER BY id'
+        ).fetchall()
+        cursor.executemany('''
+        INSERT INTO ai_analysis (resume_id, model_used, resume_score, job_role, created_at)
+        VALUES (?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+        ''', [
+            (resume_ids.get(resume_id), model_used, resume_score, job_role,
+             str(created_at)[:19] if created_at else None)
+            for resume_id, model_used, resume_score, job_role, created_at in rows
+        ])
+        cursor.execute('DROP TABLE ai_analyses')
+
+    # Moved rows keep their original dates, so recount the rollups
+    rebuild_rollups(cursor)
+
+
+MIGRATIONS = [
+    (1, "Initial schema", [
+        '''
+        CREATE TABLE IF NOT EXISTS resume_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            phone TEXT NOT NULL,
+            linkedin TEXT,
+            github TEXT,
+            portfolio TEXT,
+            summary TEXT,
+            target_role TEXT,
+            target_category TEXT,
+            education TEXT,
+            experience TEXT,
+            projects TEXT,
+            skills TEXT,
+            template TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS resume_skills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            skill_name TEXT NOT NULL,
+            skill_category TEXT NOT NULL,
+            proficiency_score REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS resume_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            ats_score REAL,
+            keyword_match_score REAL,
+            format_score REAL,
+            section_score REAL,
+            missing_skills TEXT,
+            recommendations TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS admin_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            admin_email TEXT NOT NULL,
+            action TEXT NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS admin (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL UNIQUE,
+            password TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS ai_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            model_used TEXT,
+            resume_score INTEGER,
+            job_role TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+        '''
+    ]),
+    (2, "Indexes for dashboard filters, joins and groupings", [
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_target_category ON resume_data (target_category)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume_id ON resume_analysis (resume_id)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_ats_score ON resume_analysis (ats_score)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills (resume_id)',
+        'CREATE INDEX IF NOT EXISTS idx_admin_logs_timestamp ON admin_logs (timestamp)',
+        'CREATE INDEX IF NOT EXISTS idx_ai_analysis_created_at ON ai_analysis (created_at)'
+    ]),
+    (3, "Canonical skill IDs in resume_skills", [
+        'ALTER TABLE resume_skills ADD COLUMN skill_id TEXT',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_category ON resume_skills (skill_category)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_skill_id ON resume_skills (skill_id, skill_category)',
+        backfill_resume_skills
+    ]),
+    (4, "Dashboard rollup tables", [
+        '''
+        CREATE TABLE IF NOT EXISTS dashboard_daily_rollup (
+            day TEXT NOT NULL,
+            category TEXT NOT NULL,
+            resumes INTEGER NOT NULL DEFAULT 0,
+            analyses INTEGER NOT NULL DEFAULT 0,
+            ats_score_sum REAL NOT NULL DEFAULT 0,
+            keyword_score_sum REAL NOT NULL DEFAULT 0,
+            high_scoring INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, category)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS dashboard_score_histogram (
+            day TEXT NOT NULL,
+            category TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, category, bucket)
+        )
+        ''',
+        rebuild_rollups
+    ]),
+    (5, "Covering index for AI analysis statistics", [
+        AI_STATS_INDEX
+    ]),
+    (6, "Move rows from the old SQLAlchemy tables into the canonical ones", [
+        move_legacy_orm_rows
+    ]),
+    (7, "Per-analysis counters in the daily rollup", [
+        'ALTER TABLE dashboard_daily_rollup ADD COLUMN analyzed_resumes INTEGER NOT NULL DEFAULT 0',
+        'ALTER TABLE dashboard_daily_rollup ADD COLUMN high_scoring_analyses INTEGER NOT NULL DEFAULT 0',
+        # Also recounts high_scoring, which counted analyses instead of resumes
+        rebuild_rollups
+    ]),
+]
+
+# "SCAN rd" without "USING ... INDEX" reads every row of the table
+FULL_SCAN_PATTERN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+
+
+def get_schema_version(conn):
+    """Highest applied migration, 0 for a database that has never been migrated"""
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    conn.commit()
+    return conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+
+
+def run_migrations(conn, migrations=MIGRATIONS):
+    """Apply every pending migration in order; safe to call any number of times"""
+    applied = []
+    for version, description, statements in migrations:
+        if version <= get_schema_version(conn):
+            continue
+        cursor = conn.cursor()
+        try:
+            # IMMEDIATE takes the write lock, so concurrent starters apply each step once
+            cursor.execute('BEGIN IMMEDIATE')
+            current = cursor.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+            if version > current:
+                for statement in statements:
+                    if callable(statement):
+                        statement(cursor)
+                    else:
+                        cursor.execute(statement)
+                cursor.execute(
+                    'INSERT INTO schema_version (version, description) VALUES (?, ?)',
+                    (version, description)
+                )
+                applied.append(version)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"Error applying migration {version} ({description}): {str(e)}")
+            raise
+    return applied
+
+
+def full_table_scans(conn, query, params=()):
+    """Tables that the query plan reads in full, without an index
+
+    Rollup tables hold one row per day and category and are meant to be read whole.
+    """
+    plan = conn.execute(f'EXPLAIN QUERY PLAN {query}', params).fetchall()
+    scans = []
+    for row in plan:
+        match = FULL_SCAN_PATTERN.match(row[-1])
+        if match and match.group(1) not in ROLLUP_TABLES:
+            scans.append(row[-1])
+    return scans
+
+
+def check_query_plans(conn, queries):
+    """Map each query name to its full table scans; an empty dict means every query uses indexes"""
+    failures = {}
+    for name, (query, params) in queries.items():
+        scans = full_table_scans(conn, query, params)
+        if scans:
+            failures[name] = scans
+    return failures
+
+
+def main(argv=None):
+    import argparse
+    from config.storage import get_storage
+
+    parser = argparse.ArgumentParser(description="Apply schema migrations to the resume database")
+    parser.add_argument('--check-plans', action='store_true',
+                        help="Fail if a dashboard query needs a full table scan")
+    args = parser.parse_args(argv)
+
+    storage = get_storage()
+    conn = storage.connect()
+    try:
+        storage.prepare(conn)
+        applied = run_migrations(conn)
+        print(f"Schema version {get_schema_version(conn)} (applied: {applied or 'none'})")
+        if args.check_plans and storage.dialect != 'sqlite':
+            print("The query plan check reads SQLite plans; run it against a SQLite copy of the schema")
+        elif args.check_plans:
+            from dashboard.dashboard import DASHBOARD_QUERIES
+
+            failures = check_query_plans(conn, DASHBOARD_QUERIES)
+            for name, scans in failures.items():
+                print(f"{name}: {'; '.join(scans)}")
+            if failures:
+                sys.exit(1)
+            print(f"All {len(DASHBOARD_QUERIES)} dashboard queries use indexes")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
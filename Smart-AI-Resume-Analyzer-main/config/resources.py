@@ -0,0 +1,88 @@
+"""
+Process-wide registry of the app's expensive objects
+
+Streamlit reruns app.py on every interaction. Analyzers, dashboard managers,
+connection pools, keyword matchers and static assets are built here once
+per process instead, and shared by every session. Each resource may come
+with a close function; the registry closes resources in reverse creation
+order when the process exits. invalidate() closes and drops one resource,
+or all of them, so the next lookup rebuilds it.
+"""
+import atexit
+import threading
+
+
+class ResourceRegistry:
+    """Named, lazily built resources with explicit invalidation and close-on-shutdown"""
+
+    def __init__(self):
+        self._resources = {}  # name -> (value, close), in creation order
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _name_lock(self, name):
+        with self._lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name, factory, close=None):
+        """Return the resource called name, building it with factory() the first time"""
+        entry = self._resources.get(name)
+        if entry is not None:
+            return entry[0]
+        # One lock per name: a slow factory does not hold up other resources
+        with self._name_lock(name):
+            entry = self._resources.get(name)
+            if entry is None:
+                entry = (factory(), close)
+                with self._lock:
+                    self._resources[name] = entry
+            return entry[0]
+
+    def invalidate(self, name=None):
+        """Close and forget one resource, or every resource when name is None"""
+        with self._lock:
+            if name is None:
+                entries = list(self._resources.items())
+                self._resources.clear()
+            elif name in self._resources:
+                entries = [(name, self._resources.pop(name))]
+            else:
+                entries = []
+        for resource_name, (value, close) in reversed(entries):
+            if close is None:
+                continue
+            try:
+                close(value)
+            except Exception as e:
+                print(f"Error closing resource {resource_name}: {str(e)}")
+
+    def close_all(self):
+        self.invalidate()
+
+    def names(self):
+        with self._lock:
+            return list(self._resources)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_resource_registry():
+    """Return the process-wide registry; its resources are closed at interpreter exit"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ResourceRegistry()
+            atexit.register(_registry.close_all)
+        return _registry
+
+
+def get_resource(name, factory, close=None):
+    """Shortcut for get_resource_registry().get(name, factory, close)"""
+    return get_resource_registry().get(name, factory, close)
+
+
+def invalidate_resource(name=None):
+    """Shortcut for get_resource_registry().invalidate(name)"""
+    get_resource_registry().invalidate(name)
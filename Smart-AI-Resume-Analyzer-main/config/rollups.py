@@ -0,0 +1,141 @@
+"""
+Pre-aggregated dashboard counters, kept up to date as resumes and analyses are saved
+
+dashboard_daily_rollup holds one row per (day, target category) with resume and
+analysis counts, ATS/keyword score sums, the number of resumes with an analysis,
+and high scores counted both per resume and per analysis.
+dashboard_score_histogram counts analyses per (day, category, 10-point ATS bucket).
+Days come from resume_data.created_at, so the rollups agree with the raw tables.
+
+    python -m config.rollups   # rebuild both tables from resume_data / resume_analysis
+"""
+
+HIGH_SCORE_THRESHOLD = 70
+HISTOGRAM_BUCKETS = 10
+
+ROLLUP_TABLES = ('dashboard_daily_rollup', 'dashboard_score_histogram')
+
+
+def score_bucket(score):
+    """Histogram bucket of an ATS score: 0 for 0-9 ... 9 for 90-100"""
+    return min(max(int(score // 10), 0), HISTOGRAM_BUCKETS - 1)
+
+
+def score_bucket_sql(column):
+    """SQL for score_bucket(); a CASE ladder because SQLite and PostgreSQL cast reals to integers differently"""
+    ladder = ' '.join(
+        f'WHEN {column} >= {bucket * 10} THEN {bucket}' for bucket in range(HISTOGRAM_BUCKETS - 1, 0, -1)
+    )
+    return f'CASE {ladder} ELSE 0 END'
+
+
+def record_resume(cursor, resume_id):
+    """Count a newly inserted resume in its day and category"""
+    cursor.execute('''
+    INSERT INTO dashboard_daily_rollup (day, category, resumes)
+    SELECT DATE(created_at), COALESCE(target_category, 'Other'), 1
+    FROM resume_data WHERE id = ?
+    ON CONFLICT (day, category) DO UPDATE SET resumes = dashboard_daily_rollup.resumes + 1
+    ''', (resume_id,))
+
+
+def record_analysis(cursor, resume_id, ats_score, keyword_match_score):
+    """Add a newly inserted analysis to the score sums and histogram of its resume's day and category
+
+    Called once the analysis row is inserted. high_scoring and analyzed_resumes
+    count resumes, so only a resume's first (high-scoring) analysis adds to them.
+    A NULL score adds nothing to the sums and lands in bucket 0, as in rebuild_rollups.
+    """
+    high = ats_score is not None and ats_score >= HIGH_SCORE_THRESHOLD
+    cursor.execute('''
+    SELECT COUNT(*), COUNT(CASE WHEN ats_score >= ? THEN 1 END)
+    FROM resume_analysis WHERE resume_id = ?
+    ''', (HIGH_SCORE_THRESHOLD, resume_id))
+    analyses, high_analyses = cursor.fetchone()
+    cursor.execute('''
+    INSERT INTO dashboard_daily_rollup (
+        day, category, analyses, ats_score_sum, keyword_score_sum,
+        high_scoring, analyzed_resumes, high_scoring_analyses
+    )
+    SELECT DATE(created_at), COALESCE(target_category, 'Other'), 1, ?, ?, ?, ?, ?
+    FROM resume_data WHERE id = ?
+    ON CONFLICT (day, category) DO UPDATE SET
+        analyses = dashboard_daily_rollup.analyses + 1,
+        ats_score_sum = dashboard_daily_rollup.ats_score_sum + excluded.ats_score_sum,
+        keyword_score_sum = dashboard_daily_rollup.keyword_score_sum + excluded.keyword_score_sum,
+        high_scoring = dashboard_daily_rollup.high_scoring + excluded.high_scoring,
+        analyzed_resumes = dashboard_daily_rollup.analyzed_resumes + excluded.analyzed_resumes,
+        high_scoring_analyses = dashboard_daily_rollup.high_scoring_analyses + excluded.high_scoring_analyses
+    ''', (
+        ats_score or 0, keyword_match_score or 0, int(high and high_analyses == 1),
+        int(analyses == 1), int(high), resume_id
+    ))
+    cursor.execute('''
+    INSERT INTO dashboard_score_histogram (day, category, bucket, count)
+    SELECT DATE(created_at), COALESCE(target_category, 'Other'), ?, 1
+    FROM resume_data WHERE id = ?
+    ON CONFLICT (day, category, bucket) DO UPDATE SET count = dashboard_score_histogram.count + 1
+    ''', (score_bucket(ats_score or 0), resume_id))
+
+
+def rebuild_rollups(cursor):
+    """Recompute both rollup tables from the full history"""
+    cursor.execute('DELETE FROM dashboard_daily_rollup')
+    cursor.execute('DELETE FROM dashboard_score_histogram')
+    # Migrations 4 and 6 rebuild before migration 7 adds the per-analysis columns
+    cursor.execute('SELECT * FROM dashboard_daily_rollup LIMIT 0')
+    per_analysis = 'analyzed_resumes' in [column[0] for column in cursor.description]
+    cursor.execute('''
+    INSERT INTO dashboard_daily_rollup (
+        day, category, resumes, analyses, ats_score_sum, keyword_score_sum, high_scoring{columns}
+    )
+    SELECT
+        DATE(rd.created_at),
+        COALESCE(rd.target_category, 'Other'),
+        COUNT(DISTINCT rd.id),
+        COUNT(ra.id),
+        COALESCE(SUM(ra.ats_score), 0),
+        COALESCE(SUM(ra.keyword_match_score), 0),
+        COUNT(DISTINCT CASE WHEN ra.ats_score >= ? THEN rd.id END){values}
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    GROUP BY 1, 2
+    '''.format(
+        columns=', analyzed_resumes, high_scoring_analyses' if per_analysis else '',
+        values=', COUNT(DISTINCT ra.resume_id), COUNT(CASE WHEN ra.ats_score >= ? THEN 1 END)' if per_analysis else ''
+    ), (HIGH_SCORE_THRESHOLD,) * (2 if per_analysis else 1))
+    cursor.execute('''
+    INSERT INTO dashboard_score_histogram (day, category, bucket, count)
+    SELECT
+        DATE(rd.created_at),
+        COALESCE(rd.target_category, 'Other'),
+        {bucket},
+        COUNT(*)
+    FROM resume_analysis ra
+    JOIN resume_data rd ON rd.id = ra.resume_id
+    GROUP BY 1, 2, 3
+    '''.format(bucket=score_bucket_sql('COALESCE(ra.ats_score, 0)')))
+
+
+def main():
+    from config.database import get_database_connection, init_database
+
+    init_database()
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        rebuild_rollups(cursor)
+        conn.commit()
+        days = cursor.execute('SELECT COUNT(DISTINCT day) FROM dashboard_daily_rollup').fetchone()[0]
+        print(f"Rebuilt dashboard rollups for {days} day(s)")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error rebuilding dashboard rollups: {str(e)}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
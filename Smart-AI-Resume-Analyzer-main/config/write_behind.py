@@ -0,0 +1,175 @@
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+from config.resources import get_resource
+from config.storage import get_storage
+
+# Write-behind tuning, overridable from the environment
+WRITE_QUEUE_SIZE = int(os.getenv("WRITE_QUEUE_SIZE", "1000"))
+WRITE_BATCH_SIZE = int(os.getenv("WRITE_BATCH_SIZE", "100"))
+WRITE_ENQUEUE_TIMEOUT = float(os.getenv("WRITE_ENQUEUE_TIMEOUT", "2"))
+# 'async' returns as soon as a write is queued, 'sync' waits until it is committed
+WRITE_DURABILITY = os.getenv("WRITE_DURABILITY", "async")
+
+_STOP = object()
+
+
+class WriteBehindWriter:
+    """Single background thread that drains a bounded queue of inserts and commits them in batches
+
+    A job is a function taking an open cursor plus its arguments, e.g.
+    insert_resume_with_analysis. submit() returns a Future that resolves to the
+    job's return value once its batch has committed, or raises the job's error;
+    stats() counts failures and keeps the last one. When the queue stays full
+    for longer than enqueue_timeout the caller writes the job itself, so bursts
+    slow callers down instead of dropping data.
+
+    The writer holds the storage it writes to. Built inside the registry
+    factory, that storage is registered first and so closed after the writer.
+    """
+
+    def __init__(self, max_queue=WRITE_QUEUE_SIZE, batch_size=WRITE_BATCH_SIZE,
+                 enqueue_timeout=WRITE_ENQUEUE_TIMEOUT, durability=WRITE_DURABILITY, storage=None):
+        if durability not in ('async', 'sync'):
+            raise ValueError(f"Unknown write durability: {durability}")
+        self.storage = storage or get_storage()
+        self.batch_size = batch_size
+        self.enqueue_timeout = enqueue_timeout
+        self.durability = durability
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.overflowed = 0
+        self.last_error = None
+
+    def _start(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write-behind writer is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+                self._thread.start()
+
+    def submit(self, job, *args):
+        """Queue a write; waits for the commit only in 'sync' durability mode"""
+        self._start()
+        future = Future()
+        try:
+            self._queue.put((job, args, future), timeout=self.enqueue_timeout)
+        except queue.Full:
+            # Backpressure: the writer is behind, so write in the caller's thread
+            self.overflowed += 1
+            self._write_batch([(job, args, future)])
+        if self.durability == 'sync':
+            future.result()
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stop = False
+            # Take whatever else is already waiting, up to one batch
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        """Run every job of a batch in one transaction, isolating failures with savepoints"""
+        results = []
+        conn = self.storage.connect()
+        try:
+            cursor = conn.cursor()
+            # Explicit BEGIN so releasing a job's savepoint does not commit on its own
+            cursor.execute('BEGIN')
+            for job, args, future in batch:
+                cursor.execute('SAVEPOINT write_behind_job')
+                try:
+                    results.append((future, job(cursor, *args), None))
+                    cursor.execute('RELEASE SAVEPOINT write_behind_job')
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO SAVEPOINT write_behind_job')
+                    cursor.execute('RELEASE SAVEPOINT write_behind_job')
+                    print(f"Error in queued database write: {str(e)}")
+                    results.append((future, None, e))
+            conn.commit()
+            self.batches += 1
+        except Exception as e:
+            print(f"Error committing queued database writes: {str(e)}")
+            conn.rollback()
+            results = [(future, None, error or e) for future, _, error in results]
+            results += [(future, None, e) for _, _, future in batch[len(results):]]
+        finally:
+            conn.close()
+
+        for future, result, error in results:
+            if error is None:
+                self.written += 1
+                future.set_result(result)
+            else:
+                self.failed += 1
+                self.last_error = f"{type(error).__name__}: {error}"
+                future.set_exception(error)
+
+    def flush(self, timeout=None):
+        """Wait until everything queued so far has been committed"""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+
+        def wait():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=wait, daemon=True).start()
+        return done.wait(timeout)
+
+    def close(self, timeout=30):
+        """Flush pending writes and stop the writer thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+            # The final batch may have reopened a connection after the pool was closed
+            self.storage.close()
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize(),
+            'written': self.written,
+            'failed': self.failed,
+            'batches': self.batches,
+            'overflowed': self.overflowed,
+            'last_error': self.last_error
+        }
+
+
+def get_write_behind_writer():
+    """Return the process-wide writer; pending writes are flushed at interpreter exit"""
+    return get_resource('write_behind_writer', WriteBehindWriter, WriteBehindWriter.close)
@@ -3,11 +3,70 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from config.database import get_database_connection
+from config.rollups import HISTOGRAM_BUCKETS
 import plotly.express as px
 
+# Dashboard counters come from the rollup tables maintained by config/rollups.py,
+# so each query reads one row per day and category instead of every resume
+RESUME_METRICS_QUERY = """
+    SELECT 
+        SUM(resumes) as total_resumes,
+        ROUND(SUM(ats_score_sum) / NULLIF(SUM(analyses), 0), 1) as avg_ats_score,
+        ROUND(SUM(keyword_score_sum) / NULLIF(SUM(analyses), 0), 1) as avg_keyword_score,
+        SUM(high_scoring) as high_scoring
+    FROM dashboard_daily_rollup
+    WHERE day >= ?
+"""
+
+WEEKLY_TRENDS_QUERY = """
+    SELECT day as date, SUM(resumes) as count
+    FROM dashboard_daily_rollup
+    WHERE day >= ? AND day < ?
+    GROUP BY day
+"""
+
+# Same numbers as joining resume_data with resume_analysis: a category counts its
+# joined rows (one per analysis, one per resume without any) and its success rate
+# is the share of those rows scoring 70 or more
+JOB_CATEGORY_QUERY = """
+    SELECT 
+        category,
+        SUM(resumes + analyses - analyzed_resumes) as count,
+        ROUND(SUM(high_scoring_analyses) * 100.0 / NULLIF(SUM(resumes + analyses - analyzed_resumes), 0), 1) as success_rate
+    FROM dashboard_daily_rollup
+    GROUP BY category
+    ORDER BY count DESC
+    LIMIT 5
+"""
+
+SCORE_HISTOGRAM_QUERY = """
+    SELECT bucket, SUM(count) as count
+    FROM dashboard_score_histogram
+    WHERE day >= ?
+    GROUP BY bucket
+    ORDER BY bucket
+"""
+
+# Skills are categorized by the taxonomy when saved, so this is an index-only aggregate
+SKILL_DISTRIBUTION_QUERY = """
+    SELECT skill_category as category, COUNT(*) as count
+    FROM resume_skills
+    GROUP BY skill_category
+    ORDER BY count DESC
+"""
+
+# Checked by `python -m config.migrations --check-plans` with representative parameters
+DASHBOARD_QUERIES = {
+    'resume_metrics': (RESUME_METRICS_QUERY, ('2000-01-01',)),
+    'weekly_trends': (WEEKLY_TRENDS_QUERY, ('2000-01-01', '2000-01-08')),
+    'job_category_stats': (JOB_CATEGORY_QUERY, ()),
+    'score_histogram': (SCORE_HISTOGRAM_QUERY, ('2000-01-01',)),
+    'skill_distribution': (SKILL_DISTRIBUTION_QUERY, ()),
+}
+
 class DashboardManager:
     def __init__(self):
-        self.conn = get_database_connection()
+        # Shared by every session, so no connection is kept; each query borrows one from the pool
         self.colors = {
             'primary': '#4CAF50',
             'secondary': '#2196F3',
@@ -22,92 +81,68 @@ class DashboardManager:
             'subtext': '#B0B0B0'
         }
 
+    def _fetch_all(self, query, params=()):
+        conn = get_database_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            conn.close()
+
     def get_resume_metrics(self):
-        cursor = self.conn.cursor()
         now = datetime.now()
         start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_month = now.replace(day=1)
+        # Rollups are per day, so every period starts at midnight: This Week counts
+        # all of Monday and This Month all of the 1st
+        start_of_week = start_of_day - timedelta(days=now.weekday())
+        start_of_month = start_of_day.replace(day=1)
         metrics = {}
-        for period, start_date in [
-            ('Today', start_of_day),
-            ('This Week', start_of_week),
-            ('This Month', start_of_month),
-            ('All Time', datetime(2000, 1, 1))
-        ]:
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT rd.id) as total_resumes,
-                    ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                    ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                    COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                FROM resume_data rd
-                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                WHERE rd.created_at >= ?
-            """, (start_date.strftime('%Y-%m-%d %H:%M:%S'),))
-            row = cursor.fetchone()
-            metrics[period] = {
-                'total': row[0] or 0,
-                'ats_score': row[1] or 0,
-                'keyword_score': row[2] or 0,
-                'high_scoring': row[3] or 0
-            }
+        conn = get_database_connection()
+        try:
+            cursor = conn.cursor()
+            for period, start_date in [
+                ('Today', start_of_day),
+                ('This Week', start_of_week),
+                ('This Month', start_of_month),
+                ('All Time', datetime(2000, 1, 1))
+            ]:
+                cursor.execute(RESUME_METRICS_QUERY, (start_date.strftime('%Y-%m-%d'),))
+                row = cursor.fetchone()
+                metrics[period] = {
+                    'total': row[0] or 0,
+                    'ats_score': row[1] or 0,
+                    'keyword_score': row[2] or 0,
+                    'high_scoring': row[3] or 0
+                }
+        finally:
+            conn.close()
         return metrics
 
     def get_skill_distribution(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ',' FROM resume_data
-                UNION ALL
-                SELECT substr(rest, 0, instr(rest, ',')), substr(rest, instr(rest, ',') + 1)
-                FROM split WHERE rest <> ''
-            ),
-            SkillCategories AS (
-                SELECT 
-                    CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' THEN 'Management'
-                        ELSE 'Other'
-                    END as category, COUNT(*) as count
-                FROM split
-                WHERE skill <> ''
-                GROUP BY category
-            )
-            SELECT category, count FROM SkillCategories ORDER BY count DESC
-        """)
-        categories, counts = zip(*cursor.fetchall()) if cursor.rowcount else ([], [])
+        rows = self._fetch_all(SKILL_DISTRIBUTION_QUERY)
+        categories, counts = zip(*rows) if rows else ([], [])
         return categories, counts
 
     def get_weekly_trends(self):
-        cursor = self.conn.cursor()
         now = datetime.now()
         dates = [(now - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(6, -1, -1)]
-        submissions = []
-        for date in dates:
-            cursor.execute("SELECT COUNT(*) FROM resume_data WHERE DATE(created_at) = DATE(?)", (date,))
-            submissions.append(cursor.fetchone()[0])
+        end = (now + timedelta(days=1)).strftime('%Y-%m-%d')
+        counts = dict(self._fetch_all(WEEKLY_TRENDS_QUERY, (dates[0], end)))
+        submissions = [counts.get(date, 0) for date in dates]
         return [d[-3:] for d in dates], submissions
 
     def get_job_category_stats(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT 
-                COALESCE(target_category, 'Other') as category,
-                COUNT(*) as count,
-                ROUND(AVG(CASE WHEN ra.ats_score >= 70 THEN 1 ELSE 0 END) * 100, 1) as success_rate
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY category
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        categories, rates = zip(*[(row[0], row[2]) for row in cursor.fetchall()])
+        categories, rates = zip(*[(row[0], row[2]) for row in self._fetch_all(JOB_CATEGORY_QUERY)])
         return categories, rates
 
+    def get_score_histogram(self, since=datetime(2000, 1, 1)):
+        """ATS score distribution in 10-point buckets for analyses since a date"""
+        counts = dict(self._fetch_all(SCORE_HISTOGRAM_QUERY, (since.strftime('%Y-%m-%d'),)))
+        labels = [f"{bucket * 10}-{bucket * 10 + 9}" for bucket in range(HISTOGRAM_BUCKETS)]
+        labels[-1] = f"{(HISTOGRAM_BUCKETS - 1) * 10}-100"
+        return labels, [counts.get(bucket, 0) for bucket in range(HISTOGRAM_BUCKETS)]
+
     def create_submission_trends_chart(self):
         dates, submissions = self.get_weekly_trends()
         fig = go.Figure()
@@ -150,3 +185,24 @@ class DashboardManager:
         fig.update_xaxes(title_text="Job Category", color=self.colors['text'])
         fig.update_yaxes(title_text="Success Rate (%)", color=self.colors['text'])
         return fig
+
+    def create_score_distribution_chart(self):
+        labels, counts = self.get_score_histogram()
+        fig = go.Figure(go.Bar(
+            x=labels,
+            y=counts,
+            marker_color=self.colors['primary'],
+            text=counts,
+            textposition='auto',
+        ))
+        fig.update_layout(
+            title="ATS Score Distribution",
+            paper_bgcolor=self.colors['card'],
+            plot_bgcolor=self.colors['card'],
+            font={'color': self.colors['text']},
+            height=300,
+            margin=dict(l=20, r=20, t=50, b=20)
+        )
+        fig.update_xaxes(title_text="ATS Score", color=self.colors['text'])
+        fig.update_yaxes(title_text="Number of Analyses", color=self.colors['text'])
+        return fig
@@ -1,62 +1,74 @@
 import streamlit as st
-import sqlite3
 from datetime import datetime
-import pandas as pd
 import time
 
+from config.storage import get_storage
+
 class FeedbackManager:
-    def __init__(self):
-        self.db_path = "feedback/feedback.db"
+    def __init__(self, storage=None):
+        # Local SQLite file by default, the shared PostgreSQL database when DATABASE_URL is set
+        self.storage = storage or get_storage('feedback')
         self.setup_database()
 
     def setup_database(self):
         """Create feedback table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS feedback (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                rating INTEGER,
-                usability_score INTEGER,
-                feature_satisfaction INTEGER,
-                missing_features TEXT,
-                improvement_suggestions TEXT,
-                user_experience TEXT,
-                timestamp DATETIME
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        conn = self.storage.connect()
+        try:
+            c = conn.cursor()
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS feedback (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    rating INTEGER,
+                    usability_score INTEGER,
+                    feature_satisfaction INTEGER,
+                    missing_features TEXT,
+                    improvement_suggestions TEXT,
+                    user_experience TEXT,
+                    timestamp DATETIME
+                )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
 
     def save_feedback(self, feedback_data):
         """Save feedback to database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO feedback (
-                rating, usability_score, feature_satisfaction,
-                missing_features, improvement_suggestions,
-                user_experience, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            feedback_data['rating'],
-            feedback_data['usability_score'],
-            feedback_data['feature_satisfaction'],
-            feedback_data['missing_features'],
-            feedback_data['improvement_suggestions'],
-            feedback_data['user_experience'],
-            datetime.now()
-        ))
-        conn.commit()
-        conn.close()
+        conn = self.storage.connect()
+        try:
+            c = conn.cursor()
+            c.execute('''
+                INSERT INTO feedback (
+                    rating, usability_score, feature_satisfaction,
+                    missing_features, improvement_suggestions,
+                    user_experience, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                feedback_data['rating'],
+                feedback_data['usability_score'],
+                feedback_data['feature_satisfaction'],
+                feedback_data['missing_features'],
+                feedback_data['improvement_suggestions'],
+                feedback_data['user_experience'],
+                datetime.now()
+            ))
+            conn.commit()
+        finally:
+            conn.close()
 
     def get_feedback_stats(self):
         """Get feedback statistics"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query("SELECT * FROM feedback", conn)
-        conn.close()
+        conn = self.storage.connect()
+        try:
+            c = conn.cursor()
+            c.execute('''
+                SELECT AVG(rating), AVG(usability_score), AVG(feature_satisfaction), COUNT(*)
+                FROM feedback
+            ''')
+            avg_rating, avg_usability, avg_satisfaction, total = c.fetchone()
+        finally:
+            conn.close()
         
-        if df.empty:
+        if not total:
             return {
                 'avg_rating': 0,
                 'avg_usability': 0,
@@ -65,119 +77,14 @@ class FeedbackManager:
             }
         
         return {
-            'avg_rating': df['rating'].mean(),
-            'avg_usability': df['usability_score'].mean(),
-            'avg_satisfaction': df['feature_satisfaction'].mean(),
-            'total_responses': len(df)
+            'avg_rating': float(avg_rating or 0),
+            'avg_usability': float(avg_usability or 0),
+            'avg_satisfaction': float(avg_satisfaction or 0),
+            'total_responses': total
         }
 
     def render_feedback_form(self):
-        """Render the feedback form"""
-        st.markdown("""
-            <style>
-            @import url('https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css');
-            
-            .feedback-container {
-                background: rgba(255, 255, 255, 0.05);
-                backdrop-filter: blur(10px);
-                padding: 30px;
-                border-radius: 20px;
-                margin: 20px 0;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-            }
-            
-            .feedback-header {
-                color: #E0E0E0;
-                font-size: 1.5em;
-                font-weight: 600;
-                margin-bottom: 25px;
-                text-align: center;
-                padding: 15px;
-                background: linear-gradient(135deg, #4CAF50, #2196F3);
-                border-radius: 12px;
-                box-shadow: 0 4px 15px rgba(76, 175, 80, 0.2);
-            }
-            
-            .feedback-section {
-                margin: 20px 0;
-                padding: 20px;
-                border-radius: 15px;
-                background: rgba(255, 255, 255, 0.03);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-            }
-            
-            .feedback-section:hover {
-                transform: translateY(-5px);
-                box-shadow: 0 5px 15px rgba(0, 0, 0, 0.2);
-            }
-            
-            .feedback-label {
-                color: #E0E0E0;
-                font-size: 1.1em;
-                font-weight: 500;
-                margin-bottom: 10px;
-            }
-            
-            .star-rating {
-                font-size: 24px;
-                color: #FFD700;
-                cursor: pointer;
-                transition: transform 0.2s ease;
-            }
-            
-            .star-rating:hover {
-                transform: scale(1.1);
-            }
-            
-            .rating-container {
-                display: flex;
-                align-items: center;
-                gap: 10px;
-                margin: 15px 0;
-            }
-            
-            .submit-button {
-                background: linear-gradient(135deg, #4CAF50, #2196F3);
-                color: white;
-                padding: 12px 25px;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-                width: 100%;
-                margin-top: 20px;
-            }
-            
-            .submit-button:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(33, 150, 243, 0.3);
-            }
-            
-            .textarea-container {
-                background: rgba(255, 255, 255, 0.03);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 10px;
-                margin-top: 10px;
-            }
-            
-            .textarea-container textarea {
-                width: 100%;
-                min-height: 100px;
-                background: transparent;
-                border: none;
-                color: #E0E0E0;
-                font-size: 1em;
-                resize: vertical;
-            }
-            </style>
-            """, unsafe_allow_html=True)
-
+        """Render the feedback form; its styles are part of the global stylesheet (style/feedback.css)"""
         st.markdown('<div class="feedback-container">', unsafe_allow_html=True)
         st.markdown('<h2 class="feedback-header">📝 Share Your Feedback</h2>', unsafe_allow_html=True)
 
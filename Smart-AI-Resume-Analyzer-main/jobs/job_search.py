@@ -14,6 +14,25 @@ from .companies import get_featured_companies, get_market_insights
 from .linkedin_scraper import render_linkedin_scraper
 from streamlit_extras.add_vertical_space import add_vertical_space
 from streamlit_option_menu import option_menu
+from string import Template
+from ui_components import fill_template
+
+# Card markup, compiled once; styles live in style/jobs.css
+COMPANY_CARD_TEMPLATE = Template(
+    '<a href="$url" target="_blank" style="text-decoration: none; color: inherit;">'
+    '<div class="company-card"><div class="company-header">'
+    '<i class="$icon company-icon" style="color: $color"></i><h3 style="margin: 0;">$name</h3></div>'
+    '<p style="margin: 0.5rem 0; color: #888;">$description</p>'
+    '<div class="company-categories">$categories</div></div></a>'
+)
+COMPANY_CATEGORY_TEMPLATE = Template('<span class="company-category">$category</span>')
+
+JOB_CARD_TEMPLATE = Template(
+    '<div class="result-card"><div class="portal-name">'
+    '<i class="$icon" style="color: $color"></i> $portal</div>'
+    '<p>$title</p>'
+    '<a href="$url" target="_blank" class="portal-link">View Jobs on $portal →</a></div>'
+)
 
 def filter_suggestions(query: str, suggestions: List[Dict]) -> List[Dict]:
     """Filter suggestions based on user input"""
@@ -74,48 +93,6 @@ def get_filter_options():
 
 def render_company_section():
     """Render the featured companies section"""
-    st.markdown("""
-        <style>
-        .company-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-            gap: 1rem;
-            padding: 1rem 0;
-        }
-        .company-card {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 10px;
-            padding: 1rem;
-            transition: transform 0.2s;
-            cursor: pointer;
-        }
-        .company-card:hover {
-            transform: translateY(-5px);
-            background: rgba(255, 255, 255, 0.08);
-        }
-        .company-header {
-            display: flex;
-            align-items: center;
-            margin-bottom: 0.5rem;
-        }
-        .company-icon {
-            font-size: 1.5rem;
-            margin-right: 0.5rem;
-        }
-        .company-categories {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.5rem;
-            margin-top: 0.5rem;
-        }
-        .company-category {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 0.2rem 0.5rem;
-            border-radius: 15px;
-            font-size: 0.8rem;
-        }
-        </style>
-    """, unsafe_allow_html=True)
 
     # Featured Companies
     st.markdown("### 🏢 Featured Companies")
@@ -129,20 +106,15 @@ def render_company_section():
             st.markdown('<div class="company-grid">', unsafe_allow_html=True)
             
             for company in companies:
-                st.markdown(f"""
-                    <a href="{company['careers_url']}" target="_blank" style="text-decoration: none; color: inherit;">
-                        <div class="company-card">
-                            <div class="company-header">
-                                <i class="{company['icon']} company-icon" style="color: {company['color']}"></i>
-                                <h3 style="margin: 0;">{company['name']}</h3>
-                            </div>
-                            <p style="margin: 0.5rem 0; color: #888;">{company['description']}</p>
-                            <div class="company-categories">
-                                {' '.join(f'<span class="company-category">{cat}</span>' for cat in company['categories'])}
-                            </div>
-                        </div>
-                    </a>
-                """, unsafe_allow_html=True)
+                categories = ' '.join(
+                    fill_template(COMPANY_CATEGORY_TEMPLATE, category=cat) for cat in company['categories']
+                )
+                st.markdown(fill_template(
+                    COMPANY_CARD_TEMPLATE,
+                    url=company['careers_url'], icon=company['icon'], color=company['color'],
+                    name=company['name'], description=company['description'],
+                    markup={'categories': categories}
+                ), unsafe_allow_html=True)
             
             st.markdown('</div>', unsafe_allow_html=True)
 
@@ -150,90 +122,6 @@ def render_market_insights():
     """Render job market insights section"""
     insights = get_market_insights()
     
-    st.markdown("""
-        <style>
-        .insights-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-            gap: 1rem;
-            padding: 1rem 0;
-        }
-        .insight-card {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 10px;
-            padding: 1rem;
-            text-align: center;
-            transition: transform 0.3s ease, background 0.3s ease;
-        }
-        .insight-card:hover {
-            transform: translateY(-5px);
-            background: rgba(255, 255, 255, 0.08);
-        }
-        .insight-icon {
-            font-size: 2rem;
-            margin-bottom: 0.5rem;
-            color: #00bfa5;
-        }
-        .growth-text {
-            color: #00c853;
-            font-weight: bold;
-        }
-        .salary-card {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 15px;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            transition: all 0.3s ease;
-            border-left: 4px solid #00bfa5;
-        }
-        .salary-card:hover {
-            transform: translateX(10px);
-            background: rgba(255, 255, 255, 0.08);
-        }
-        .salary-header {
-            display: flex;
-            align-items: center;
-            margin-bottom: 1rem;
-        }
-        .role-icon {
-            font-size: 1.5rem;
-            margin-right: 1rem;
-            color: #00bfa5;
-        }
-        .salary-details {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-top: 0.5rem;
-        }
-        .salary-tag {
-            background: rgba(0, 191, 165, 0.1);
-            color: #00bfa5;
-            padding: 0.3rem 0.8rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-        }
-        .experience-tag {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 0.3rem 0.8rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-        }
-        .role-title {
-            font-size: 1.2rem;
-            font-weight: bold;
-            margin: 0;
-        }
-        .salary-range {
-            font-size: 1.1rem;
-            color: #00bfa5;
-            font-weight: bold;
-        }
-        .role-icons {
-            font-family: "Font Awesome 5 Free";
-        }
-        </style>
-    """, unsafe_allow_html=True)
 
     st.markdown("### 📊 Job Market Insights")
     
@@ -304,26 +192,6 @@ def render_job_search():
     
     # Job Search Section
     with st.container():
-        st.markdown("""
-            <style>
-            .search-container {
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-                padding: 20px;
-                margin-bottom: 20px;
-            }
-            .search-title {
-                color: #00bfa5;
-                font-weight: bold;
-                margin-bottom: 5px;
-            }
-            .search-description {
-                color: #888;
-                font-size: 0.9rem;
-                margin-bottom: 20px;
-            }
-            </style>
-        """, unsafe_allow_html=True)
         
         st.markdown('<div class="search-container">', unsafe_allow_html=True)
         
@@ -439,56 +307,15 @@ def render_job_search():
                     results = job_portal.search_jobs(job_query, location, experience)
                     
                     if results:
-                        st.markdown("""
-                            <style>
-                            .result-card {
-                                background: rgba(255, 255, 255, 0.05);
-                                border-radius: 10px;
-                                padding: 15px;
-                                margin-bottom: 10px;
-                                border-left: 4px solid #00bfa5;
-                                transition: transform 0.2s;
-                            }
-                            .result-card:hover {
-                                transform: translateX(5px);
-                                background: rgba(255, 255, 255, 0.08);
-                            }
-                            .portal-name {
-                                color: #00bfa5;
-                                font-weight: bold;
-                                font-size: 1.2rem;
-                            }
-                            .portal-link {
-                                display: inline-block;
-                                background: #00bfa5;
-                                color: white !important;
-                                padding: 5px 15px;
-                                border-radius: 5px;
-                                text-decoration: none;
-                                margin-top: 10px;
-                                font-weight: bold;
-                            }
-                            .portal-link:hover {
-                                background: #00a589;
-                            }
-                            </style>
-                        """, unsafe_allow_html=True)
                         
                         st.markdown("### 🎯 Job Search Results")
                         for result in results:
                             with st.container():
-                                st.markdown(f"""
-                                <div class="result-card">
-                                    <div class="portal-name">
-                                        <i class="{result["icon"]}" style="color: {result["color"]}"></i>
-                                        {result["portal"]}
-                                    </div>
-                                    <p>{result["title"]}</p>
-                                    <a href="{result["url"]}" target="_blank" class="portal-link">
-                                        View Jobs on {result["portal"]} →
-                                    </a>
-                                </div>
-                                """, unsafe_allow_html=True)
+                                st.markdown(fill_template(
+                                    JOB_CARD_TEMPLATE,
+                                    icon=result["icon"], color=result["color"], portal=result["portal"],
+                                    title=result["title"], url=result["url"]
+                                ), unsafe_allow_html=True)
                     else:
                         st.warning("No results found. Try different search terms or filters.")
                 else:
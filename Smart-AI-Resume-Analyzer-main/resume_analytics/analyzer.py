@@ -1,14 +1,122 @@
-import spacy
+import os
+import time
 from collections import Counter
 from datetime import datetime
 
+from config.resources import get_resource
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+
+# 'full' runs every component of the model, 'parser' only what sentence
+# boundaries need, 'fast' splits sentences on punctuation with no model at all
+SPACY_PIPELINE = os.getenv("SPACY_PIPELINE", "parser")
+PIPELINE_MODES = ('full', 'parser', 'fast')
+
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "32"))
+
+# The analysis reads sentence boundaries, like_num and token text, never tags, lemmas or entities
+UNUSED_COMPONENTS = ['tagger', 'attribute_ruler', 'lemmatizer', 'ner', 'senter']
+
+# Spellings this short ('c', 'r', 'ai', 'ml') are also initials and ordinary words, so
+# they only count inside a skill list: next to a list separator, in a sentence that
+# mentions another skill ('Languages: C, R, Python' but not 'AI Projects' or 'Plan B')
+SHORT_SKILL_LENGTH = 2
+LIST_SEPARATORS = {',', '/', '|', ';', '&', '(', ')', '•', '·', 'and', 'or'}
+
+
+def load_pipeline(mode=SPACY_PIPELINE, model=SPACY_MODEL):
+    """Load a spaCy pipeline trimmed for the analysis"""
+    import spacy
+
+    if mode == 'full':
+        return spacy.load(model)
+    if mode == 'parser':
+        # The dependency parser (and the tok2vec it listens to) sets sentence boundaries
+        return spacy.load(model, exclude=UNUSED_COMPONENTS)
+    if mode == 'fast':
+        # Same English tokenizer and lexical attributes, no weights to load or run
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        return nlp
+    raise ValueError(f"Unknown spaCy pipeline mode {mode!r}; expected one of {', '.join(PIPELINE_MODES)}")
+
+
+def get_nlp(mode=SPACY_PIPELINE, model=SPACY_MODEL):
+    """Return the process-wide pipeline for a mode, loading it on first use"""
+    return get_resource(f'spacy:{model}:{mode}', lambda: load_pipeline(mode, model))
+
+
+class SkillExtractor:
+    """Finds every skill of the shared taxonomy in a doc with spaCy PhraseMatchers
+
+    Every canonical name and alias, of any number of words, is compiled once
+    into the matchers' hash tables. A doc is then matched in one pass over
+    its tokens, so the cost does not grow with the size of the taxonomy.
+    """
+
+    def __init__(self, nlp, taxonomy=None):
+        from spacy.matcher import PhraseMatcher
+        from utils.skill_taxonomy import get_skill_taxonomy
+
+        self.taxonomy = taxonomy or get_skill_taxonomy()
+        self.matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+        self.short_matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+        for spelling, skill_id in self.taxonomy.spellings():
+            matcher = self.short_matcher if len(spelling) <= SHORT_SKILL_LENGTH else self.matcher
+            matcher.add(skill_id, [nlp.make_doc(spelling)])
+
+    @staticmethod
+    def _next_to_separator(span):
+        doc = span.doc
+        before = doc[span.start - 1].lower_ if span.start > 0 else ''
+        after = doc[span.end].lower_ if span.end < len(doc) else ''
+        return before in LIST_SEPARATORS or after in LIST_SEPARATORS
+
+    def extract(self, doc):
+        """Canonical names of the skills mentioned in the doc"""
+        from spacy.util import filter_spans
+
+        spans = list(self.matcher(doc, as_spans=True))
+        listed = [span for span in self.short_matcher(doc, as_spans=True) if self._next_to_separator(span)]
+        for span in listed:
+            sentence = span.sent
+            if any(other is not span and sentence.start <= other.start and other.end <= sentence.end
+                   for other in spans + listed):
+                spans.append(span)
+        # The longest match wins: 'React Native' is not also 'React'
+        return {self.taxonomy.skills[span.label_]['name'] for span in filter_spans(spans)}
+
+
+def get_skill_extractor(mode=SPACY_PIPELINE, model=SPACY_MODEL):
+    """Return the process-wide extractor for a pipeline, compiling it on first use"""
+    return get_resource(f'skill_extractor:{model}:{mode}', lambda: SkillExtractor(get_nlp(mode, model)))
+
+
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, mode=SPACY_PIPELINE, model=SPACY_MODEL):
+        self.mode = mode
+        self.model = model
+
+    @property
+    def nlp(self):
+        # Shared by every analyzer, so creating one costs nothing
+        return get_nlp(self.mode, self.model)
+
+    @property
+    def skill_extractor(self):
+        return get_skill_extractor(self.mode, self.model)
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
+        return self._analyze_doc(self.nlp(resume_text))
+
+    def analyze_many(self, resume_texts, batch_size=SPACY_BATCH_SIZE, n_process=1):
+        """Analyze many resumes, streamed through nlp.pipe; yields results in input order"""
+        for doc in self.nlp.pipe(resume_texts, batch_size=batch_size, n_process=n_process):
+            yield self._analyze_doc(doc)
+
+    def _analyze_doc(self, doc):
+        resume_text = doc.text
         
         # Basic metrics
         word_count = len(resume_text.split())
@@ -42,24 +150,7 @@ class ResumeAnalyzer:
     
     def _extract_skills(self, doc):
         """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        return self.skill_extractor.extract(doc)
     
     def _analyze_experience(self, doc):
         """Analyze years of experience"""
@@ -134,3 +225,81 @@ class ResumeAnalyzer:
             })
             
         return suggestions
+
+
+SAMPLE_RESUME = """John Doe
+Senior Software Engineer with 6 years of experience building data platforms.
+
+Experience
+Led a team of 5 engineers to migrate services to AWS and Kubernetes. Cut deployment time by 40%.
+Built REST APIs in Python and Node.js serving 2 million requests per day.
+Designed SQL schemas and analytics dashboards for the sales team.
+
+Skills
+Python, Java, JavaScript, React, SQL, Docker, Kubernetes, Git, machine learning, data science
+
+Education
+B.Sc. Computer Science, 2016. Graduated with honours.
+"""
+
+
+def _load_texts(paths):
+    texts = []
+    for path in paths:
+        if os.path.isdir(path):
+            texts.extend(_load_texts(sorted(os.path.join(path, name) for name in os.listdir(path))))
+        elif path.lower().endswith('.txt'):
+            with open(path, encoding='utf-8', errors='replace') as f:
+                texts.append(f.read())
+    return texts
+
+
+def benchmark(texts, modes=PIPELINE_MODES, model=SPACY_MODEL, batch_size=SPACY_BATCH_SIZE, n_process=1):
+    """Compare load time and docs/sec of each pipeline mode, one at a time and through analyze_many"""
+    results = {}
+    for mode in modes:
+        analyzer = ResumeAnalyzer(mode, model)
+        start = time.perf_counter()
+        analyzer.nlp
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single = [analyzer.analyze_resume(text) for text in texts]
+        single_rate = len(texts) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batched = list(analyzer.analyze_many(texts, batch_size=batch_size, n_process=n_process))
+        batch_rate = len(texts) / (time.perf_counter() - start)
+
+        sentences = sum(result['metrics']['sentence_count'] for result in batched) / len(batched)
+        assert [r['metrics'] for r in single] == [r['metrics'] for r in batched]
+        results[mode] = {
+            'load_seconds': load_time,
+            'single_docs_per_sec': single_rate,
+            'batch_docs_per_sec': batch_rate,
+            'mean_sentences': sentences
+        }
+        print(f"{mode:7} load {load_time:5.2f}s  one-by-one {single_rate:8.1f} docs/s  "
+              f"nlp.pipe {batch_rate:8.1f} docs/s  mean sentences {sentences:.1f}")
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the spaCy pipeline modes of the resume analytics")
+    parser.add_argument('paths', nargs='*', help=".txt resumes or folders of them (default: a built-in sample)")
+    parser.add_argument('--docs', type=int, default=200, help="Documents to analyze, cycling through the inputs")
+    parser.add_argument('--modes', nargs='+', choices=PIPELINE_MODES, default=list(PIPELINE_MODES))
+    parser.add_argument('--model', default=SPACY_MODEL, help="spaCy model name or path")
+    parser.add_argument('--batch-size', type=int, default=SPACY_BATCH_SIZE)
+    parser.add_argument('--n-process', type=int, default=1, help="Worker processes for nlp.pipe")
+    args = parser.parse_args(argv)
+
+    texts = _load_texts(args.paths) or [SAMPLE_RESUME]
+    texts = [texts[i % len(texts)] for i in range(args.docs)]
+    benchmark(texts, args.modes, args.model, args.batch_size, args.n_process)
+
+
+if __name__ == "__main__":
+    main()
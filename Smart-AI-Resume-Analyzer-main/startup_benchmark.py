@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for Smart AI Resume Analyzer
+Measures what every Streamlit rerun and every new worker pays before the first page shows:
+the import time of app.py on top of streamlit (python -X importtime) and the time to render the home page
+(streamlit.testing AppTest). Exits 1 when a budget is exceeded or a heavy subsystem is
+imported at startup, so it can guard against regressions in CI.
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Regression budgets in milliseconds, medians over --runs
+IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "400"))
+RENDER_BUDGET_MS = float(os.getenv("STARTUP_RENDER_BUDGET_MS", "3000"))
+
+# Only the pages that render these may import them. Streamlit itself loads some
+# (plotly, when installed), so only what app.py adds on top is reported.
+HEAVY_MODULES = (
+    'pandas', 'numpy', 'plotly', 'sqlalchemy', 'selenium', 'docx', 'spacy',
+    'pdfplumber', 'pypdf', 'pdfminer', 'requests', 'streamlit_lottie',
+)
+
+IMPORT_PROBE = f"""
+import sys, json
+import streamlit
+preloaded = set(sys.modules)
+import app
+print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules and m not in preloaded)))
+"""
+
+RENDER_PROBE = """
+import sys, json, time
+from streamlit.testing.v1 import AppTest
+app_test = AppTest.from_file('app.py', default_timeout=float(sys.argv[1]))
+start = time.perf_counter()
+app_test.run()
+print(json.dumps({
+    'ms': (time.perf_counter() - start) * 1000,
+    'exceptions': [str(e.value) for e in app_test.exception],
+}))
+"""
+
+
+def parse_importtime(stderr):
+    """(self_us, cumulative_us, depth, module) for each line of -X importtime output"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return entries
+
+
+def measure_import():
+    """Import app.py after streamlit in a fresh interpreter
+
+    Returns app's own import time in ms, its direct imports and the heavy
+    modules it loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_PROBE],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import app failed:\n{result.stderr[-2000:]}")
+    # Children are listed before their parent: app's direct imports are the
+    # depth-1 lines between the previous top-level import and app itself
+    direct = []
+    for _, cumulative, depth, name in parse_importtime(result.stderr):
+        if depth == 1:
+            direct.append((name, cumulative / 1000))
+        elif depth == 0 and name == 'app':
+            total_us = cumulative
+            break
+        elif depth == 0:
+            direct = []
+    heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    return total_us / 1000, direct, heavy
+
+
+def measure_render(timeout):
+    """Run app.py once through AppTest in a fresh interpreter; returns (ms, exceptions)"""
+    result = subprocess.run(
+        [sys.executable, '-c', RENDER_PROBE, str(timeout)],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"rendering app.py failed:\n{result.stderr[-2000:]}")
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return report['ms'], report['exceptions']
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure app.py import time and time to first render")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument('--top', type=int, default=8, help="Slowest direct imports of app.py to list")
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET_MS, help="Median import time budget (ms)")
+    parser.add_argument('--render-budget', type=float, default=RENDER_BUDGET_MS, help="Median first render budget (ms)")
+    parser.add_argument('--skip-render', action='store_true', help="Only measure the import")
+    parser.add_argument('--timeout', type=float, default=60, help="AppTest timeout per run (s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    failures = []
+
+    import_times = []
+    for _ in range(args.runs):
+        total_ms, direct, heavy = measure_import()
+        import_times.append(total_ms)
+    import_ms = statistics.median(import_times)
+    print(f"import app: median {import_ms:.0f} ms over {args.runs} run(s) (budget {args.import_budget:.0f} ms)")
+    print("Slowest direct imports (last run):")
+    for name, ms in sorted(direct, key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+    if import_ms > args.import_budget:
+        failures.append(f"import took {import_ms:.0f} ms, budget is {args.import_budget:.0f} ms")
+    if heavy:
+        failures.append(f"imported at startup: {', '.join(heavy)}")
+
+    if not args.skip_render:
+        render_times = []
+        for _ in range(args.runs):
+            render_ms, exceptions = measure_render(args.timeout)
+            if exceptions:
+                failures.append(f"first render raised: {exceptions[0]}")
+                break
+            render_times.append(render_ms)
+        if render_times:
+            render_ms = statistics.median(render_times)
+            print(f"first render: median {render_ms:.0f} ms over {len(render_times)} run(s) "
+                  f"(budget {args.render_budget:.0f} ms)")
+            if render_ms > args.render_budget:
+                failures.append(f"first render took {render_ms:.0f} ms, budget is {args.render_budget:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("Startup within budget")
+
+
+if __name__ == '__main__':
+    main()
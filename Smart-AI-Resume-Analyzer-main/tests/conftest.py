@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app's packages (config, utils, ...) are imported from the app directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,41 @@
+"""Insert paths of config.database on a freshly migrated SQLite database"""
+from config.database import insert_resume_with_analysis
+from config.migrations import run_migrations
+from config.rollups import rebuild_rollups
+from config.storage import SQLiteStorage
+
+ROLLUP_QUERIES = [
+    'SELECT * FROM dashboard_daily_rollup ORDER BY day, category',
+    'SELECT * FROM dashboard_score_histogram ORDER BY day, category, bucket',
+]
+
+
+def test_missing_scores_are_stored_as_null(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / 'resume.db'))
+    conn = storage.connect()
+    try:
+        run_migrations(conn)
+        cursor = conn.cursor()
+        resume = {
+            'personal_info': {'full_name': 'Ada', 'email': 'ada@example.com', 'phone': ''},
+            'target_role': 'Data Scientist',
+            'target_category': 'Data Science'
+        }
+        insert_resume_with_analysis(cursor, resume, {
+            'ats_score': None, 'keyword_match_score': None, 'format_score': None, 'section_score': None
+        })
+        insert_resume_with_analysis(cursor, resume, {'ats_score': 80, 'keyword_match_score': 60})
+        conn.commit()
+
+        scores = cursor.execute(
+            'SELECT ats_score, keyword_match_score, format_score, section_score FROM resume_analysis ORDER BY id'
+        ).fetchall()
+        assert scores == [(None, None, None, None), (80.0, 60.0, 0.0, 0.0)]
+
+        # The incremental rollups agree with a rebuild from the raw tables
+        incremental = [cursor.execute(query).fetchall() for query in ROLLUP_QUERIES]
+        rebuild_rollups(cursor)
+        assert incremental == [cursor.execute(query).fetchall() for query in ROLLUP_QUERIES]
+    finally:
+        conn.close()
+        storage.close()
@@ -0,0 +1,125 @@
+"""Upgrading a database written by the original app through every migration"""
+import json
+import sqlite3
+
+from config.migrations import MIGRATIONS, run_migrations, get_schema_version
+from config.storage import SQLiteStorage, table_names
+from dashboard.dashboard import RESUME_METRICS_QUERY, JOB_CATEGORY_QUERY
+
+# Tables as created by the original config/database.py and the SQLAlchemy models in utils/database.py
+BASELINE_SCHEMA = '''
+CREATE TABLE resume_data (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL, email TEXT NOT NULL, phone TEXT NOT NULL,
+    linkedin TEXT, github TEXT, portfolio TEXT, summary TEXT,
+    target_role TEXT, target_category TEXT, education TEXT,
+    experience TEXT, projects TEXT, skills TEXT, template TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE resume_skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    resume_id INTEGER, skill_name TEXT NOT NULL, skill_category TEXT NOT NULL,
+    proficiency_score REAL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE resume_analysis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    resume_id INTEGER, ats_score REAL, keyword_match_score REAL,
+    format_score REAL, section_score REAL, missing_skills TEXT,
+    recommendations TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE admin_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    admin_email TEXT NOT NULL, action TEXT NOT NULL,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE admin (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE, password TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE resumes (
+    id INTEGER NOT NULL PRIMARY KEY, user_id VARCHAR(100), job_role VARCHAR(100),
+    content TEXT, created_at DATETIME, updated_at DATETIME
+);
+CREATE TABLE analyses (
+    id INTEGER NOT NULL PRIMARY KEY, resume_id INTEGER, analysis_data TEXT, created_at DATETIME
+);
+CREATE TABLE ai_analyses (
+    id INTEGER NOT NULL PRIMARY KEY, resume_id INTEGER, model_used VARCHAR(100),
+    resume_score INTEGER, job_role VARCHAR(100), created_at DATETIME
+);
+'''
+
+
+def build_baseline_db(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.execute(
+        "INSERT INTO resume_data (name, email, phone, target_role, target_category, skills, created_at) "
+        "VALUES ('Ada', 'ada@example.com', '', 'Data Scientist', 'Data Science', ?, '2024-01-02 10:00:00')",
+        (str(['Python', 'SQL']),)
+    )
+    conn.execute(
+        "INSERT INTO resume_analysis (resume_id, ats_score, keyword_match_score, created_at) "
+        "VALUES (1, 80, 70, '2024-01-02 10:00:01')"
+    )
+    conn.execute(
+        "INSERT INTO resumes (id, user_id, job_role, content, created_at) VALUES (1, 'anonymous', 'Backend Developer', ?, ?)",
+        (json.dumps({'personal_info': {'full_name': 'Grace', 'email': 'grace@example.com'},
+                     'target_category': 'Software Development', 'skills': ['Java', 'docker']}),
+         '2024-01-03 09:00:00.123456')
+    )
+    conn.execute(
+        "INSERT INTO analyses (id, resume_id, analysis_data, created_at) VALUES (1, 1, ?, '2024-01-03 09:00:01')",
+        (json.dumps({'ats_score': 65, 'keyword_match': {'score': 40, 'missing_skills': ['Go']},
+                     'suggestions': ['Add metrics']}),)
+    )
+    conn.execute(
+        "INSERT INTO analyses (id, resume_id, analysis_data, created_at) VALUES (2, 1, ?, NULL)",
+        (json.dumps({'ats_score': 75, 'keyword_match_score': 55}),)
+    )
+    conn.execute(
+        "INSERT INTO ai_analyses (id, resume_id, model_used, resume_score, job_role, created_at) "
+        "VALUES (1, 1, 'Google Gemini', 72, 'Backend Developer', '2024-01-03 09:05:00')"
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_baseline_database_with_orm_rows_upgrades_through_every_migration(tmp_path):
+    path = str(tmp_path / 'resume_data.db')
+    build_baseline_db(path)
+
+    storage = SQLiteStorage(path)
+    conn = storage.connect()
+    try:
+        applied = run_migrations(conn)
+        assert applied == [version for version, _, _ in MIGRATIONS]
+        assert get_schema_version(conn) == MIGRATIONS[-1][0]
+        assert not {'resumes', 'analyses', 'ai_analyses'} & table_names(conn.cursor())
+
+        moved = conn.execute(
+            "SELECT id, name, target_role, target_category, created_at FROM resume_data WHERE name = 'Grace'"
+        ).fetchone()
+        assert moved[2:] == ('Backend Developer', 'Software Development', '2024-01-03 09:00:00')
+        scores = conn.execute(
+            'SELECT ats_score, keyword_match_score, missing_skills FROM resume_analysis WHERE resume_id = ? ORDER BY id',
+            (moved[0],)
+        ).fetchall()
+        assert scores == [(65.0, 40.0, 'Go'), (75.0, 55.0, '')]
+        assert conn.execute('SELECT resume_id, resume_score FROM ai_analysis').fetchall() == [(moved[0], 72)]
+        skills = {row[0] for row in conn.execute('SELECT skill_id FROM resume_skills')}
+        assert {'python', 'sql', 'java', 'docker'} <= skills
+
+        # The rollups agree with the moved rows: two resumes, both high scoring
+        total, avg_ats, _, high_scoring = conn.execute(RESUME_METRICS_QUERY, ('2000-01-01',)).fetchone()
+        assert (total, avg_ats, high_scoring) == (2, 73.3, 2)
+        categories = {row[0]: row[1:] for row in conn.execute(JOB_CATEGORY_QUERY)}
+        assert categories['Software Development'] == (2, 50.0)
+        assert categories['Data Science'] == (1, 100.0)
+
+        # Running them again is a no-op
+        assert run_migrations(conn) == []
+    finally:
+        conn.close()
+        storage.close()
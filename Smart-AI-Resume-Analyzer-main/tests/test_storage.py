@@ -0,0 +1,104 @@
+"""Storage backends: the SQLite connection pool, and SQL translation on a real PostgreSQL
+
+The PostgreSQL tests run in a throwaway schema of the server at TEST_DATABASE_URL
+and are skipped when it is not set.
+"""
+import os
+import threading
+
+import pytest
+
+from config.storage import ConnectionPool, PostgresStorage, SQLiteStorage, check
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+requires_postgres = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+
+def test_pool_waits_for_a_free_connection(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / 'pool.db'))
+    storage.pool = ConnectionPool(storage._connect, max_idle=1, max_connections=2, timeout=0.2)
+    first, second = storage.connect(), storage.connect()
+
+    with pytest.raises(TimeoutError):
+        storage.connect()
+
+    threading.Timer(0.05, first.close).start()
+    third = storage.connect()
+    assert third is first
+
+    second.close()
+    third.close()
+    storage.close()
+    assert storage.pool._open == 0
+
+
+@pytest.fixture
+def postgres():
+    schema = f'storage_test_{os.getpid()}'
+    admin = PostgresStorage(TEST_DATABASE_URL)
+    conn = admin.connect()
+    conn.execute(f'CREATE SCHEMA {schema}')
+    conn.commit()
+    conn.close()
+    storage = PostgresStorage(TEST_DATABASE_URL, search_path=schema)
+    try:
+        yield storage
+    finally:
+        storage.close()
+        conn = admin.connect()
+        conn.execute(f'DROP SCHEMA {schema} CASCADE')
+        conn.commit()
+        conn.close()
+        admin.close()
+
+
+@requires_postgres
+def test_postgres_translates_sqlite_sql(postgres):
+    conn = postgres.connect()
+    try:
+        postgres.prepare(conn)
+        cursor = conn.cursor()
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS check_rows (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            score REAL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        columns = dict(cursor.execute('''
+        SELECT column_name, data_type FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'check_rows'
+        ''').fetchall())
+        assert columns == {
+            'id': 'integer',
+            'name': 'text',
+            'score': 'double precision',
+            'created_at': 'timestamp without time zone'
+        }
+
+        # `?` becomes %s and lastrowid comes back through RETURNING id
+        cursor.execute('INSERT INTO check_rows (name, score) VALUES (?, ?)', ('first', 50.5))
+        assert cursor.lastrowid == 1
+        cursor.executemany('INSERT INTO check_rows (name, score) VALUES (?, ?)', [('100%', 70), ('why?', 90)])
+        cursor.execute('INSERT INTO check_rows (name, score) VALUES (?, ?)', ('last', None))
+        assert cursor.lastrowid == 4
+        conn.commit()
+
+        # Quoted ? and % are left alone, with and without parameters
+        rows = cursor.execute(
+            "SELECT name FROM check_rows WHERE (name LIKE '%?' OR name LIKE '1%') AND score >= ? ORDER BY id",
+            (60,)
+        ).fetchall()
+        assert rows == [('100%',), ('why?',)]
+        assert cursor.execute("SELECT COUNT(*) FROM check_rows WHERE name LIKE '%?'").fetchone() == (1,)
+        # SQLite's ROUND(real, digits), installed by prepare()
+        assert cursor.execute('SELECT ROUND(AVG(score), 1) FROM check_rows').fetchone() == (70.2,)
+    finally:
+        conn.close()
+
+
+@requires_postgres
+def test_postgres_storage_check():
+    check(TEST_DATABASE_URL)
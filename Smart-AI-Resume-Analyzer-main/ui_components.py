@@ -1,8 +1,95 @@
+import re
+import html
+from functools import lru_cache
+from string import Template
+
 import streamlit as st
 
+from config.assets import get_assets
+
+# Asset bundle stylesheets that make up the global stylesheet, in cascade order
+GLOBAL_STYLESHEETS = ('stylesheet', 'app_styles', 'feedback_styles', 'job_search_styles')
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_IMPORT = re.compile(r'@import\s+(?:url\([^)]*\)|"[^"]*"|\'[^\']*\')[^;]*;')
+_CSS_SPACE = re.compile(r'\s+')
+_CSS_PUNCTUATION_SPACE = re.compile(r'\s*([{};,>])\s*')
+
+
+def minify_css(css):
+    """Drop comments and whitespace; @import rules are hoisted, as they only apply at the top"""
+    css = _CSS_COMMENT.sub('', css)
+    imports = _CSS_IMPORT.findall(css)
+    css = _CSS_IMPORT.sub('', css)
+    css = _CSS_PUNCTUATION_SPACE.sub(r'\1', _CSS_SPACE.sub(' ', css))
+    return ''.join(dict.fromkeys(imports)) + css.strip()
+
+
+@lru_cache(maxsize=4)
+def _stylesheet_fragment(versions):
+    assets = get_assets()
+    css = '\n'.join(assets.text(name) for name, etag in versions if etag)
+    return f'<style>{minify_css(css)}</style>'
+
+
+def global_stylesheet():
+    """The app's CSS as one <style> block, built once per content version of its assets"""
+    assets = get_assets()
+    return _stylesheet_fragment(tuple((name, assets.etag(name)) for name in GLOBAL_STYLESHEETS))
+
+
+def inject_global_styles():
+    """Ship the global stylesheet to this session's browser
+
+    Streamlit removes the elements a rerun does not emit again, so the block is
+    emitted on every rerun, but always as the same bytes. Past Streamlit's
+    global.minCachedMessageSize (10 KB) the browser caches the message, and
+    later reruns only send its hash: the CSS itself crosses the websocket once
+    per session. st.html puts a style-only block outside the page layout.
+    """
+    st.html(global_stylesheet())
+
+
+def fill_template(template, markup=None, **values):
+    """Fill a precompiled Template; values are HTML-escaped, markup (rendered fragments) is not"""
+    fields = {name: html.escape(str(value)) for name, value in values.items()}
+    fields.update(markup or {})
+    return template.substitute(fields)
+
+
+SCORE_CIRCLE_TEMPLATE = Template(
+    '<div class="feature-card"><h2>$title</h2>'
+    '<div class="score-circle" style="--score: $score%; --score-color: $color">'
+    '<div class="score-circle-value">$score</div></div>'
+    '<div class="score-status" style="--score-color: $color">$status</div></div>'
+)
+
+SUGGESTION_CARD_TEMPLATE = Template('<div class="suggestion-card"><h3>$title</h3><ul>$items</ul></div>')
+SUGGESTION_ITEM_TEMPLATE = Template('<li>✓ $text</li>')
+SUGGESTION_DETAIL_TEMPLATE = Template('<li class="suggestion-detail">• $text</li>')
+
+
+def score_circle(score, title="ATS Score"):
+    """Circular score card, colored by how good the score is"""
+    if score >= 80:
+        color, status = '#4CAF50', 'Excellent'
+    elif score >= 60:
+        color, status = '#FFA500', 'Good'
+    else:
+        color, status = '#FF4444', 'Needs Improvement'
+    return fill_template(SCORE_CIRCLE_TEMPLATE, title=title, score=score, color=color, status=status)
+
+
+def suggestion_card(title, suggestions, details=()):
+    """One card of suggestions, rendered as a single element instead of one per line"""
+    items = ''.join(fill_template(SUGGESTION_ITEM_TEMPLATE, text=text) for text in suggestions)
+    items += ''.join(fill_template(SUGGESTION_DETAIL_TEMPLATE, text=text) for text in details)
+    return fill_template(SUGGESTION_CARD_TEMPLATE, title=title, markup={'items': items})
+
+
 def apply_modern_styles():
     """Apply modern styles by loading the CSS file"""
-    # Styles are now loaded from style.css in app.py
+    # Styles are injected once per rerun by inject_global_styles in app.py
     pass
 
 def page_header(title, subtitle=None):
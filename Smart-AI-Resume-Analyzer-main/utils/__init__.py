@@ -1,7 +1,41 @@
 """
 Utils package for Smart Resume AI
+
+Importing a submodule (utils.analysis_cache, utils.extractors, ...) no longer
+pulls in the analyzer, the parser and SQLAlchemy: the package-level names are
+resolved on first access.
 """
+import importlib
+
+_LAZY_NAMES = {
+    'ResumeAnalyzer': '.resume_analyzer',
+    'ResumeParser': '.resume_parser',
+    'Base': '.database',
+    'Resume': '.database',
+    'Analysis': '.database',
+    'ResumeSkill': '.database',
+    'AIAnalysis': '.database',
+    'DatabaseManager': '.database',
+    'get_engine': '.database',
+    'get_session': '.database',
+    'get_database_connection': '.database',
+    'DB_PATH': '.database',
+    'save_resume_data': '.database',
+    'save_ai_analysis_data': '.database',
+    'get_ai_analysis_statistics': '.database',
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-from .resume_analyzer import ResumeAnalyzer
-from .resume_parser import ResumeParser
-from .database import * 
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
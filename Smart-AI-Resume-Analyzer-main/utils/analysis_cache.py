@@ -0,0 +1,186 @@
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+
+from config.resources import get_resource
+
+# Optional on-disk tier shared by every session (disabled when unset)
+CACHE_DB_PATH = os.getenv("ANALYSIS_CACHE_DB")
+CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "256"))
+
+
+class LRUCache:
+    """Thread-safe in-memory cache that evicts the least recently used entry"""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        return {
+            'entries': len(self._data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+class SQLiteCacheTier:
+    """Persistent key/value tier so results survive restarts and are shared between processes"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (namespace, key)
+            )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, namespace, key):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                'SELECT value FROM analysis_cache WHERE namespace = ? AND key = ?',
+                (namespace, key)
+            ).fetchone()
+        except Exception as e:
+            print(f"Error reading analysis cache: {str(e)}")
+            row = None
+        finally:
+            conn.close()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, namespace, key, value):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO analysis_cache (namespace, key, value) VALUES (?, ?, ?)',
+                (namespace, key, json.dumps(value))
+            )
+            conn.commit()
+        except Exception as e:
+            print(f"Error writing analysis cache: {str(e)}")
+        finally:
+            conn.close()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class AnalysisCache:
+    """Content-addressed cache for extracted resume text and per-role analysis results"""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, db_path=CACHE_DB_PATH):
+        # Extraction is role-independent, so it gets its own cache
+        self.text_cache = LRUCache(max_entries)
+        # ParsedResume objects are kept in memory only; they are rebuilt from cached text
+        self.parsed_cache = LRUCache(max_entries)
+        self.result_cache = LRUCache(max_entries)
+        self.disk = SQLiteCacheTier(db_path) if db_path else None
+
+    @staticmethod
+    def file_key(file_bytes):
+        """SHA-256 of the uploaded file content"""
+        return hashlib.sha256(file_bytes).hexdigest()
+
+    @staticmethod
+    def role_key(file_hash, job_requirements):
+        """Combine the file hash with everything in the role that affects scoring"""
+        role = json.dumps([
+            list(job_requirements.get('required_skills', [])),
+            bool(job_requirements.get('require_gpa', False))
+        ])
+        return f"{file_hash}:{hashlib.sha256(role.encode('utf-8')).hexdigest()}"
+
+    def _get(self, memory, namespace, key):
+        value = memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(namespace, key)
+            if value is not None:
+                memory.set(key, value)
+        return value
+
+    def _set(self, memory, namespace, key, value):
+        memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(namespace, key, value)
+
+    def get_text(self, file_hash):
+        return self._get(self.text_cache, 'text', file_hash)
+
+    def set_text(self, file_hash, text):
+        self._set(self.text_cache, 'text', file_hash, text)
+
+    def get_parsed(self, file_hash):
+        return self.parsed_cache.get(file_hash)
+
+    def set_parsed(self, file_hash, parsed):
+        self.parsed_cache.set(file_hash, parsed)
+
+    def get_analysis(self, file_hash, job_requirements):
+        return self._get(self.result_cache, 'analysis', self.role_key(file_hash, job_requirements))
+
+    def set_analysis(self, file_hash, job_requirements, analysis):
+        self._set(self.result_cache, 'analysis', self.role_key(file_hash, job_requirements), analysis)
+
+    def clear(self):
+        self.text_cache.clear()
+        self.parsed_cache.clear()
+        self.result_cache.clear()
+
+    def stats(self):
+        """Hit/miss counters for each tier"""
+        return {
+            'text': self.text_cache.stats(),
+            'parsed': self.parsed_cache.stats(),
+            'analysis': self.result_cache.stats(),
+            'disk': self.disk.stats() if self.disk is not None else None
+        }
+
+
+def get_analysis_cache():
+    """Return the process-wide cache shared by all Streamlit sessions"""
+    return get_resource('analysis_cache', AnalysisCache)
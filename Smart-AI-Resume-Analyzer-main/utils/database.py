@@ -1,149 +1,186 @@
 import os
 import json
-import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, func
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import threading
+from sqlalchemy import create_engine, make_url, Column, Integer, Float, String, Text, DateTime, func
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
 
-# Read DB path from environment variable or use default
-DB_PATH = os.getenv("DB_PATH", "resume_data.db")
+from config import database as db
+from config.storage import DB_PATH, DB_POOL_SIZE, get_storage
 
-# Create the base class for declarative models
+# Typed models over the same tables config/database.py writes.
+# The schema is owned by config/migrations.py, so nothing here issues DDL.
 Base = declarative_base()
 
 # Resume model
 class Resume(Base):
-    __tablename__ = 'resumes'
-    
+    __tablename__ = 'resume_data'
+
     id = Column(Integer, primary_key=True)
-    user_id = Column(String(100))
-    job_role = Column(String(100))
-    content = Column(Text)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    name = Column(Text, nullable=False)
+    email = Column(Text, nullable=False)
+    phone = Column(Text, nullable=False)
+    linkedin = Column(Text)
+    github = Column(Text)
+    portfolio = Column(Text)
+    summary = Column(Text)
+    target_role = Column(Text)
+    target_category = Column(Text)
+    education = Column(Text)
+    experience = Column(Text)
+    projects = Column(Text)
+    skills = Column(Text)
+    template = Column(Text)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
 
 # Resume analysis model
 class Analysis(Base):
-    __tablename__ = 'analyses'
-    
+    __tablename__ = 'resume_analysis'
+
     id = Column(Integer, primary_key=True)
     resume_id = Column(Integer)
-    analysis_data = Column(Text)  # JSON stored as string
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    ats_score = Column(Float)
+    keyword_match_score = Column(Float)
+    format_score = Column(Float)
+    section_score = Column(Float)
+    missing_skills = Column(Text)
+    recommendations = Column(Text)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
+
+# Normalized resume skill model
+class ResumeSkill(Base):
+    __tablename__ = 'resume_skills'
+
+    id = Column(Integer, primary_key=True)
+    resume_id = Column(Integer)
+    skill_id = Column(Text)
+    skill_name = Column(Text, nullable=False)
+    skill_category = Column(Text, nullable=False)
+    proficiency_score = Column(Float)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
 
 # AI analysis model
 class AIAnalysis(Base):
-    __tablename__ = 'ai_analyses'
-    
+    __tablename__ = 'ai_analysis'
+
     id = Column(Integer, primary_key=True)
     resume_id = Column(Integer)
     model_used = Column(String(100))
     resume_score = Column(Integer)
     job_role = Column(String(100))
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.current_timestamp())
+
+_engine = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    """Process-wide engine on the configured storage backend"""
+    global _engine, _session_factory
+    with _engine_lock:
+        if _engine is None:
+            db.init_database()
+            storage = get_storage()
+            if storage.dialect == 'postgresql':
+                # The ORM needs real psycopg2 connections, so it keeps its own small pool
+                url = make_url(storage.url).set(drivername='postgresql+psycopg2')
+                _engine = create_engine(url, pool_size=DB_POOL_SIZE, pool_pre_ping=True)
+            else:
+                # NullPool: closing a connection hands it back to the shared pool instead
+                _engine = create_engine('sqlite://', creator=db.get_database_connection, poolclass=NullPool)
+            _session_factory = sessionmaker(bind=_engine)
+        return _engine
+
+def get_session():
+    """New ORM session on the shared engine"""
+    get_engine()
+    return _session_factory()
+
+def get_database_connection():
+    """New ORM session; kept for callers of the old per-call session helper"""
+    return get_session()
+
+def _load_json(value):
+    """Old callers passed resume content and analysis data as JSON strings"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return {'summary': value}
+    return value if isinstance(value, dict) else {}
 
 # Database session manager
 class DatabaseManager:
-    def __init__(self, db_path=DB_PATH):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
-    
-    def save_resume(self, user_id, job_role, content):
-        resume = Resume(user_id=user_id, job_role=job_role, content=content)
-        self.session.add(resume)
-        self.session.commit()
-        return resume.id
-    
+    def __init__(self, db_path=None):
+        # The engine is shared, so a manager can only work on the configured database
+        if db_path is not None and os.path.abspath(db_path) != DB_PATH:
+            raise ValueError(f"DatabaseManager uses the configured database {DB_PATH}; set DB_PATH to use {db_path}")
+        self.session = get_session()
+
+    def save_resume(self, resume_data, job_role=None, content=None):
+        """Save a resume and return its id
+
+        Takes a resume_data dict, or the old (user_id, job_role, content)
+        arguments; user_id is not stored any more.
+        """
+        if job_role is not None or content is not None:
+            resume_data = _load_json(content)
+            if job_role and not resume_data.get('target_role'):
+                resume_data['target_role'] = job_role
+        return save_resume_data(resume_data)
+
     def get_resume(self, resume_id):
         return self.session.query(Resume).filter(Resume.id == resume_id).first()
-    
+
+    def get_role_resumes(self, target_role):
+        return self.session.query(Resume).filter(Resume.target_role == target_role).all()
+
     def get_user_resumes(self, user_id):
-        return self.session.query(Resume).filter(Resume.user_id == user_id).all()
-    
+        # resume_data has no owner column; the old tables only ever stored "anonymous"
+        raise NotImplementedError("Resumes are no longer stored per user; use get_role_resumes")
+
     def save_analysis(self, resume_id, analysis_data):
-        analysis = Analysis(resume_id=resume_id, analysis_data=analysis_data)
-        self.session.add(analysis)
-        self.session.commit()
-        return analysis.id
-    
+        """Save an analysis (a dict or the old JSON string) and return its id"""
+        return db.save_analysis_data(resume_id, _load_json(analysis_data))
+
     def get_analysis(self, analysis_id):
         return self.session.query(Analysis).filter(Analysis.id == analysis_id).first()
-    
+
     def get_resume_analyses(self, resume_id):
         return self.session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
-    
+
+    def get_resume_skills(self, resume_id):
+        return self.session.query(ResumeSkill).filter(ResumeSkill.resume_id == resume_id).all()
+
     def close(self):
         self.session.close()
 
-# Create new DB session manually
-def get_database_connection():
-    engine = create_engine(f'sqlite:///{DB_PATH}')
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    return Session()
-
-# Save raw resume data
+# Writes go through the raw sqlite3 paths, which also maintain skills and rollups
 def save_resume_data(resume_data):
-    session = get_database_connection()
-    try:
-        resume_json = json.dumps(resume_data)
-        resume = Resume(
-            user_id="anonymous",
-            job_role=resume_data.get('target_role', 'Unknown'),
-            content=resume_json
-        )
-        session.add(resume)
-        session.commit()
-        return resume.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
+    db.init_database()
+    resume_id = db.save_resume_data(resume_data)
+    if resume_id is None:
+        raise Exception("Error saving resume data")
+    return resume_id
 
-# Save AI analysis data
 def save_ai_analysis_data(resume_id, analysis_data):
-    session = get_database_connection()
-    try:
-        ai_analysis = AIAnalysis(
-            resume_id=resume_id,
-            model_used=analysis_data.get('model_used', 'Unknown'),
-            resume_score=analysis_data.get('resume_score', 0),
-            job_role=analysis_data.get('job_role', 'Unknown')
-        )
-        session.add(ai_analysis)
-        session.commit()
-        return ai_analysis.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
+    db.init_database()
+    return db.save_ai_analysis_data(resume_id, analysis_data)
 
 # Retrieve aggregated analysis stats
 def get_ai_analysis_statistics():
-    session = get_database_connection()
+    session = get_session()
     try:
-        total_analyses = session.query(func.count(AIAnalysis.id)).scalar() or 0
-        average_score = session.query(func.avg(AIAnalysis.resume_score)).scalar() or 0
-
-        model_usage_query = session.query(
-            AIAnalysis.model_used, func.count(AIAnalysis.id)
-        ).group_by(AIAnalysis.model_used).all()
-        model_usage = {model: count for model, count in model_usage_query}
-
+        stats = db.get_detailed_ai_analysis_stats()
         job_roles_query = session.query(
             AIAnalysis.job_role, func.count(AIAnalysis.id)
         ).group_by(AIAnalysis.job_role).all()
-        job_roles = {role: count for role, count in job_roles_query}
 
         return {
-            'total_analyses': total_analyses,
-            'average_score': float(average_score),
-            'model_usage': model_usage,
-            'job_roles': job_roles
+            'total_analyses': stats['total_analyses'],
+            'average_score': float(stats['average_score']),
+            'model_usage': {row['model']: row['count'] for row in stats['model_usage']},
+            'job_roles': {role: count for role, count in job_roles_query}
         }
     except Exception as e:
         print(f"Error getting AI analysis statistics: {e}")
@@ -0,0 +1,257 @@
+import os
+import time
+import signal
+import itertools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from config.resources import get_resource
+from .extractors import extract_pdf_pages, join_pages
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Limits for a single document, overridable from the environment
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "2"))
+EXTRACTION_CPU_SECONDS = int(os.getenv("EXTRACTION_CPU_SECONDS", "20"))
+EXTRACTION_WALL_SECONDS = float(os.getenv("EXTRACTION_WALL_SECONDS", "30"))
+EXTRACTION_MEMORY_MB = int(os.getenv("EXTRACTION_MEMORY_MB", "1024"))
+# How long a document may wait for a free worker before the caller gives up
+EXTRACTION_QUEUE_SECONDS = float(os.getenv("EXTRACTION_QUEUE_SECONDS", "60"))
+
+
+class ExtractionError(Exception):
+    """Raised when a document could not be extracted"""
+
+
+class ExtractionTimeout(ExtractionError):
+    """Raised when a document exceeds its CPU or wall-clock budget"""
+
+
+def _raise_timeout(signum, frame):
+    raise ExtractionTimeout("Document took too long to extract")
+
+
+# Set in each worker: where it reports the jobs it starts, so the parent's
+# backstop clock ignores the time a job spends queued
+_started_queue = None
+
+
+def _init_worker(memory_mb, started_queue=None):
+    """Apply the memory cap and timeout handlers once per worker process"""
+    global _started_queue
+    _started_queue = started_queue
+    if resource is not None and memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if hasattr(signal, 'SIGXCPU'):
+        signal.signal(signal.SIGXCPU, _raise_timeout)
+    if hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+
+def _run_limited(file_content, cpu_seconds, wall_seconds, max_pages=None, job_id=None):
+    """Worker entry point: extract the pages of one document under CPU and wall-clock limits"""
+    if _started_queue is not None and job_id is not None:
+        _started_queue.put((job_id, os.getpid()))
+    cpu_limited = resource is not None and hasattr(signal, 'SIGXCPU') and cpu_seconds
+    wall_limited = hasattr(signal, 'setitimer') and wall_seconds
+    if cpu_limited:
+        # RLIMIT_CPU counts the whole process, so the budget is relative to time used so far
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(usage.ru_utime + usage.ru_stime) + cpu_seconds
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    if wall_limited:
+        signal.setitimer(signal.ITIMER_REAL, wall_seconds)
+    try:
+        return extract_pdf_pages(file_content, max_pages)
+    except ExtractionTimeout:
+        raise
+    except MemoryError:
+        raise ExtractionError("Document needs more memory than allowed")
+    except Exception as e:
+        raise ExtractionError(str(e))
+    finally:
+        if wall_limited:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if cpu_limited:
+            resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+
+
+class ExtractionPool:
+    """Bounded process pool that isolates PDF parsing from the Streamlit script thread"""
+
+    def __init__(self, max_workers=EXTRACTION_WORKERS, cpu_seconds=EXTRACTION_CPU_SECONDS,
+                 wall_seconds=EXTRACTION_WALL_SECONDS, memory_mb=EXTRACTION_MEMORY_MB,
+                 queue_seconds=EXTRACTION_QUEUE_SECONDS):
+        self.max_workers = max_workers
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.memory_mb = memory_mb
+        self.queue_seconds = queue_seconds
+        self._lock = threading.Lock()
+        self._executor = None
+        self._started_queue = None
+        self._job_ids = itertools.count()
+        self._started = {}  # job id -> (worker pid, monotonic time the worker picked it up), None while queued
+        self._started_lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn avoids forking the multi-threaded Streamlit server
+                context = multiprocessing.get_context('spawn')
+                self._started_queue = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.memory_mb, self._started_queue)
+                )
+                threading.Thread(
+                    target=self._collect_starts, args=(self._started_queue,),
+                    name='extraction-starts', daemon=True
+                ).start()
+            return self._executor
+
+    def _collect_starts(self, started_queue):
+        """Record when and where each job starts running; stops at the None sentinel"""
+        while True:
+            try:
+                item = started_queue.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            job_id, pid = item
+            with self._started_lock:
+                # A report can arrive after its caller has given up on the job
+                if job_id in self._started:
+                    self._started[job_id] = (pid, time.monotonic())
+
+    def _discard(self, executor):
+        """Forget a pool without touching its workers; the next submit starts a fresh one"""
+        with self._lock:
+            if self._executor is not executor:
+                return False
+            self._executor = None
+            started_queue, self._started_queue = self._started_queue, None
+        if started_queue is not None:
+            started_queue.put(None)
+        return True
+
+    def _reset(self, executor):
+        """Kill a broken pool; the next submit starts a fresh one"""
+        if not self._discard(executor):
+            return
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _kill_worker(self, executor, pid):
+        """Terminate the one process running a wedged job
+
+        The executor then counts as broken: jobs still running or queued on it
+        fail with BrokenProcessPool, and their callers resubmit them to a fresh pool.
+        """
+        process = (getattr(executor, '_processes', None) or {}).get(pid)
+        if process is not None:
+            process.terminate()
+        if self._discard(executor):
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _crashed(executor, pid):
+        """Whether a worker died by itself, rather than being stopped along with its broken pool"""
+        process = (getattr(executor, '_processes', None) or {}).get(pid)
+        if process is None:
+            return True
+        # The pool breaks as soon as a worker's pipe closes, which can be before it has exited;
+        # the survivors are terminated by the pool right after
+        process.join(timeout=1)
+        return process.exitcode is not None and process.exitcode != -getattr(signal, 'SIGTERM', 15)
+
+    def submit(self, file_content, max_pages=None):
+        """Queue a PDF for extraction and return a Future of its page texts"""
+        return self._get_executor().submit(
+            _run_limited, file_content, self.cpu_seconds, self.wall_seconds, max_pages
+        )
+
+    def extract(self, file_content):
+        """Extract text from PDF bytes, raising ExtractionError instead of hanging"""
+        return join_pages(self.extract_pages(file_content))
+
+    def extract_pages(self, file_content, max_pages=None, retries=1):
+        """Extract up to max_pages page texts, raising ExtractionError instead of hanging"""
+        executor = self._get_executor()
+        job_id = next(self._job_ids)
+        with self._started_lock:
+            self._started[job_id] = None
+        try:
+            future = executor.submit(
+                _run_limited, file_content, self.cpu_seconds, self.wall_seconds, max_pages, job_id
+            )
+            return self._wait(executor, future, job_id)
+        except BrokenProcessPool:
+            with self._started_lock:
+                started = self._started.get(job_id)
+            crashed = started is not None and self._crashed(executor, started[0])
+            self._reset(executor)
+            # Jobs that were queued, or running on a worker that did not die, go to a fresh pool;
+            # the document that killed its worker would only kill the next one
+            if retries > 0 and not crashed:
+                return self.extract_pages(file_content, max_pages, retries - 1)
+            raise ExtractionError("Extraction worker crashed while reading the document")
+        finally:
+            with self._started_lock:
+                self._started.pop(job_id, None)
+
+    def _wait(self, executor, future, job_id):
+        """Wait for a job's result
+
+        The worker enforces its own limits; this is the backstop for a wedged
+        process. Its clock starts when a worker picks the job up, so time spent
+        queued behind other uploads never counts, up to queue_seconds.
+        """
+        deadline = None
+        # Also caps the wait when the start report never arrives
+        queue_deadline = time.monotonic() + self.queue_seconds + self.cpu_seconds
+        while True:
+            try:
+                return future.result(timeout=0.5)
+            except FutureTimeoutError:
+                pass
+            if deadline is None:
+                with self._started_lock:
+                    started = self._started.get(job_id)
+                if started is not None:
+                    pid, started_at = started
+                    deadline = started_at + self.wall_seconds + 5
+            if deadline is not None and time.monotonic() > deadline:
+                self._kill_worker(executor, pid)
+                raise ExtractionTimeout("Document took too long to extract")
+            if deadline is None and time.monotonic() > queue_deadline:
+                # Still queued, or running unreported under the worker's own limits
+                future.cancel()
+                raise ExtractionTimeout("Timed out waiting for a free extraction worker")
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            started_queue, self._started_queue = self._started_queue, None
+        if started_queue is not None:
+            started_queue.put(None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_extraction_pool():
+    """Return the process-wide extraction pool; its workers are stopped at exit"""
+    return get_resource('extraction_pool', ExtractionPool, ExtractionPool.shutdown)
@@ -0,0 +1,403 @@
+"""
+Document text extraction shared by the analyzer, the parser and the batch tools
+
+PDF parsing is pluggable: every backend turns PDF bytes into a list of page
+texts. The default backend is the fastest correct one recorded by the
+benchmark below, falling back to a fixed preference order.
+"""
+import io
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+import multiprocessing
+from abc import ABC, abstractmethod
+from queue import Empty
+from itertools import islice
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Poppler build bundled with the app for Windows machines without poppler on PATH
+BUNDLED_POPPLER_BIN = os.path.join(APP_DIR, 'poppler', 'poppler-24.08.0', 'Library', 'bin')
+
+# Where the benchmark stores its pick; PDF_EXTRACTOR always wins over it
+BENCHMARK_PROFILE = os.getenv("EXTRACTOR_PROFILE", os.path.join(APP_DIR, 'extractor_benchmark.json'))
+
+# Used when no benchmark profile exists
+DEFAULT_BACKEND_ORDER = ['pypdf', 'pdftotext', 'pdfminer']
+
+# Seconds before a pdftotext child is killed, and before a benchmark worker is given up on
+PDFTOTEXT_TIMEOUT = float(os.getenv("PDFTOTEXT_TIMEOUT", "60"))
+BENCHMARK_TIMEOUT = float(os.getenv("EXTRACTOR_BENCHMARK_TIMEOUT", "600"))
+
+
+class PDFBackend(ABC):
+    """Base class for PDF text extraction backends"""
+
+    name = None
+
+    @abstractmethod
+    def available(self):
+        """Whether the backend's library or binary is installed"""
+
+    @abstractmethod
+    def iter_pages(self, file_content, max_pages=None):
+        """Yield the text of each page, parsing no more than max_pages pages"""
+
+    def extract_pages(self, file_content, max_pages=None):
+        """Return the text of every page, or of the first max_pages"""
+        return list(islice(self.iter_pages(file_content, max_pages), max_pages))
+
+    def extract(self, file_content):
+        """Return the text of the whole document, one newline after every page"""
+        return ''.join(page + '\n' for page in self.iter_pages(file_content))
+
+
+class PypdfBackend(PDFBackend):
+    name = 'pypdf'
+
+    def available(self):
+        try:
+            import pypdf  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def iter_pages(self, file_content, max_pages=None):
+        import pypdf
+
+        reader = pypdf.PdfReader(io.BytesIO(file_content))
+        # Pages are parsed on access, so stopping early skips the rest of the document
+        for page in islice(reader.pages, max_pages):
+            yield page.extract_text() or ''
+
+
+class PdftotextBackend(PDFBackend):
+    """Poppler's pdftotext, run as a subprocess"""
+
+    name = 'pdftotext'
+
+    def binary(self):
+        found = shutil.which('pdftotext')
+        if found:
+            return found
+        bundled = os.path.join(BUNDLED_POPPLER_BIN, 'pdftotext.exe')
+        if sys.platform == 'win32' and os.path.exists(bundled):
+            return bundled
+        return None
+
+    def available(self):
+        return self.binary() is not None
+
+    def iter_pages(self, file_content, max_pages=None):
+        # One subprocess converts the pages up front; -l stops it at the cap
+        yield from self.extract_pages(file_content, max_pages)
+
+    def extract_pages(self, file_content, max_pages=None):
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as pdf_file:
+            pdf_file.write(file_content)
+        command = [self.binary(), '-enc', 'UTF-8']
+        if max_pages is not None:
+            command += ['-l', str(max(max_pages, 1))]
+        command += [pdf_file.name, '-']
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            stdout, stderr = process.communicate(timeout=PDFTOTEXT_TIMEOUT)
+        finally:
+            # Also reached when the extraction pool's alarm interrupts the wait:
+            # never leave the child running on its own
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            os.unlink(pdf_file.name)
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+        # pdftotext ends every page with a form feed
+        pages = stdout.decode('utf-8', errors='replace').split('\f')
+        if pages and not pages[-1].strip():
+            pages.pop()
+        return pages[:max_pages]
+
+
+class PdfminerBackend(PDFBackend):
+    name = 'pdfminer'
+
+    def available(self):
+        try:
+            import pdfminer.high_level  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def iter_pages(self, file_content, max_pages=None):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+
+        # extract_pages lays out one page at a time
+        for page_layout in extract_pages(io.BytesIO(file_content), maxpages=max_pages or 0):
+            yield ''.join(
+                element.get_text() for element in page_layout if isinstance(element, LTTextContainer)
+            )
+
+
+PDF_BACKENDS = {
+    backend.name: backend
+    for backend in (PypdfBackend, PdftotextBackend, PdfminerBackend)
+}
+
+_selected_backend = None
+
+
+def _profile_choice():
+    try:
+        with open(BENCHMARK_PROFILE, encoding='utf-8') as f:
+            return json.load(f).get('selected')
+    except (OSError, ValueError):
+        return None
+
+
+def get_pdf_backend(name=None):
+    """Return a PDF backend by name, or the configured / benchmarked default"""
+    global _selected_backend
+    if name is not None:
+        backend = PDF_BACKENDS[name]()
+        if not backend.available():
+            raise RuntimeError(f"PDF backend '{name}' is not installed")
+        return backend
+    if _selected_backend is None:
+        preferred = [os.getenv("PDF_EXTRACTOR"), _profile_choice()] + DEFAULT_BACKEND_ORDER
+        for candidate in preferred:
+            if candidate in PDF_BACKENDS and PDF_BACKENDS[candidate]().available():
+                _selected_backend = PDF_BACKENDS[candidate]()
+                break
+        else:
+            raise RuntimeError("No PDF extraction backend is installed")
+    return _selected_backend
+
+
+def iter_pdf_pages(file_content, backend=None, max_pages=None):
+    """Lazily yield page texts with the selected backend"""
+    return get_pdf_backend(backend).iter_pages(file_content, max_pages)
+
+
+def extract_pdf_pages(file_content, max_pages=None, backend=None):
+    """Return page texts, parsing no more than max_pages pages"""
+    return get_pdf_backend(backend).extract_pages(file_content, max_pages)
+
+
+def join_pages(pages):
+    """Join page texts the same way extract_pdf_text does"""
+    return ''.join(page + '\n' for page in pages)
+
+
+class PageStream:
+    """Page texts parsed on demand and kept as they are read
+
+    Each check iterates the stream and stops once its verdict is certain, so
+    pages nobody asked for are never parsed; iterating again replays the
+    pages already read before parsing more.
+    """
+
+    def __init__(self, pages):
+        self._pages = iter(pages)
+        self.read = []
+
+    def __iter__(self):
+        index = 0
+        while True:
+            if index == len(self.read):
+                page = next(self._pages, None)
+                if page is None:
+                    return
+                self.read.append(page)
+            yield self.read[index]
+            index += 1
+
+    def text(self):
+        """Join every page, parsing the ones not read yet"""
+        return join_pages(self)
+
+
+def extract_pdf_text(file_content, backend=None, max_pages=None):
+    """Extract text from PDF bytes with the selected backend"""
+    return join_pages(extract_pdf_pages(file_content, max_pages, backend))
+
+
+def extract_docx_text(file_content):
+    """Extract paragraph text from DOCX bytes or a file-like object"""
+    from docx import Document
+
+    source = io.BytesIO(file_content) if isinstance(file_content, (bytes, bytearray)) else file_content
+    doc = Document(source)
+    return '\n'.join(paragraph.text for paragraph in doc.paragraphs)
+
+
+def read_file_content(file):
+    """Return the bytes of an upload, path or bytes object, leaving file pointers rewound"""
+    if isinstance(file, (bytes, bytearray)):
+        return bytes(file)
+    if isinstance(file, str):
+        with open(file, 'rb') as f:
+            return f.read()
+    file_content = file.read()
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    return file_content
+
+
+def extract_text(file, filename):
+    """Extract text from a PDF or DOCX based on its file name"""
+    file_content = read_file_content(file)
+    if filename.lower().endswith('.pdf'):
+        return extract_pdf_text(file_content)
+    if filename.lower().endswith('.docx'):
+        return extract_docx_text(file_content)
+    raise ValueError(f"Unsupported file format: {filename}")
+
+
+# Benchmark harness
+
+def _peak_rss_mb():
+    """Peak resident set size of this process and its children"""
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _recall(expected, extracted):
+    """Share of the expected words that the backend recovered"""
+    expected_words = re.findall(r'\w+', expected.lower())
+    if not expected_words:
+        return 1.0
+    extracted_words = set(re.findall(r'\w+', extracted.lower()))
+    return sum(1 for word in expected_words if word in extracted_words) / len(expected_words)
+
+
+def _benchmark_worker(name, paths, queue):
+    backend = PDF_BACKENDS[name]()
+    pages = 0
+    errors = 0
+    recalls = []
+    start = time.perf_counter()
+    for path in paths:
+        with open(path, 'rb') as f:
+            file_content = f.read()
+        try:
+            page_texts = backend.extract_pages(file_content)
+        except Exception:
+            errors += 1
+            continue
+        pages += len(page_texts)
+        # A .txt file next to the PDF holds the expected text
+        expected_path = os.path.splitext(path)[0] + '.txt'
+        if os.path.exists(expected_path):
+            with open(expected_path, encoding='utf-8') as f:
+                recalls.append(_recall(f.read(), '\n'.join(page_texts)))
+    seconds = time.perf_counter() - start
+    queue.put({
+        'backend': name,
+        'files': len(paths),
+        'pages': pages,
+        'errors': errors,
+        'seconds': round(seconds, 3),
+        'pages_per_sec': round(pages / seconds, 2) if seconds else 0.0,
+        'peak_rss_mb': _peak_rss_mb(),
+        'recall': round(sum(recalls) / len(recalls), 3) if recalls else None
+    })
+
+
+def _wait_for_result(process, queue, timeout):
+    """The worker's result, or None if it died or ran out of time; the worker is always reaped"""
+    deadline = time.monotonic() + timeout
+    try:
+        while time.monotonic() < deadline:
+            try:
+                return queue.get(timeout=1)
+            except Empty:
+                if not process.is_alive():
+                    # It may have put its result just before exiting
+                    try:
+                        return queue.get(timeout=1)
+                    except Empty:
+                        return None
+        return None
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+
+def benchmark_backends(corpus_dir, backends=None, min_recall=0.9, timeout=BENCHMARK_TIMEOUT):
+    """Measure pages/sec, peak RSS and recall of each available backend on a PDF corpus
+
+    Each backend runs in its own fresh process so peak RSS is not shared. A
+    backend whose process crashes or runs past timeout seconds is left out.
+    Returns (results, selected) where selected is the fastest backend with no
+    errors and at least min_recall on the files that have expected text.
+    """
+    paths = sorted(
+        os.path.join(corpus_dir, name) for name in os.listdir(corpus_dir)
+        if name.lower().endswith('.pdf')
+    )
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for name in backends or list(PDF_BACKENDS):
+        if not PDF_BACKENDS[name]().available():
+            continue
+        queue = context.Queue()
+        process = context.Process(target=_benchmark_worker, args=(name, paths, queue))
+        process.start()
+        result = _wait_for_result(process, queue, timeout)
+        if result is None:
+            print(f"Error benchmarking {name}: worker crashed or ran for more than {timeout:.0f}s")
+        else:
+            results.append(result)
+
+    correct = [
+        result for result in results
+        if result['errors'] == 0 and (result['recall'] is None or result['recall'] >= min_recall)
+    ]
+    selected = max(correct, key=lambda result: result['pages_per_sec'])['backend'] if correct else None
+    return results, selected
+
+
+def main(argv=None):
+    """Command line entry point: python -m utils.extractors CORPUS_DIR [--save]"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends")
+    parser.add_argument('corpus', help="Folder of PDFs, optionally with expected .txt files")
+    parser.add_argument('--backend', action='append', choices=list(PDF_BACKENDS), help="Only run these backends")
+    parser.add_argument('--save', action='store_true', help="Make the winner the default backend")
+    args = parser.parse_args(argv)
+
+    results, selected = benchmark_backends(args.corpus, args.backend)
+    for result in results:
+        print(
+            f"{result['backend']:<10} {result['pages_per_sec']:>8} pages/sec  "
+            f"peak RSS {result['peak_rss_mb']} MB  recall {result['recall']}  errors {result['errors']}"
+        )
+    print(f"Selected backend: {selected}")
+
+    if args.save and selected:
+        with open(BENCHMARK_PROFILE, 'w', encoding='utf-8') as f:
+            json.dump({'selected': selected, 'results': results}, f, indent=2)
+        print(f"Saved to {BENCHMARK_PROFILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from collections import deque
+from functools import lru_cache
+
+from config.resources import get_resource
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds every keyword of a set in one scan of the text"""
+
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        # An empty keyword is contained in every text, just like `'' in text`
+        self._always = frozenset(keyword for keyword in self.keywords if not keyword)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        self._build()
+
+    def _build(self):
+        """Build the keyword trie and its failure links"""
+        for keyword in self.keywords:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (keyword,)
+
+        # Breadth-first pass so every failure link points at a shallower state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def finditer(self, text):
+        """Yield (start, end, keyword) for every occurrence, overlapping ones included"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text.lower()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                yield index - len(keyword) + 1, index + 1, keyword
+
+    def matches(self, text):
+        """Return the set of keywords that occur anywhere in the text"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set(self._always)
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def count_matches(self, text, keywords=None):
+        """Count how many distinct keywords (optionally from a subset) occur in the text"""
+        found = self.matches(text)
+        if keywords is None:
+            return len(found)
+        return sum(1 for keyword in keywords if keyword.lower() in found)
+
+
+def get_matcher(keywords):
+    """Return a shared matcher for a keyword set, compiling it only the first time"""
+    # The registry holds the bounded cache, so invalidate_resource('keyword_matchers') empties it
+    compiled = get_resource('keyword_matchers', lambda: lru_cache(maxsize=256)(KeywordMatcher))
+    return compiled(tuple(keywords))
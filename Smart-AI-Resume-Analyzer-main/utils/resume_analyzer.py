@@ -1,7 +1,38 @@
+import os
 import re
+from .keyword_matcher import KeywordMatcher
+from .section_segmenter import SectionSegmenter
+from .skill_matcher import SkillMatcher
+from .role_ranker import RoleRanker
+from .extractors import extract_pdf_pages, iter_pdf_pages, extract_docx_text, join_pages, read_file_content
+
+# Longer PDFs are rejected without parsing the pages past the cap
+MAX_RESUME_PAGES = int(os.getenv("MAX_RESUME_PAGES", "10"))
+
+class ParsedResume:
+    """Role-independent analysis of one resume, reusable across any number of roles"""
+
+    def __init__(self, text):
+        self.text = text
+        self.personal_info = {}
+        self.document_type = 'unknown'
+        self.token_index = None
+        self.sections = None
+        self.section_score = 0
+        self.format_score = 0
+        self.format_deductions = []
+        self.has_gpa = False
+        self.contact_suggestions = []
+        self.summary_suggestions = []
+        self.experience_suggestions = []
+        self.education_suggestions = []
+
 
 class ResumeAnalyzer:
-    def __init__(self):
+    def __init__(self, extraction_pool=None):
+        # Optional ExtractionPool; without one PDFs are parsed in the calling thread
+        self.extraction_pool = extraction_pool
+
         # Document type indicators
         self.document_types = {
             'resume': [
@@ -21,16 +52,45 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
+
+        # Sections every resume is expected to contain
+        self.essential_sections = {
+            'contact': ['email', 'phone', 'address', 'linkedin'],
+            'education': ['education', 'university', 'college', 'degree', 'academic'],
+            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
+            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
+        }
+
+        # Keyword tables are compiled once and matched in a single scan
+        self.document_matcher = KeywordMatcher(
+            keyword for keywords in self.document_types.values() for keyword in keywords
+        )
+        self.section_matcher = KeywordMatcher(
+            keyword for keywords in self.essential_sections.values() for keyword in keywords
+        )
+
+        self.skill_matcher = SkillMatcher()
+        self._role_rankers = {}
+
+        # Section extraction walks the text once for all sections
+        self.segmenter = SectionSegmenter(self.document_types['resume'])
         
-    def detect_document_type(self, text):
-        text = text.lower()
+    def detect_document_type(self, pages):
+        """Classify the full text or an iterable of page texts, scanning each page once"""
+        if isinstance(pages, str):
+            pages = [pages]
         scores = {}
+        found = set()
+        word_count = 0
+        for page in pages:
+            found |= self.document_matcher.matches(page.lower())
+            word_count += len(page.split())
         
         # Calculate score for each document type
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = sum(1 for keyword in keywords if keyword in found)
             density = matches / len(keywords)
-            frequency = matches / (len(text.split()) + 1)  # Add 1 to avoid division by zero
+            frequency = matches / (word_count + 1)  # Add 1 to avoid division by zero
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
         
         # Get the highest scoring document type
@@ -40,41 +100,24 @@ class ResumeAnalyzer:
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
     def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
-        found_skills = []
-        missing_skills = []
-        
-        for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
-                found_skills.append(skill)
-            else:
-                missing_skills.append(skill)
+        # Tokenize once; each skill is then an exact, alias or partial lookup in the index
+        found_skills, missing_skills, match_types = self.skill_matcher.match(resume_text, required_skills)
                 
         match_score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
         
         return {
             'score': match_score,
             'found_skills': found_skills,
-            'missing_skills': missing_skills
+            'missing_skills': missing_skills,
+            'match_types': match_types
         }
         
     def check_resume_sections(self, text):
-        text = text.lower()
-        essential_sections = {
-            'contact': ['email', 'phone', 'address', 'linkedin'],
-            'education': ['education', 'university', 'college', 'degree', 'academic'],
-            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
-            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
-        }
+        found_keywords = self.section_matcher.matches(text)
         
         section_scores = {}
-        for section, keywords in essential_sections.items():
-            found = sum(1 for keyword in keywords if keyword in text)
+        for section, keywords in self.essential_sections.items():
+            found = sum(1 for keyword in keywords if keyword in found_keywords)
             section_scores[section] = min(25, (found / len(keywords)) * 25)
             
         return sum(section_scores.values())
@@ -117,42 +160,40 @@ class ResumeAnalyzer:
             
         return max(0, score), deductions
         
-    def extract_text_from_pdf(self, file):
+    def extract_pdf_pages(self, file, max_pages=None):
+        """Extract page texts from a PDF, parsing no more than max_pages pages"""
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
-            # First make sure we have the file content as bytes
-            if hasattr(file, 'read'):
-                # If it's already a file-like object, read it
-                file_content = file.read()
-                file.seek(0)  # Reset file pointer
+            file_content = read_file_content(file)
+            # Parse in the isolated worker pool when one is configured
+            if self.extraction_pool is not None:
+                return self.extraction_pool.extract_pages(file_content, max_pages)
+            return extract_pdf_pages(file_content, max_pages)
+        except Exception as e:
+            raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+    def iter_pdf_pages(self, file, max_pages=None):
+        """Yield page texts from a PDF as they are parsed, no more than max_pages
+
+        In-process backends parse each page when it is asked for. The worker
+        pool parses the capped document in one call, on the first page asked for.
+        """
+        try:
+            file_content = read_file_content(file)
+            if self.extraction_pool is not None:
+                pages = self.extraction_pool.extract_pages(file_content, max_pages)
             else:
-                # If it's already bytes
-                file_content = file
-                
-            # Create BytesIO from bytes content
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+                pages = iter_pdf_pages(file_content, max_pages=max_pages)
+            yield from pages
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+    def extract_text_from_pdf(self, file, max_pages=None):
+        return join_pages(self.extract_pdf_pages(file, max_pages))
             
     def extract_text_from_docx(self, docx_file):
         """Extract text from a DOCX file"""
         try:
-            from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            return extract_docx_text(docx_file)
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
@@ -182,423 +223,212 @@ class ResumeAnalyzer:
             'portfolio': ''  # Can be enhanced later
         }
 
+    def segment_sections(self, text):
+        """Label every line with its section in a single pass over the text"""
+        return self.segmenter.segment(text)
+
     def extract_education(self, text):
         """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+        return self.segment_sections(text).education
 
     def extract_experience(self, text):
         """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+        return self.segment_sections(text).experience
 
     def extract_projects(self, text):
         """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+        return self.segment_sections(text).projects
 
     def extract_skills(self, text):
         """Extract skills from resume text"""
-        skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
-
-        # Common skill separators
-        separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
-            for separator in separators:
-                if separator in text_to_process:
-                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-        
-        return list(skills)
+        return self.segment_sections(text).skills
 
     def extract_summary(self, text):
         """Extract summary/objective from resume text"""
-        summary = []
-        lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
-
-        # Try to find summary at the beginning of the resume
-        start_index = 0
-        while start_index < min(10, len(lines)) and not lines[start_index].strip():
-            start_index += 1
-
-        # Check first few non-empty lines for potential summary
-        first_lines = []
-        lines_checked = 0
-        for line in lines[start_index:]:
-            if line.strip():
-                first_lines.append(line.strip())
-                lines_checked += 1
-                if lines_checked >= 5:  # Check first 5 non-empty lines
-                    break
-
-        # If first few lines look like a summary (no special formatting, no contact info)
-        if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
-            potential_summary = ' '.join(first_lines)
-            if len(potential_summary.split()) > 10:  # More than 10 words
-                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
-                    summary.append(potential_summary)
-
-        # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
+        return self.segment_sections(text).summary
+
+    def parse_resume(self, text):
+        """Run every role-independent step once and return a reusable ParsedResume"""
+        parsed = ParsedResume(text)
+        parsed.personal_info = self.extract_personal_info(text)
+        parsed.document_type = self.detect_document_type(text)
+        if parsed.document_type != 'resume':
+            return parsed
+
+        parsed.token_index = self.skill_matcher.index(text)
+        parsed.sections = self.segment_sections(text)
+        parsed.section_score = self.check_resume_sections(text)
+        parsed.format_score, parsed.format_deductions = self.check_formatting(text)
+
+        personal_info = parsed.personal_info
+        summary = parsed.sections.summary
+        experience = parsed.sections.experience
+        education = parsed.sections.education
+
+        # Generate section-specific suggestions
+        if not personal_info.get('email'):
+            parsed.contact_suggestions.append("Add your email address")
+        if not personal_info.get('phone'):
+            parsed.contact_suggestions.append("Add your phone number")
+        if not personal_info.get('linkedin'):
+            parsed.contact_suggestions.append("Add your LinkedIn profile URL")
+
+        if not summary:
+            parsed.summary_suggestions.append("Add a professional summary to highlight your key qualifications")
+        elif len(summary.split()) < 30:
+            parsed.summary_suggestions.append("Expand your professional summary to better highlight your experience and goals")
+        elif len(summary.split()) > 100:
+            parsed.summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
+
+        if not experience:
+            parsed.experience_suggestions.append("Add your work experience section")
+        else:
+            has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
+            has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
+            has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
+                                           exp.lower()) for exp in experience)
             
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
+            if not has_dates:
+                parsed.experience_suggestions.append("Include dates for each work experience")
+            if not has_bullets:
+                parsed.experience_suggestions.append("Use bullet points to list your achievements and responsibilities")
+            if not has_action_verbs:
+                parsed.experience_suggestions.append("Start bullet points with strong action verbs")
+
+        if not education:
+            parsed.education_suggestions.append("Add your educational background")
+        else:
+            has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
+            has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', 
+                                     edu.lower()) for edu in education)
+            parsed.has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', 
+                                         edu.lower()) for edu in education)
+            
+            if not has_dates:
+                parsed.education_suggestions.append("Include graduation dates")
+            if not has_degree:
+                parsed.education_suggestions.append("Specify your degree type")
+
+        return parsed
+
+    def score_resume(self, parsed, job_requirements):
+        """Score a ParsedResume against one role; cheap enough to call for every role"""
+        if parsed.document_type != 'resume':
+            doc_type = parsed.document_type
+            return {
+                'ats_score': 0,
+                'document_type': doc_type,
+                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+                'section_score': 0,
+                'format_score': 0,
+                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
+            }
+
+        # Calculate keyword match
+        required_skills = job_requirements.get('required_skills', [])
+        keyword_match = self.calculate_keyword_match(parsed.token_index, required_skills)
+
+        skills = parsed.sections.skills
+        format_score = parsed.format_score
+        contact_suggestions = list(parsed.contact_suggestions)
+        summary_suggestions = list(parsed.summary_suggestions)
+        experience_suggestions = list(parsed.experience_suggestions)
+
+        skills_suggestions = []
+        if not skills:
+            skills_suggestions.append("Add a dedicated skills section")
+        if isinstance(skills, (list, set)) and len(list(skills)) < 5:
+            skills_suggestions.append("List more relevant technical and soft skills")
+        if keyword_match['score'] < 70:
+            skills_suggestions.append("Add more skills that match the job requirements")
+
+        education_suggestions = list(parsed.education_suggestions)
+        if parsed.sections.education and not parsed.has_gpa and job_requirements.get('require_gpa', False):
+            education_suggestions.append("Include your GPA if it's above 3.0")
+        
+        format_suggestions = []
+        if format_score < 100:
+            format_suggestions.extend(parsed.format_deductions)
+        
+        # Calculate section-specific scores
+        contact_score = 100 - (len(contact_suggestions) * 25)  # -25 for each missing item
+        summary_score = 100 - (len(summary_suggestions) * 33)  # -33 for each issue
+        skills_score = keyword_match['score']
+        experience_score = 100 - (len(experience_suggestions) * 25)
+        education_score = 100 - (len(education_suggestions) * 25)
+        
+        # Calculate overall ATS score with weighted components
+        ats_score = (
+            int(round(contact_score * 0.1)) +      # 10% weight for contact info
+            int(round(summary_score * 0.1)) +      # 10% weight for summary
+            int(round(skills_score * 0.3)) +       # 30% weight for skills match
+            int(round(experience_score * 0.2)) +   # 20% weight for experience
+            int(round(education_score * 0.1)) +    # 10% weight for education
+            int(round(format_score * 0.2))         # 20% weight for formatting
+        )
         
-        if current_entry:
-            summary.append(' '.join(current_entry))
+        # Combine all suggestions into a single list
+        suggestions = []
+        suggestions.extend(contact_suggestions)
+        suggestions.extend(summary_suggestions)
+        suggestions.extend(skills_suggestions)
+        suggestions.extend(experience_suggestions)
+        suggestions.extend(education_suggestions)
+        suggestions.extend(format_suggestions)
         
-        return ' '.join(summary) if summary else ''
+        if not suggestions:
+            suggestions.append("Your resume is well-optimized for ATS systems")
+        
+        # Return final structured result
+        return {
+            **parsed.personal_info,  # Include extracted personal info
+            'ats_score': ats_score,
+            'document_type': 'resume',
+            'keyword_match': keyword_match,
+            'section_score': parsed.section_score,
+            'format_score': format_score,
+            'education': parsed.sections.education,
+            'experience': parsed.sections.experience,
+            'projects': parsed.sections.projects,
+            'skills': skills,
+            'summary': parsed.sections.summary,
+            'suggestions': suggestions,
+            'contact_suggestions': contact_suggestions,
+            'summary_suggestions': summary_suggestions,
+            'skills_suggestions': skills_suggestions,
+            'experience_suggestions': experience_suggestions,
+            'education_suggestions': education_suggestions,
+            'format_suggestions': format_suggestions,
+            'section_scores': {
+                'contact': contact_score,
+                'summary': summary_score,
+                'skills': skills_score,
+                'experience': experience_score,
+                'education': education_score,
+                'format': format_score
+            }
+        }
+
+    def get_role_ranker(self, job_roles):
+        """Return the incidence-matrix ranker for a role table, building it on first use"""
+        cached = self._role_rankers.get(id(job_roles))
+        if cached is None or cached[0] is not job_roles:
+            cached = (job_roles, RoleRanker(job_roles, self.skill_matcher))
+            self._role_rankers[id(job_roles)] = cached
+        return cached[1]
+
+    def rank_roles(self, parsed, job_roles, top_k=5):
+        """Rank every role in a JOB_ROLES-style mapping by keyword match for one parsed resume"""
+        if parsed.document_type != 'resume':
+            return []
+        return self.get_role_ranker(job_roles).rank(parsed.token_index, top_k)
 
     def analyze_resume(self, resume_data, job_requirements):
         """Analyze resume and return scores and recommendations"""
         try:
-            text = resume_data.get('raw_text', '')
-            
-            # Extract personal information
-            personal_info = self.extract_personal_info(text)
-            
-            # First detect document type
-            doc_type = self.detect_document_type(text)
-            if doc_type != 'resume':
-                return {
-                    'ats_score': 0,
-                    'document_type': doc_type,
-                    'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                    'section_score': 0,
-                    'format_score': 0,
-                    'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
-                }
-                
-            # Calculate keyword match
-            required_skills = job_requirements.get('required_skills', [])
-            keyword_match = self.calculate_keyword_match(text, required_skills)
-            
-            # Extract all resume sections
-            education = self.extract_education(text)
-            experience = self.extract_experience(text)
-            projects = self.extract_projects(text)
-            skills = list(self.extract_skills(text))  # Convert skills set to list
-            summary = self.extract_summary(text)
-            
-            # Check resume sections
-            section_score = self.check_resume_sections(text)
-            
-            # Check formatting
-            format_score, format_deductions = self.check_formatting(text)
-            
-            # Generate section-specific suggestions
-            contact_suggestions = []
-            if not personal_info.get('email'):
-                contact_suggestions.append("Add your email address")
-            if not personal_info.get('phone'):
-                contact_suggestions.append("Add your phone number")
-            if not personal_info.get('linkedin'):
-                contact_suggestions.append("Add your LinkedIn profile URL")
-            
-            summary_suggestions = []
-            if not summary:
-                summary_suggestions.append("Add a professional summary to highlight your key qualifications")
-            elif len(summary.split()) < 30:
-                summary_suggestions.append("Expand your professional summary to better highlight your experience and goals")
-            elif len(summary.split()) > 100:
-                summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
-            
-            skills_suggestions = []
-            if not skills:
-                skills_suggestions.append("Add a dedicated skills section")
-            if isinstance(skills, (list, set)) and len(list(skills)) < 5:
-                skills_suggestions.append("List more relevant technical and soft skills")
-            if keyword_match['score'] < 70:
-                skills_suggestions.append("Add more skills that match the job requirements")
-            
-            experience_suggestions = []
-            if not experience:
-                experience_suggestions.append("Add your work experience section")
-            else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
-                has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
-                has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
-                                               exp.lower()) for exp in experience)
-                
-                if not has_dates:
-                    experience_suggestions.append("Include dates for each work experience")
-                if not has_bullets:
-                    experience_suggestions.append("Use bullet points to list your achievements and responsibilities")
-                if not has_action_verbs:
-                    experience_suggestions.append("Start bullet points with strong action verbs")
-            
-            education_suggestions = []
-            if not education:
-                education_suggestions.append("Add your educational background")
-            else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
-                has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', 
-                                         edu.lower()) for edu in education)
-                has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', 
-                                      edu.lower()) for edu in education)
-                
-                if not has_dates:
-                    education_suggestions.append("Include graduation dates")
-                if not has_degree:
-                    education_suggestions.append("Specify your degree type")
-                if not has_gpa and job_requirements.get('require_gpa', False):
-                    education_suggestions.append("Include your GPA if it's above 3.0")
-            
-            format_suggestions = []
-            if format_score < 100:
-                format_suggestions.extend(format_deductions)
-            
-            # Calculate section-specific scores
-            contact_score = 100 - (len(contact_suggestions) * 25)  # -25 for each missing item
-            summary_score = 100 - (len(summary_suggestions) * 33)  # -33 for each issue
-            skills_score = keyword_match['score']
-            experience_score = 100 - (len(experience_suggestions) * 25)
-            education_score = 100 - (len(education_suggestions) * 25)
-            
-            # Calculate overall ATS score with weighted components
-            ats_score = (
-                int(round(contact_score * 0.1)) +      # 10% weight for contact info
-                int(round(summary_score * 0.1)) +      # 10% weight for summary
-                int(round(skills_score * 0.3)) +       # 30% weight for skills match
-                int(round(experience_score * 0.2)) +   # 20% weight for experience
-                int(round(education_score * 0.1)) +    # 10% weight for education
-                int(round(format_score * 0.2))         # 20% weight for formatting
-            )
-            
-            # Combine all suggestions into a single list
-            suggestions = []
-            suggestions.extend(contact_suggestions)
-            suggestions.extend(summary_suggestions)
-            suggestions.extend(skills_suggestions)
-            suggestions.extend(experience_suggestions)
-            suggestions.extend(education_suggestions)
-            suggestions.extend(format_suggestions)
-            
-            if not suggestions:
-                suggestions.append("Your resume is well-optimized for ATS systems")
-            
-            # Return final structured result
-            return {
-                **personal_info,  # Include extracted personal info
-                'ats_score': ats_score,
-                'document_type': 'resume',
-                'keyword_match': keyword_match,
-                'section_score': section_score,
-                'format_score': format_score,
-                'education': education,
-                'experience': experience,
-                'projects': projects,
-                'skills': skills,
-                'summary': summary,
-                'suggestions': suggestions,
-                'contact_suggestions': contact_suggestions,
-                'summary_suggestions': summary_suggestions,
-                'skills_suggestions': skills_suggestions,
-                'experience_suggestions': experience_suggestions,
-                'education_suggestions': education_suggestions,
-                'format_suggestions': format_suggestions,
-                'section_scores': {
-                    'contact': contact_score,
-                    'summary': summary_score,
-                    'skills': skills_score,
-                    'experience': experience_score,
-                    'education': education_score,
-                    'format': format_score
-                }
-            }
+            # A ParsedResume can be passed in to skip the role-independent work
+            parsed = resume_data.get('parsed') or self.parse_resume(resume_data.get('raw_text', ''))
+            return self.score_resume(parsed, job_requirements)
         except Exception as e:
             import traceback
             print(f"Error analyzing resume: {str(e)}")
@@ -612,4 +442,4 @@ class ResumeAnalyzer:
                 'section_score': 0,
                 'format_score': 0,
                 'suggestions': [f"Error analyzing resume: {str(e)}. Please check your file and try again."]
-            }
\ No newline at end of file
+            }
@@ -1,7 +1,6 @@
-import pypdf
-import docx
 import re
-from io import BytesIO
+from .keyword_matcher import KeywordMatcher
+from .extractors import extract_pdf_text, extract_docx_text
 
 class ResumeParser:
     def __init__(self):
@@ -11,27 +10,21 @@ class ResumeParser:
             'node', 'express', 'django', 'flask', 'spring', 'docker', 'kubernetes', 'aws',
             'azure', 'git', 'jenkins', 'jira'
         ]
+        self.skill_matcher = KeywordMatcher(self.skill_keywords)
 
     def extract_text_from_pdf(self, pdf_file):
         try:
             file_content = pdf_file.read() if hasattr(pdf_file, 'read') else pdf_file
             pdf_file.seek(0) if hasattr(pdf_file, 'seek') else None
 
-            reader = pypdf.PdfReader(BytesIO(file_content))
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text()
-                text += page_text + "\n" if page_text else "\n"
-            return text.strip()
+            return extract_pdf_text(file_content).strip()
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
 
     def extract_text_from_docx(self, docx_file):
         try:
-            doc = docx.Document(BytesIO(docx_file.read()))
-            text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
-            return text.strip()
+            return extract_docx_text(docx_file.read()).strip()
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
@@ -52,10 +45,10 @@ class ResumeParser:
 
     def parse(self, file):
         text = self.extract_text(file)
-        text_lower = text.lower()
+        found = self.skill_matcher.matches(text)
 
         # Extract skills
-        skills = [skill for skill in self.skill_keywords if skill in text_lower]
+        skills = [skill for skill in self.skill_keywords if skill in found]
 
         # Placeholder lists (can be filled later with NLP)
         experience = []
@@ -0,0 +1,96 @@
+import numpy as np
+
+
+class RoleRanker:
+    """Score one resume against every role with a single sparse matrix-vector product"""
+
+    def __init__(self, job_roles, skill_matcher):
+        self.skill_matcher = skill_matcher
+        self.roles = []
+        self.skills = []
+        self.role_skills = []
+        columns = {}
+        rows, cols = [], []
+
+        # Role x skill incidence matrix stored as (row, col) coordinates
+        for category, roles in job_roles.items():
+            for role, role_info in roles.items():
+                row = len(self.roles)
+                required_skills = list(role_info.get('required_skills', []))
+                self.roles.append((category, role))
+                self.role_skills.append(required_skills)
+                for skill in required_skills:
+                    key = skill.lower()
+                    if key not in columns:
+                        columns[key] = len(self.skills)
+                        self.skills.append(skill)
+                    rows.append(row)
+                    cols.append(columns[key])
+
+        self._columns = columns
+        self._rows = np.asarray(rows, dtype=np.intp)
+        self._cols = np.asarray(cols, dtype=np.intp)
+        self._role_sizes = np.bincount(self._rows, minlength=len(self.roles)).astype(float)
+
+        # Skill phrases grouped by their first token, so that a resume is matched
+        # through the tokens it shares with the vocabulary instead of by testing
+        # every skill of the vocabulary against it
+        self._phrases_by_first = {}  # first token -> [(phrase tokens, columns)]
+        self._partial_skills = {}  # first significant token -> [(column, significant tokens)]
+        phrase_columns = {}
+        for column, skill in enumerate(self.skills):
+            exact, aliases, significant = skill_matcher.phrases(skill)
+            for phrase in ((exact,) if exact else ()) + aliases:
+                phrase_columns.setdefault(phrase, []).append(column)
+            if len(significant) > 1:
+                self._partial_skills.setdefault(significant[0], []).append((column, significant))
+        for phrase, phrase_cols in phrase_columns.items():
+            self._phrases_by_first.setdefault(phrase[0], []).append((phrase, phrase_cols))
+
+    def skill_vector(self, token_index):
+        """1.0 for every skill in the vocabulary that the resume contains, else 0.0
+
+        Same verdicts as SkillMatcher.match_type, but only the phrases starting
+        with a token of the resume are checked.
+        """
+        vector = np.zeros(len(self.skills))
+        positions = token_index.positions
+        for first in self._phrases_by_first.keys() & positions.keys():
+            for phrase, columns in self._phrases_by_first[first]:
+                if token_index.has_phrase(phrase):
+                    vector[columns] = 1.0
+        for first in self._partial_skills.keys() & positions.keys():
+            for column, significant in self._partial_skills[first]:
+                if not vector[column] and token_index.has_nearby(significant, self.skill_matcher.window):
+                    vector[column] = 1.0
+        return vector
+
+    def scores(self, token_index):
+        """Keyword match percentage for every role, in the order of self.roles"""
+        vector = self.skill_vector(token_index)
+        found = np.bincount(self._rows, weights=vector[self._cols], minlength=len(self.roles))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(self._role_sizes > 0, found / self._role_sizes * 100, 0.0)
+        return scores, vector
+
+    def rank(self, token_index, top_k=5):
+        """Return the top_k roles with their found and missing skills"""
+        scores, vector = self.scores(token_index)
+        order = np.argsort(-scores, kind='stable')[:top_k]
+        ranking = []
+        for row in order:
+            category, role = self.roles[row]
+            found_skills, missing_skills = [], []
+            for skill in self.role_skills[row]:
+                if vector[self._columns[skill.lower()]]:
+                    found_skills.append(skill)
+                else:
+                    missing_skills.append(skill)
+            ranking.append({
+                'category': category,
+                'role': role,
+                'score': float(scores[row]),
+                'found_skills': found_skills,
+                'missing_skills': missing_skills
+            })
+        return ranking
@@ -0,0 +1,194 @@
+import re
+from .keyword_matcher import KeywordMatcher
+
+# Keywords that open each resume section
+EDUCATION_KEYWORDS = [
+    'education', 'academic', 'qualification', 'degree', 'university', 'college',
+    'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+    'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
+    'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+]
+
+EXPERIENCE_KEYWORDS = [
+    'experience', 'employment', 'work history', 'professional experience',
+    'work experience', 'career history', 'professional background',
+    'employment history', 'job history', 'positions held', 'experience',
+    'job title', 'job responsibilities', 'job description', 'job summary'
+]
+
+PROJECT_KEYWORDS = [
+    'projects', 'personal projects', 'academic projects', 'key projects',
+    'major projects', 'professional projects', 'project experience',
+    'relevant projects', 'featured projects','latest projects',
+    'top projects'
+]
+
+SKILLS_KEYWORDS = [
+    'skills', 'technical skills', 'competencies', 'expertise',
+    'core competencies', 'professional skills', 'key skills',
+    'technical expertise', 'proficiencies', 'qualifications',
+    'top skills', 'key skill', 'major skill', 'personal skill',
+    'soft skills', 'soft skill', 'soft skillset'
+]
+
+SUMMARY_KEYWORDS = [
+    'summary', 'professional summary', 'career summary', 'objective',
+    'career objective', 'professional objective', 'about me', 'profile',
+    'professional profile', 'career profile', 'overview', 'skill summary'
+]
+
+SECTION_KEYWORDS = {
+    'education': EDUCATION_KEYWORDS,
+    'experience': EXPERIENCE_KEYWORDS,
+    'projects': PROJECT_KEYWORDS,
+    'skills': SKILLS_KEYWORDS,
+    'summary': SUMMARY_KEYWORDS
+}
+
+# Common skill separators
+SKILL_SEPARATORS = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
+
+
+class SegmentedResume:
+    """Section labels and extracted entries produced by a single pass over the text"""
+
+    def __init__(self, lines, labels, entries):
+        self.lines = lines
+        self.labels = labels
+        self._entries = entries
+
+    @property
+    def education(self):
+        return self._entries['education']
+
+    @property
+    def experience(self):
+        return self._entries['experience']
+
+    @property
+    def projects(self):
+        return self._entries['projects']
+
+    @property
+    def skills(self):
+        skills = set()  # Use set to avoid duplicates
+        for text_to_process in self._entries['skills']:
+            # Split by common separators
+            for separator in SKILL_SEPARATORS:
+                if separator in text_to_process:
+                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
+        return list(skills)
+
+    @property
+    def summary(self):
+        return ' '.join(self._entries['summary']) if self._entries['summary'] else ''
+
+    def lines_in(self, section):
+        """Return the stripped lines labelled with the given section"""
+        return [line for line, line_labels in zip(self.lines, self.labels) if section in line_labels]
+
+
+class SectionSegmenter:
+    """Walk resume text once and label every line with the sections it belongs to"""
+
+    def __init__(self, boundary_keywords, section_keywords=None):
+        # Keywords that mark the start of some other section (ends the current one)
+        self.boundary_keywords = list(boundary_keywords)
+        self.section_keywords = section_keywords or SECTION_KEYWORDS
+        self._headers = {
+            section: set(keywords) for section, keywords in self.section_keywords.items()
+        }
+        self._boundary = frozenset(keyword.lower() for keyword in self.boundary_keywords)
+        # One automaton covers every section and boundary keyword
+        self._matcher = KeywordMatcher(
+            [keyword for keywords in self.section_keywords.values() for keyword in keywords]
+            + self.boundary_keywords
+        )
+
+    def _contains_any(self, line_lower, keywords):
+        return any(keyword in line_lower for keyword in keywords)
+
+    def _leading_summary(self, lines):
+        """Treat the first few lines as a summary when they read like prose"""
+        start_index = 0
+        while start_index < min(10, len(lines)) and not lines[start_index].strip():
+            start_index += 1
+
+        # Check first 5 non-empty lines
+        first_lines = []
+        for line in lines[start_index:]:
+            if line.strip():
+                first_lines.append(line.strip())
+                if len(first_lines) >= 5:
+                    break
+
+        # If first few lines look like a summary (no special formatting, no contact info)
+        if first_lines and not self._contains_any(first_lines[0].lower(), self.section_keywords['summary']):
+            potential_summary = ' '.join(first_lines)
+            if len(potential_summary.split()) > 10:  # More than 10 words
+                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
+                    return potential_summary
+        return None
+
+    def segment(self, text):
+        """Split text into lines and extract every section in one pass"""
+        raw_lines = text.split('\n')
+        sections = list(self.section_keywords)
+        active = dict.fromkeys(sections, False)
+        current = {section: [] for section in sections}
+        entries = {section: [] for section in sections}
+
+        if 'summary' in entries:
+            leading_summary = self._leading_summary(raw_lines)
+            if leading_summary:
+                entries['summary'].append(leading_summary)
+
+        lines = []
+        labels = []
+        for line in raw_lines:
+            line = line.strip()
+            line_lower = line.lower()
+            # Per-line features are computed once and shared by every section
+            found = self._matcher.matches(line_lower)
+            hits = {
+                section: not found.isdisjoint(keywords)
+                for section, keywords in self._headers.items()
+            }
+            line_labels = set()
+
+            for section in sections:
+                # Check for section header
+                if hits[section]:
+                    if line_lower not in self._headers[section]:
+                        # This line contains section info, not just a header
+                        current[section].append(line)
+                    active[section] = True
+                    line_labels.add(section)
+                    continue
+
+                if not active[section]:
+                    continue
+
+                # Check if we've hit another section
+                if line and not found.isdisjoint(self._boundary):
+                    active[section] = False
+                    if current[section]:
+                        entries[section].append(' '.join(current[section]))
+                        current[section] = []
+                    continue
+
+                line_labels.add(section)
+                if line:
+                    current[section].append(line)
+                elif current[section]:  # Empty line and we have content
+                    entries[section].append(' '.join(current[section]))
+                    current[section] = []
+
+            lines.append(line)
+            labels.append(line_labels)
+
+        for section in sections:
+            if current[section]:
+                entries[section].append(' '.join(current[section]))
+
+        return SegmentedResume(lines, labels, entries)
@@ -0,0 +1,146 @@
+import re
+from bisect import bisect_left
+from functools import lru_cache
+
+# Alternative spellings that should count as the same skill
+SKILL_ALIASES = {
+    'javascript': ['js', 'ecmascript', 'es6'],
+    'typescript': ['ts'],
+    'node.js': ['node', 'nodejs'],
+    'react': ['react.js', 'reactjs'],
+    'vue.js': ['vue', 'vuejs'],
+    'angular': ['angularjs', 'angular.js'],
+    'express': ['express.js', 'expressjs'],
+    'next.js': ['nextjs'],
+    'golang': ['go lang'],
+    'c++': ['cpp'],
+    'c#': ['csharp', 'c sharp'],
+    'postgresql': ['postgres'],
+    'mongodb': ['mongo'],
+    'kubernetes': ['k8s'],
+    'aws': ['amazon web services'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'azure': ['microsoft azure'],
+    'machine learning': ['ml'],
+    'artificial intelligence': ['ai'],
+    'natural language processing': ['nlp'],
+    'ci/cd': ['continuous integration', 'continuous delivery', 'continuous deployment'],
+    'ui/ux': ['ui ux', 'user interface', 'user experience'],
+    'apis': ['api', 'rest api', 'restful api'],
+    'sql': ['structured query language']
+}
+
+# Words ignored when checking whether a multi-word skill appears in pieces
+STOPWORDS = {'and', 'or', 'of', 'the', 'a', 'an', 'in', 'for', 'with', '&'}
+
+# Keeps dotted and symbol-suffixed names such as node.js, c++ and c# intact
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+(?:\.[a-z0-9+#]+)*')
+
+
+def normalize_token(token):
+    """Fold simple plurals so that 'API' matches 'APIs'"""
+    if len(token) > 3 and token.isalpha() and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Split lowercase text into normalized tokens"""
+    return [normalize_token(token) for token in TOKEN_PATTERN.findall(text.lower())]
+
+
+class TokenIndex:
+    """Positions of every token in a resume, built once and queried per skill"""
+
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.positions = {}
+        for position, token in enumerate(self.tokens):
+            self.positions.setdefault(token, []).append(position)
+            # Also index the bare name of dotted libraries (react.js -> react)
+            if token.endswith('.js'):
+                self.positions.setdefault(token[:-3], []).append(position)
+
+    def has_phrase(self, phrase_tokens):
+        """Check whether the tokens occur consecutively"""
+        first, rest = phrase_tokens[0], phrase_tokens[1:]
+        for start in self.positions.get(first, ()):
+            if all(
+                start + offset < len(self.tokens) and self.tokens[start + offset] == token
+                for offset, token in enumerate(rest, 1)
+            ):
+                return True
+        return False
+
+    def has_nearby(self, phrase_tokens, window):
+        """Check whether every token occurs within `window` tokens of the rarest one"""
+        if any(token not in self.positions for token in phrase_tokens):
+            return False
+        anchor = min(phrase_tokens, key=lambda token: len(self.positions[token]))
+        others = [token for token in phrase_tokens if token != anchor]
+        for position in self.positions[anchor]:
+            if all(self._near(self.positions[token], position, window) for token in others):
+                return True
+        return False
+
+    @staticmethod
+    def _near(positions, position, window):
+        index = bisect_left(positions, position - window)
+        return index < len(positions) and positions[index] <= position + window
+
+
+class SkillMatcher:
+    """Word-boundary, alias and partial matching of skills against a token index"""
+
+    def __init__(self, aliases=None, window=8):
+        self.window = window
+        self._variants = {}
+        for canonical, alternatives in (aliases or SKILL_ALIASES).items():
+            group = [canonical] + list(alternatives)
+            for name in group:
+                self._variants.setdefault(name.lower(), set()).update(group)
+        self._phrases = lru_cache(maxsize=4096)(self._build_phrases)
+
+    def index(self, text):
+        """Tokenize the resume once so any number of skills can be checked cheaply"""
+        return TokenIndex(text)
+
+    def _build_phrases(self, skill):
+        """Return token tuples for the skill itself and for each of its aliases"""
+        skill = skill.lower()
+        exact = tuple(tokenize(skill))
+        aliases = []
+        for name in sorted(self._variants.get(skill, ())):
+            tokens = tuple(tokenize(name))
+            if tokens and tokens != exact and tokens not in aliases:
+                aliases.append(tokens)
+        significant = tuple(token for token in exact if token not in STOPWORDS)
+        return exact, tuple(aliases), significant
+
+    def phrases(self, skill):
+        """(exact tokens, alias token tuples, significant tokens) for a skill"""
+        return self._phrases(skill)
+
+    def match_type(self, index, skill):
+        """Return 'exact', 'alias', 'partial' or None for a skill against an index"""
+        exact, aliases, significant = self._phrases(skill)
+        if exact and index.has_phrase(exact):
+            return 'exact'
+        if any(index.has_phrase(alias) for alias in aliases):
+            return 'alias'
+        if len(significant) > 1 and index.has_nearby(significant, self.window):
+            return 'partial'
+        return None
+
+    def match(self, text_or_index, skills):
+        """Split skills into found and missing, recording how each one matched"""
+        index = text_or_index if isinstance(text_or_index, TokenIndex) else self.index(text_or_index)
+        found, missing, match_types = [], [], {}
+        for skill in skills:
+            kind = self.match_type(index, skill)
+            if kind:
+                found.append(skill)
+                match_types[skill] = kind
+            else:
+                missing.append(skill)
+        return found, missing, match_types
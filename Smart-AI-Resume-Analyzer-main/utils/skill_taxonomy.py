@@ -0,0 +1,123 @@
+import re
+
+from config.job_roles import JOB_ROLES
+from config.resources import get_resource
+from .skill_matcher import SKILL_ALIASES, tokenize
+
+# Category of every canonical skill; the canonical name is the first spelling listed
+SKILL_CATEGORIES = {
+    'Programming': [
+        'Python', 'Java', 'JavaScript', 'TypeScript', 'C', 'C++', 'C#', 'Golang', 'Kotlin',
+        'Swift', 'R', 'Ruby', 'PHP', 'Rust', 'Scala', 'Dart'
+    ],
+    'Web Development': [
+        'HTML', 'CSS', 'React', 'Angular', 'Vue.js', 'Node.js', 'Express', 'Next.js', 'Django',
+        'Flask', 'APIs', 'Frontend Tech', 'Backend Tech', 'Responsive Design'
+    ],
+    'Mobile': ['Flutter', 'React Native', 'App Store Deployment', 'Android', 'iOS'],
+    'Database': ['SQL', 'Databases', 'Database Design', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis'],
+    'Cloud': ['AWS', 'Azure', 'GCP'],
+    'DevOps': [
+        'DevOps', 'Docker', 'Kubernetes', 'CI/CD', 'Infrastructure as Code', 'Monitoring',
+        'Linux', 'Automation', 'Git'
+    ],
+    'Data Science': [
+        'Machine Learning', 'Deep Learning', 'Artificial Intelligence', 'Natural Language Processing',
+        'Statistics', 'Data Visualization', 'PyTorch', 'TensorFlow', 'Excel', 'MLOps'
+    ],
+    'Security': [
+        'Security', 'Network Security', 'Web Security', 'Ethical Hacking', 'Incident Response',
+        'Threat Detection', 'Security Tools'
+    ],
+    'Design': [
+        'UI/UX', 'Mobile UI/UX', 'Figma', 'Adobe XD', 'Wireframing', 'Prototyping', 'Typography',
+        'Color Theory', 'Visual Design', 'User Research', 'Usability Testing'
+    ],
+    'Game Development': ['Unity', 'Unreal Engine', '3D Graphics', 'Game Physics'],
+    'Software Engineering': ['System Design', 'Performance Tuning'],
+    'Management': [
+        'Agile', 'Scrum', 'Project Planning', 'Roadmapping', 'Stakeholder Management',
+        'User Stories', 'Product Strategy', 'Market Research', 'Risk Management'
+    ]
+}
+
+DEFAULT_CATEGORY = 'Other'
+
+# Characters left over from str(list) blobs and bullet lists
+STRIP_CHARS = '[]()"\'`•·*-–—:;., '
+
+
+class SkillTaxonomy:
+    """Maps any spelling of a skill to a canonical skill ID, display name and category
+
+    The canonical ID is the lowercase canonical name (e.g. 'node.js', 'c++').
+    Skills from JOB_ROLES that are not categorized above are still canonical,
+    in the 'Other' category.
+    """
+
+    def __init__(self, categories=SKILL_CATEGORIES, aliases=SKILL_ALIASES, job_roles=JOB_ROLES):
+        self.skills = {}
+        self._lookup = {}
+        for category, names in categories.items():
+            for name in names:
+                self._add(name, category)
+        for roles in job_roles.values():
+            for role_info in roles.values():
+                for name in role_info.get('required_skills', []):
+                    if self.normalize(name) not in self._lookup:
+                        self._add(name, DEFAULT_CATEGORY)
+        for canonical, spellings in aliases.items():
+            skill_id = self._lookup.get(self.normalize(canonical))
+            if skill_id is None:
+                skill_id = self._add(canonical, DEFAULT_CATEGORY)
+            for spelling in spellings:
+                self._lookup.setdefault(self.normalize(spelling), skill_id)
+
+    def _add(self, name, category):
+        skill_id = self.normalize(name)
+        self.skills[skill_id] = {'id': skill_id, 'name': name, 'category': category}
+        self._lookup[skill_id] = skill_id
+        return skill_id
+
+    @staticmethod
+    def normalize(name):
+        """Lowercase, trim list punctuation and collapse whitespace"""
+        return re.sub(r'\s+', ' ', str(name).strip(STRIP_CHARS).lower())
+
+    def resolve(self, raw_skill):
+        """Return {'id', 'name', 'category'} for a skill as written on a resume, or None if blank
+
+        Unknown skills keep their own normalized ID. They take the category of the
+        first known skill they mention ('aws lambda' -> Cloud), else 'Other'.
+        """
+        key = self.normalize(raw_skill)
+        if not key:
+            return None
+        skill_id = self._lookup.get(key)
+        if skill_id is not None:
+            return self.skills[skill_id]
+        category = DEFAULT_CATEGORY
+        for token in tokenize(key):
+            known = self._lookup.get(token)
+            if known is not None:
+                category = self.skills[known]['category']
+                break
+        return {'id': key, 'name': str(raw_skill).strip(STRIP_CHARS), 'category': category}
+
+    def spellings(self):
+        """Every known normalized spelling, aliases included, with its canonical skill ID"""
+        return self._lookup.items()
+
+    def resolve_all(self, raw_skills):
+        """Resolve a list of skills, dropping blanks and duplicates of the same canonical skill"""
+        resolved = {}
+        for raw_skill in raw_skills:
+            skill = self.resolve(raw_skill)
+            if skill is not None and skill['id'] not in resolved:
+                resolved[skill['id']] = skill
+        return list(resolved.values())
+
+
+def get_skill_taxonomy():
+    """Return the process-wide taxonomy"""
+    return get_resource('skill_taxonomy', SkillTaxonomy)